@@ -7,72 +7,20 @@ This is the "secret weapon" - analyze top 10 results for target keywords and cre
 content that's MORE comprehensive, better structured, and more valuable.
 """
 
-import anthropic
 from typing import List, Dict, Optional
 import json
 
+try:
+    # orjson parses at C speed without the stdlib's str round-trip
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-class CompetitiveAnalyzer:
-    """
-    Analyze top-ranking competitors to identify content gaps and opportunities.
-
-    Uses Claude AI with extended thinking to deeply analyze:
-    - What topics competitors cover that you don't
-    - What makes their content rank well
-    - Content gaps you can fill
-    - Unique angles you can take
-    - Features/formats that work (tables, comparisons, FAQs, etc.)
-    """
-
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
-        self.client = anthropic.Anthropic(api_key=api_key)
-        self.model = model
-
-    def analyze_competitive_gap(
-        self,
-        target_keyword: str,
-        your_current_content: str,
-        your_current_position: int,
-        impressions: int,
-        clicks: int,
-        engagement_data: Optional[Dict] = None
-    ) -> Dict:
-        """
-        Deep AI analysis of competitive landscape for a specific keyword.
-
-        Uses Claude with extended thinking to:
-        1. Analyze what's missing from your content vs top 10
-        2. Identify winning content patterns
-        3. Find unique angles and opportunities
-        4. Suggest specific improvements
-
-        Args:
-            target_keyword: The main keyword you're targeting
-            your_current_content: Your existing content (HTML stripped)
-            your_current_position: Current ranking position
-            impressions: Monthly impressions from GSC
-            clicks: Monthly clicks from GSC
-            engagement_data: Optional dict with bounce_rate, avg_time, etc.
-
-        Returns:
-            Dictionary with gap_analysis, opportunities, action_plan
-        """
-
-        # Prepare engagement context
-        engagement_context = ""
-        if engagement_data:
-            engagement_context = f"""
-**YOUR ENGAGEMENT METRICS:**
-- Bounce Rate: {engagement_data.get('bounce_rate', 'N/A')}%
-- Avg Time on Page: {engagement_data.get('avg_time', 'N/A')}s
-- Pages per Session: {engagement_data.get('pages_per_session', 'N/A')}
-- Engagement Rate: {engagement_data.get('engagement_rate', 'N/A')}%
-"""
+from content_engine.clients import get_anthropic_client
 
-        # Extract content summary (first 3000 chars to save tokens)
-        content_preview = your_current_content[:3000] if your_current_content else "No content yet"
 
-        prompt = f"""You are an elite SEO strategist and content analyst. Your job is to perform DEEP competitive analysis.
+# Static gap-analysis prompt, filled in per call with str.format().
+_GAP_ANALYSIS_PROMPT = """You are an elite SEO strategist and content analyst. Your job is to perform DEEP competitive analysis.
 
 **TARGET KEYWORD:** "{target_keyword}"
 
@@ -80,7 +28,7 @@ class CompetitiveAnalyzer:
 - Your Position: #{your_current_position}
 - Monthly Impressions: {impressions:,}
 - Monthly Clicks: {clicks:,}
-- CTR: {(clicks/impressions*100) if impressions > 0 else 0:.2f}%
+- CTR: {ctr:.2f}%
 {engagement_context}
 
 **YOUR CURRENT CONTENT (preview):**
@@ -193,6 +141,85 @@ Return your analysis as JSON:
 - Prioritize actions by impact vs effort
 - Consider both content AND technical SEO"""
 
+
+class CompetitiveAnalyzer:
+    """
+    Analyze top-ranking competitors to identify content gaps and opportunities.
+
+    Uses Claude AI with extended thinking to deeply analyze:
+    - What topics competitors cover that you don't
+    - What makes their content rank well
+    - Content gaps you can fill
+    - Unique angles you can take
+    - Features/formats that work (tables, comparisons, FAQs, etc.)
+    """
+
+    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
+        # Imported lazily: the SDK pulls in httpx/pydantic and is only needed
+        # once an analyzer is actually constructed.
+        import anthropic
+        self._anthropic = anthropic
+
+        # Shared per API key, so re-instantiating the analyzer (e.g. once per
+        # keyword in a worker loop) reuses the same HTTP connection pool.
+        self.client = get_anthropic_client(api_key)
+        self.model = model
+
+    def analyze_competitive_gap(
+        self,
+        target_keyword: str,
+        your_current_content: str,
+        your_current_position: int,
+        impressions: int,
+        clicks: int,
+        engagement_data: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Deep AI analysis of competitive landscape for a specific keyword.
+
+        Uses Claude with extended thinking to:
+        1. Analyze what's missing from your content vs top 10
+        2. Identify winning content patterns
+        3. Find unique angles and opportunities
+        4. Suggest specific improvements
+
+        Args:
+            target_keyword: The main keyword you're targeting
+            your_current_content: Your existing content (HTML stripped)
+            your_current_position: Current ranking position
+            impressions: Monthly impressions from GSC
+            clicks: Monthly clicks from GSC
+            engagement_data: Optional dict with bounce_rate, avg_time, etc.
+
+        Returns:
+            Dictionary with gap_analysis, opportunities, action_plan
+        """
+
+        # Prepare engagement context
+        engagement_context = ""
+        if engagement_data:
+            engagement_context = f"""
+**YOUR ENGAGEMENT METRICS:**
+- Bounce Rate: {engagement_data.get('bounce_rate', 'N/A')}%
+- Avg Time on Page: {engagement_data.get('avg_time', 'N/A')}s
+- Pages per Session: {engagement_data.get('pages_per_session', 'N/A')}
+- Engagement Rate: {engagement_data.get('engagement_rate', 'N/A')}%
+"""
+
+        # Extract content summary (first 3000 chars to save tokens)
+        content_preview = your_current_content[:3000] if your_current_content else "No content yet"
+
+        ctr = (clicks / impressions * 100) if impressions > 0 else 0
+        prompt = _GAP_ANALYSIS_PROMPT.format(
+            target_keyword=target_keyword,
+            your_current_position=your_current_position,
+            impressions=impressions,
+            clicks=clicks,
+            ctr=ctr,
+            engagement_context=engagement_context,
+            content_preview=content_preview,
+        )
+
         try:
             # Call Claude with extended thinking for deep analysis
             message = self.client.messages.create(
@@ -205,23 +232,27 @@ Return your analysis as JSON:
                 }
             )
 
-            # Extract response
-            response_text = ""
-            for block in message.content:
-                if block.type == "text":
-                    response_text += block.text
-
-            # Parse JSON
-            response_text = response_text.replace("```json", "").replace("```", "").strip()
+            # Extract response (usually a single text block after thinking)
+            texts = [block.text for block in message.content if block.type == "text"]
+            response_text = texts[0] if len(texts) == 1 else "".join(texts)
+
+            # Parse JSON (strip only the surrounding code fence, if any)
+            response_text = (
+                response_text.strip()
+                .removeprefix("```json")
+                .removeprefix("```")
+                .removesuffix("```")
+                .strip()
+            )
 
             try:
-                analysis = json.loads(response_text)
+                analysis = json_loads(response_text)
             except json.JSONDecodeError:
                 # Try to extract JSON
                 import re
                 json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
                 if json_match:
-                    analysis = json.loads(json_match.group())
+                    analysis = json_loads(json_match.group())
                 else:
                     raise ValueError("Could not parse competitive analysis JSON")
 
@@ -231,7 +262,7 @@ Return your analysis as JSON:
 
             return analysis
 
-        except anthropic.APIError as e:
+        except self._anthropic.APIError as e:
             raise Exception(f"Anthropic API error: {str(e)}")
 
     def generate_improvement_brief(self, gap_analysis: Dict) -> str:
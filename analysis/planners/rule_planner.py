@@ -33,6 +33,7 @@ class ActionItem:
     reasoning: str = ""
     redirect_target: str = ""  # For 301 redirects
     estimated_impact: str = ""  # High, Medium, Low
+    id: Optional[str] = None  # Set once the action is tracked in StateManager
     
     def __post_init__(self):
         if self.keywords is None:
@@ -14,6 +14,19 @@ from werkzeug.utils import secure_filename
 from datetime import datetime
 import requests
 import json
+import logging
+
+from config import load_env
+
+# Route handlers and validate_environment() read keys straight from os.environ,
+# so pull in .env before anything else runs
+load_env()
+
+# Plan execution reports progress through its module logger; send just that
+# logger's INFO output to stdout rather than enabling INFO for every library
+_execution_logger = logging.getLogger("core.execution_scheduler")
+_execution_logger.setLevel(logging.INFO)
+_execution_logger.addHandler(logging.StreamHandler(sys.stdout))
 
 # Lazy imports to avoid loading heavy modules at function startup
 try:
@@ -2842,14 +2855,11 @@ def automation_settings():
 
 @app.route("/api/automation/logs", methods=["GET"])
 def get_automation_logs():
-    log_file = os.path.join(os.getcwd(), "automation_runs.json")
-    if os.path.exists(log_file):
-        try:
-            with open(log_file, 'r') as f:
-                return jsonify(json.load(f))
-        except:
-            return jsonify([])
-    return jsonify([])
+    try:
+        from core.scheduler import read_recent_runs
+        return jsonify(read_recent_runs())
+    except Exception:
+        return jsonify([])
 
 @app.route("/api/automation/trigger", methods=["POST"])
 def automation_trigger():
@@ -3608,7 +3618,7 @@ def seo_fix_batch():
                 }), 400
             
             # Extract URLs with this issue from audit
-            fixable, _ = IssueGrouper.get_fixable_vs_manual(audit_data)
+            fixable, _ = IssueGrouper.get_fixable_vs_manual(audit_data, only={issue_type})
             urls = fixable.get(issue_type, [])
         
         if not urls:
@@ -8,13 +8,27 @@ Credentials are stored securely in .env file (not in code).
 import os
 import json
 
-# Try to load .env file (optional - will work without it)
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # python-dotenv not installed - will use environment variables directly
-    pass
+_env_loaded = False
+
+
+def load_env():
+    """
+    Load the .env file into the environment on first use.
+
+    Deferred until a caller actually needs configuration so that importing
+    this module stays cheap. Safe to call repeatedly.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    # Try to load .env file (optional - will work without it)
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        # python-dotenv not installed - will use environment variables directly
+        pass
 
 
 def _normalize_domain(domain: str) -> str:
@@ -39,6 +53,7 @@ def get_sites_config():
     Returns:
         dict: Site configurations keyed by domain
     """
+    load_env()
     sites = {}
     
     # Method 1: Load from .env file
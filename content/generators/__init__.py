@@ -3,7 +3,13 @@ Content generation modules.
 """
 
 from .claude_generator import ClaudeContentGenerator
-from .gemini_images import GeminiImageGenerator
 
 __all__ = ['ClaudeContentGenerator', 'GeminiImageGenerator']
 
+
+def __getattr__(name):
+    # gemini_images pulls in the google-genai SDK; only load it when actually asked for
+    if name == 'GeminiImageGenerator':
+        from .gemini_images import GeminiImageGenerator
+        return GeminiImageGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
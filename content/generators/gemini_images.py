@@ -8,8 +8,15 @@ import os
 import re
 import io
 import base64
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 try:
     from google import genai
     # Try to import PersonGeneration enum if available
@@ -23,19 +30,74 @@ except ImportError:
         "google-genai package is required. Install it with: pip install google-genai"
     )
 
+from content_engine.clients import get_genai_client
+from content_engine.llm_cache import LLMCache
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_RE = re.compile(r'\[Image:\s*([^\]]+)\]')
+_FILENAME_UNSAFE_RE = re.compile(r'[^a-z0-9\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class GeminiImageGenerator:
     """Generate images using Google Gemini Imagen 4.0 API and upload to WordPress."""
     
-    def __init__(self, api_key: str = None):
-        """Initialize with Google Gemini API key."""
+    # Placeholders generated/uploaded concurrently per article
+    MAX_IMAGE_WORKERS = 4
+    # Imagen's cap on number_of_images per request
+    MAX_IMAGES_PER_REQUEST = 4
+    # Default on-disk image cache location and size cap
+    DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "wpmagicseo", "images")
+    DEFAULT_CACHE_MAX_BYTES = 500 * 1024 * 1024
+    
+    def __init__(
+        self,
+        api_key: str = None,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    ):
+        """
+        Initialize with Google Gemini API key.
+        
+        Args:
+            api_key: Gemini API key (defaults to GOOGLE_GEMINI_API_KEY)
+            cache_dir: Where generated images are cached (defaults to
+                GEMINI_IMAGE_CACHE_DIR, then ~/.cache/wpmagicseo/images)
+            cache_max_bytes: Least recently used images are evicted past this size
+        """
         self.api_key = api_key or os.getenv("GOOGLE_GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GOOGLE_GEMINI_API_KEY required. Set it in environment variables.")
         
         # Initialize the Google GenAI client
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = get_genai_client(self.api_key)
         self.model = "models/imagen-4.0-generate-001"
+        
+        # Keep-alive pool for images the API returns by URL; sized for the
+        # placeholders fetched concurrently
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_IMAGE_WORKERS,
+            pool_maxsize=self.MAX_IMAGE_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        
+        # Identical requests (reruns, retried articles) reuse the image on disk
+        # instead of paying for another generation
+        self.cache_dir = cache_dir or os.getenv("GEMINI_IMAGE_CACHE_DIR") or self.DEFAULT_CACHE_DIR
+        self.cache_max_bytes = cache_max_bytes
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            logger.warning("⚠️  Image cache disabled (%s: %s)", self.cache_dir, e)
+            self.cache_dir = None
+    
+    def close(self):
+        """Release pooled HTTP connections (the shared GenAI client stays open)."""
+        self._http.close()
     
     def generate_image(
         self,
@@ -58,18 +120,80 @@ class GeminiImageGenerator:
         Returns:
             Image bytes or None if generation fails
         """
+        images = self.generate_images_batch(
+            prompt, 1, aspect_ratio, output_mime_type, person_generation, image_size
+        )
+        return images[0] if images else None
+    
+    def generate_images_batch(
+        self,
+        prompt: str,
+        count: int,
+        aspect_ratio: str = "16:9",
+        output_mime_type: str = "image/jpeg",
+        person_generation: str = None,
+        image_size: str = "1K"
+    ) -> List[bytes]:
+        """
+        Generate several distinct images for one prompt, asking Imagen for up to
+        MAX_IMAGES_PER_REQUEST per API call instead of one call per image.
+        
+        Args:
+            prompt: Description of the images to generate
+            count: Number of images wanted
+            (remaining args as for generate_image)
+            
+        Returns:
+            Up to count image bytes; fewer if generation partly fails
+        """
+        # Image k of a prompt has its own cache entry; k == 0 shares generate_image's
+        cache_paths = [None] * count
+        images: List[Optional[bytes]] = [None] * count
+        if self.cache_dir:
+            ext = '.png' if output_mime_type.lower() == 'image/png' else '.jpg'
+            for k in range(count):
+                key_parts = (self.model, aspect_ratio, output_mime_type, image_size, prompt) + ((str(k),) if k else ())
+                cache_paths[k] = os.path.join(self.cache_dir, LLMCache.make_key(*key_parts) + ext)
+                images[k] = self._read_cached_image(cache_paths[k])
+            hits = sum(image is not None for image in images)
+            if hits:
+                logger.info("♻️  Using %s cached image(s) for prompt: %s...", hits, prompt[:100])
+        
+        missing = [k for k in range(count) if images[k] is None]
+        for start in range(0, len(missing), self.MAX_IMAGES_PER_REQUEST):
+            slots = missing[start:start + self.MAX_IMAGES_PER_REQUEST]
+            generated = self._generate_images(
+                prompt, len(slots), aspect_ratio, output_mime_type, person_generation, image_size
+            )
+            for k, image_bytes in zip(slots, generated):
+                images[k] = image_bytes
+                if cache_paths[k]:
+                    self._write_cached_image(cache_paths[k], image_bytes)
+        
+        return [image for image in images if image is not None]
+    
+    def _generate_images(
+        self,
+        prompt: str,
+        count: int,
+        aspect_ratio: str,
+        output_mime_type: str,
+        person_generation: Optional[str],
+        image_size: str
+    ) -> List[bytes]:
+        """Make one Imagen API call for count images and return their bytes (uncached)."""
         try:
-            print(f"  📝 Generating image with prompt: {prompt[:100]}...")
+            logger.debug("📝 Generating %s image(s) with prompt: %s...", count, prompt[:100])
             
             # Build config dict - only include person_generation if enum is available
             config_dict = {
-                "number_of_images": 1,
+                "number_of_images": count,
                 "output_mime_type": output_mime_type,
                 "aspect_ratio": aspect_ratio,
                 "image_size": image_size,
             }
             
-            print(f"  ⚙️  Config: {config_dict}")
+            logger.debug("⚙️  Config: %s", config_dict)
             
             # Generate image using the SDK
             result = self.client.models.generate_images(
@@ -78,24 +202,34 @@ class GeminiImageGenerator:
                 config=config_dict,
             )
             
-            print(f"  ✅ API call successful")
-            print(f"  📊 Result type: {type(result)}")
-            print(f"  📊 Result attributes: {dir(result)}")
+            logger.debug("✅ API call successful")
+            logger.debug("📊 Result type: %s", type(result))
             
             # Check if images were generated
             if not hasattr(result, 'generated_images') or not result.generated_images:
-                print(f"⚠️  No images generated. Result: {result}")
-                return None
-            
-            print(f"  📸 Found {len(result.generated_images)} generated images")
+                logger.warning("⚠️  No images generated. Result: %s", result)
+                return []
             
-            if len(result.generated_images) != 1:
-                print(f"⚠️  Expected 1 image, got {len(result.generated_images)}")
+            image_count = len(result.generated_images)
+            logger.debug("📸 Found %s generated images", image_count)
             
-            # Get the first generated image
-            generated_image = result.generated_images[0]
-            print(f"  📸 Generated image type: {type(generated_image)}")
-            print(f"  📸 Generated image attributes: {dir(generated_image)}")
+            if image_count != count:
+                logger.warning("⚠️  Expected %s image(s), got %s", count, image_count)
+        except Exception as e:
+            logger.exception("⚠️  Error generating image: %s", e)
+            return []
+        
+        images = []
+        for generated_image in result.generated_images[:count]:
+            image_bytes = self._extract_image_bytes(generated_image, output_mime_type)
+            if image_bytes:
+                images.append(image_bytes)
+        return images
+    
+    def _extract_image_bytes(self, generated_image, output_mime_type: str) -> Optional[bytes]:
+        """Get encoded bytes out of one generated image, whatever shape the SDK returned."""
+        try:
+            logger.debug("📸 Generated image type: %s", type(generated_image))
             
             # Try different ways to access the image
             pil_image = None
@@ -103,17 +237,17 @@ class GeminiImageGenerator:
             # Method 1: Check if .image attribute exists (Pydantic wrapper or PIL Image)
             if hasattr(generated_image, 'image'):
                 image_obj = generated_image.image
-                print(f"  ✅ Found .image attribute, type: {type(image_obj)}")
+                logger.debug("✅ Found .image attribute, type: %s", type(image_obj))
 
                 # The image object might be a Pydantic wrapper - try to get the actual PIL Image
                 # Check if it has _pil_image or similar attribute
                 if hasattr(image_obj, '_pil_image'):
                     pil_image = image_obj._pil_image
-                    print(f"  ✅ Extracted PIL Image from _pil_image attribute")
+                    logger.debug("✅ Extracted PIL Image from _pil_image attribute")
                 # Or it might have a method to get the PIL image
                 elif hasattr(image_obj, 'to_pil'):
                     pil_image = image_obj.to_pil()
-                    print(f"  ✅ Extracted PIL Image using to_pil() method")
+                    logger.debug("✅ Extracted PIL Image using to_pil() method")
                 # Try accessing common PIL Image attributes to verify it IS a PIL Image
                 # Need to actually TRY accessing them, not just check hasattr
                 elif hasattr(image_obj, 'mode') and hasattr(image_obj, 'size'):
@@ -122,10 +256,10 @@ class GeminiImageGenerator:
                         _ = image_obj.mode
                         _ = image_obj.size
                         pil_image = image_obj
-                        print(f"  ✅ Image object is a PIL Image (verified mode and size access)")
+                        logger.debug("✅ Image object is a PIL Image (verified mode and size access)")
                     except (AttributeError, TypeError) as e:
-                        print(f"  ⚠️  Object has mode/size attributes but can't access them: {e}")
-                        print(f"  🔄 Will try other extraction methods...")
+                        logger.warning("⚠️  Object has mode/size attributes but can't access them: %s", e)
+                        logger.debug("🔄 Will try other extraction methods...")
                         # Don't set pil_image, let it fall through to check other methods below
 
                 # If pil_image is still None, try model_dump for Pydantic models
@@ -133,7 +267,7 @@ class GeminiImageGenerator:
                     try:
                         # Try to convert the Pydantic model to see what's inside
                         image_dict = image_obj.model_dump()
-                        print(f"  📊 Pydantic model_dump keys: {list(image_dict.keys())}")
+                        logger.debug("📊 Pydantic model_dump keys: %s", list(image_dict.keys()))
 
                         # Check for common image data fields
                         if 'data' in image_dict and isinstance(image_dict['data'], bytes):
@@ -141,10 +275,10 @@ class GeminiImageGenerator:
                         elif 'bytes' in image_dict and isinstance(image_dict['bytes'], bytes):
                             return image_dict['bytes']
                         else:
-                            print(f"⚠️  No bytes data found in Pydantic model")
+                            logger.warning("⚠️  No bytes data found in Pydantic model")
                             return None
                     except Exception as e:
-                        print(f"⚠️  Error dumping Pydantic model: {e}")
+                        logger.warning("⚠️  Error dumping Pydantic model: %s", e)
                         return None
 
                 # If still None, try PIL isinstance check
@@ -153,63 +287,67 @@ class GeminiImageGenerator:
                         from PIL import Image as PILImage
                         if isinstance(image_obj, PILImage.Image):
                             pil_image = image_obj
-                            print(f"  ✅ Confirmed as PIL Image via isinstance check")
+                            logger.debug("✅ Confirmed as PIL Image via isinstance check")
                         else:
-                            print(f"⚠️  Image object is not a PIL Image, type: {type(image_obj)}")
+                            logger.warning("⚠️  Image object is not a PIL Image, type: %s", type(image_obj))
                             # Try to access raw bytes if available
                             if hasattr(image_obj, '__bytes__'):
-                                print(f"  🔄 Trying __bytes__() method...")
+                                logger.debug("🔄 Trying __bytes__() method...")
                                 return bytes(image_obj)
-                            print(f"⚠️  No more extraction methods available")
+                            logger.warning("⚠️  No more extraction methods available")
                             return None
                     except Exception as e:
-                        print(f"⚠️  Error verifying PIL Image: {e}")
+                        logger.warning("⚠️  Error verifying PIL Image: %s", e)
                         return None
             # Method 2: Check if .bytes attribute exists (raw bytes)
             elif hasattr(generated_image, 'bytes'):
-                print(f"  ✅ Found .bytes attribute, returning directly")
+                logger.debug("✅ Found .bytes attribute, returning directly")
                 return generated_image.bytes
             # Method 3: Check if it's bytes directly
             elif isinstance(generated_image, bytes):
-                print(f"  ✅ Generated image is bytes directly")
+                logger.debug("✅ Generated image is bytes directly")
                 return generated_image
             # Method 4: Check if it's a dict with image data
             elif isinstance(generated_image, dict):
                 if 'image' in generated_image:
                     pil_image = generated_image['image']
                 elif 'imageBase64' in generated_image:
-                    import base64
-                    image_bytes = base64.b64decode(generated_image['imageBase64'])
-                    return image_bytes
+                    # Decoded once, straight from the str/bytes the API gave us
+                    return base64.b64decode(generated_image['imageBase64'])
                 elif 'imageUrl' in generated_image:
-                    import requests
-                    img_response = requests.get(generated_image['imageUrl'], timeout=30)
-                    img_response.raise_for_status()
-                    return img_response.content
+                    # Streamed and closed here so the connection goes straight back to the pool
+                    with self._http.get(generated_image['imageUrl'], timeout=30, stream=True) as img_response:
+                        img_response.raise_for_status()
+                        return img_response.content
                 else:
-                    print(f"⚠️  Dict format but no known image key: {list(generated_image.keys())}")
+                    logger.warning("⚠️  Dict format but no known image key: %s", list(generated_image.keys()))
                     return None
             else:
-                print(f"⚠️  Unknown generated_image format: {type(generated_image)}")
+                logger.warning("⚠️  Unknown generated_image format: %s", type(generated_image))
                 return None
 
             if not pil_image:
-                print(f"⚠️  Could not extract PIL image from generated_image")
+                logger.warning("⚠️  Could not extract PIL image from generated_image")
                 return None
 
             # Verify it's actually a PIL Image before accessing attributes
             try:
-                print(f"  🖼️  PIL Image mode: {pil_image.mode}, size: {pil_image.size}")
+                logger.debug("🖼️  PIL Image mode: %s, size: %s", pil_image.mode, pil_image.size)
             except AttributeError as e:
-                print(f"⚠️  Object doesn't have PIL Image attributes: {e}")
-                print(f"  📊 Object type: {type(pil_image)}, attributes: {dir(pil_image)[:10]}...")
+                logger.warning("⚠️  Object doesn't have PIL Image attributes: %s", e)
+                logger.debug("📊 Object type: %s", type(pil_image))
                 return None
             
-            # Ensure image is in RGB mode for JPEG (convert RGBA/P to RGB if needed)
-            if pil_image.mode in ('RGBA', 'LA', 'P'):
-                # Create a white background for transparency
-                rgb_image = pil_image.convert('RGB')
-                pil_image = rgb_image
+            # Ensure image is in RGB mode for JPEG. Transparency is composited onto
+            # white in one paste (convert('RGB') alone just drops alpha, leaving
+            # whatever colour sat under it); RGB images are used as-is
+            if pil_image.mode in ('LA', 'PA') or (pil_image.mode == 'P' and 'transparency' in pil_image.info):
+                pil_image = pil_image.convert('RGBA')
+            if pil_image.mode == 'RGBA':
+                from PIL import Image as PILImage
+                background = PILImage.new('RGB', pil_image.size, (255, 255, 255))
+                background.paste(pil_image, mask=pil_image.getchannel('A'))
+                pil_image = background
             elif pil_image.mode != 'RGB':
                 pil_image = pil_image.convert('RGB')
             
@@ -221,19 +359,66 @@ class GeminiImageGenerator:
             }
             save_format = format_map.get(output_mime_type.lower(), 'JPEG')
             
-            image_buffer = io.BytesIO()
-            pil_image.save(image_buffer, format=save_format, quality=95)
-            image_bytes = image_buffer.getvalue()
+            # One encode straight into a buffer that's released as soon as we
+            # have the bytes; JPEG uses 4:2:0 chroma subsampling, no extra passes
+            save_options = {'quality': 95}
+            if save_format == 'JPEG':
+                save_options.update(subsampling=2, optimize=False, progressive=False)
+            with io.BytesIO() as image_buffer:
+                pil_image.save(image_buffer, format=save_format, **save_options)
+                image_bytes = image_buffer.getvalue()
             
-            print(f"  ✅ Successfully converted to bytes: {len(image_bytes)} bytes")
+            logger.debug("✅ Successfully converted to bytes: %s bytes", len(image_bytes))
             return image_bytes
             
         except Exception as e:
-            print(f"⚠️  Error generating image: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("⚠️  Error extracting generated image: %s", e)
+            return None
+    
+    def _read_cached_image(self, path: str) -> Optional[bytes]:
+        """Return cached image bytes, marking the entry as recently used, or None on a miss."""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # mtime doubles as last-used time for eviction
+            return data
+        except OSError:
             return None
     
+    def _write_cached_image(self, path: str, image_bytes: bytes):
+        """Atomically store an image, then trim the cache back under cache_max_bytes."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(image_bytes)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("⚠️  Could not cache image: %s", e)
+            return
+        self._evict_cached_images()
+    
+    def _evict_cached_images(self):
+        """Delete least recently used images until the cache fits cache_max_bytes."""
+        entries = []
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= self.cache_max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.cache_max_bytes:
+                break
+    
     def enhance_prompt(self, base_description: str, article_title: str, keywords: List[str]) -> str:
         """
         Enhance image prompt with context for better results.
@@ -269,17 +454,14 @@ class GeminiImageGenerator:
         Returns:
             List of dicts with 'placeholder', 'description', and 'position'
         """
-        pattern = r'\[Image:\s*([^\]]+)\]'
-        matches = []
-        
-        for match in re.finditer(pattern, content):
-            matches.append({
+        return [
+            {
                 'placeholder': match.group(0),
                 'description': match.group(1).strip(),
                 'position': match.start()
-            })
-        
-        return matches
+            }
+            for match in _PLACEHOLDER_RE.finditer(content)
+        ]
     
     def replace_placeholders_with_images(
         self,
@@ -315,104 +497,168 @@ class GeminiImageGenerator:
 
         print(f"  🖼️  Generating {len(placeholders)} images...")
 
-        image_info_list = []
-        replacements = []
-
+        # Placeholders with the same description share an enhanced prompt, so
+        # each distinct prompt is a single Imagen request for all its images
+        groups: Dict[str, List[int]] = {}
         for i, placeholder_info in enumerate(placeholders):
-            description = placeholder_info['description']
-            enhanced_prompt = self.enhance_prompt(description, article_title, keywords)
-            
-            print(f"  🎨 Generating image {i+1}/{len(placeholders)}: {description[:50]}...")
-            
-            # Generate image
-            image_bytes = self.generate_image(enhanced_prompt)
-            
-            if not image_bytes:
-                print(f"  ⚠️  Failed to generate image for: {description}")
-                # Leave placeholder as-is or add a comment (don't create broken img tag)
-                # Option: Keep the placeholder so user knows image was intended
-                # replacements.append((placeholder_info['placeholder'], f'<!-- Image generation failed: {description} -->'))
-                # Option: Remove placeholder entirely
-                replacements.append((placeholder_info['placeholder'], ''))
-                continue
-            
-            # Upload to WordPress if requested
-            if upload_to_wordpress and wp_publisher:
-                try:
-                    # Create a filename from the description
-                    filename = self._create_filename_from_description(description, i)
-                    
-                    # Create SEO-friendly title and caption from description
-                    # Title: Clean version of description (max 60 chars for SEO)
-                    img_title = description[:60].rstrip('.')
-                    # Caption: Full description (can be longer)
-                    img_caption = description
-                    # Alt text: Same as description (required for accessibility/SEO)
-                    img_alt = description
-                    # Description: Full description for media library
-                    img_description = description
-                    
-                    # Upload image to WordPress
-                    upload_result = wp_publisher.upload_image(
-                        image_bytes=image_bytes,
-                        filename=filename,
-                        alt_text=img_alt,
-                        title=img_title,
-                        caption=img_caption,
-                        description=img_description
-                    )
-                    
-                    if upload_result and upload_result.get('url'):
-                        img_url = upload_result['url']
-                        img_id = upload_result.get('id')
-                        
-                        # Create WordPress-compatible img tag with proper SEO attributes
-                        # Include alt text (required for SEO/accessibility)
-                        # Include width/height for performance
-                        # Include class for WordPress integration
-                        img_tag = f'<img src="{img_url}" alt="{img_alt}" class="wp-image-{img_id}" width="800" height="450" />'
-                        
-                        replacements.append((placeholder_info['placeholder'], img_tag))
-                        
-                        image_info_list.append({
-                            'description': description,
-                            'url': img_url,
-                            'id': img_id,
-                            'filename': filename
-                        })
-                        
-                        print(f"  ✅ Image uploaded: {img_url}")
-                    else:
-                        # Fallback: embed as base64 (not ideal but works)
-                        img_base64 = base64.b64encode(image_bytes).decode('utf-8')
-                        img_tag = f'<img src="data:image/jpeg;base64,{img_base64}" alt="{description}" />'
-                        replacements.append((placeholder_info['placeholder'], img_tag))
-                        
-                except Exception as e:
-                    print(f"  ⚠️  Error uploading image to WordPress: {e}")
-                    # Fallback to base64 embedding
-                    img_base64 = base64.b64encode(image_bytes).decode('utf-8')
-                    img_tag = f'<img src="data:image/jpeg;base64,{img_base64}" alt="{description}" />'
-                    replacements.append((placeholder_info['placeholder'], img_tag))
-            else:
-                # No WordPress upload - embed as base64
-                img_base64 = base64.b64encode(image_bytes).decode('utf-8')
-                img_tag = f'<img src="data:image/jpeg;base64,{img_base64}" alt="{description}" />'
-                replacements.append((placeholder_info['placeholder'], img_tag))
+            prompt = self.enhance_prompt(placeholder_info['description'], article_title, keywords)
+            groups.setdefault(prompt, []).append(i)
+
+        # Each group is a Gemini call plus WordPress uploads, nearly all network
+        # wait, so groups run side by side; outcomes are kept in placeholder order
+        outcomes: List[Tuple[str, Optional[Dict]]] = [None] * len(placeholders)
+        workers = min(self.MAX_IMAGE_WORKERS, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            group_results = pool.map(
+                lambda group: self._process_placeholder_group(
+                    group[0], group[1], placeholders, wp_publisher, upload_to_wordpress
+                ),
+                groups.items()
+            )
+            for indexes, results in zip(groups.values(), group_results):
+                for i, outcome in zip(indexes, results):
+                    outcomes[i] = outcome
+
+        image_info_list = [info for _, info in outcomes if info]
         
-        # Replace all placeholders in reverse order (to preserve positions)
-        updated_content = content
-        for placeholder, img_tag in replacements:
-            updated_content = updated_content.replace(placeholder, img_tag, 1)
+        # Splice each image in at its placeholder's position in one pass over
+        # content; placeholders past the limit are left as they are
+        parts = []
+        last = 0
+        for placeholder_info, (img_tag, _) in zip(placeholders, outcomes):
+            start = placeholder_info['position']
+            parts.append(content[last:start])
+            parts.append(img_tag)
+            last = start + len(placeholder_info['placeholder'])
+        parts.append(content[last:])
+        updated_content = ''.join(parts)
         
         return updated_content, image_info_list
     
+    def _process_placeholder_group(
+        self,
+        prompt: str,
+        indexes: List[int],
+        placeholders: List[Dict[str, str]],
+        wp_publisher=None,
+        upload_to_wordpress: bool = True
+    ) -> List[Tuple[str, Optional[Dict]]]:
+        """
+        Generate the images for placeholders sharing one prompt, then place each.
+        
+        Returns:
+            One (replacement_html, image_info) per index, in the order given
+        """
+        for i in indexes:
+            print(f"  🎨 Generating image {i+1}/{len(placeholders)}: {placeholders[i]['description'][:50]}...")
+
+        # Generate image(s) - one request even when the prompt repeats
+        if len(indexes) == 1:
+            images = [self.generate_image(prompt)]
+        else:
+            images = self.generate_images_batch(prompt, len(indexes))
+
+        return [
+            self._process_placeholder(
+                i, placeholders[i], images[k] if k < len(images) else None,
+                wp_publisher, upload_to_wordpress
+            )
+            for k, i in enumerate(indexes)
+        ]
+
+    def _process_placeholder(
+        self,
+        i: int,
+        placeholder_info: Dict[str, str],
+        image_bytes: Optional[bytes],
+        wp_publisher=None,
+        upload_to_wordpress: bool = True
+    ) -> Tuple[str, Optional[Dict]]:
+        """
+        Upload (optionally) and build the replacement for one placeholder's image.
+        
+        Returns:
+            Tuple of (replacement_html, image_info); replacement_html is '' when
+            generation failed and image_info is set only for WordPress uploads
+        """
+        description = placeholder_info['description']
+
+        if not image_bytes:
+            print(f"  ⚠️  Failed to generate image for: {description}")
+            # Leave placeholder as-is or add a comment (don't create broken img tag)
+            # Option: Keep the placeholder so user knows image was intended
+            # return f'<!-- Image generation failed: {description} -->', None
+            # Option: Remove placeholder entirely
+            return '', None
+
+        # Upload to WordPress if requested
+        if upload_to_wordpress and wp_publisher:
+            try:
+                # Create a filename from the description
+                filename = self._create_filename_from_description(description, i)
+
+                # Create SEO-friendly title and caption from description
+                # Title: Clean version of description (max 60 chars for SEO)
+                img_title = description[:60].rstrip('.')
+                # Caption: Full description (can be longer)
+                img_caption = description
+                # Alt text: Same as description (required for accessibility/SEO)
+                img_alt = description
+                # Description: Full description for media library
+                img_description = description
+
+                # Upload image to WordPress
+                upload_result = wp_publisher.upload_image(
+                    image_bytes=image_bytes,
+                    filename=filename,
+                    alt_text=img_alt,
+                    title=img_title,
+                    caption=img_caption,
+                    description=img_description
+                )
+
+                if upload_result and upload_result.get('url'):
+                    img_url = upload_result['url']
+                    img_id = upload_result.get('id')
+
+                    # Create WordPress-compatible img tag with proper SEO attributes
+                    # Include alt text (required for SEO/accessibility)
+                    # Include width/height for performance
+                    # Include class for WordPress integration
+                    img_tag = f'<img src="{img_url}" alt="{img_alt}" class="wp-image-{img_id}" width="800" height="450" />'
+
+                    print(f"  ✅ Image uploaded: {img_url}")
+
+                    return img_tag, {
+                        'description': description,
+                        'url': img_url,
+                        'id': img_id,
+                        'filename': filename
+                    }
+                else:
+                    # Fallback: embed as base64 (not ideal but works)
+                    img_base64 = base64.b64encode(image_bytes).decode('utf-8')
+                    img_tag = f'<img src="data:image/jpeg;base64,{img_base64}" alt="{description}" />'
+                    return img_tag, None
+
+            except Exception as e:
+                print(f"  ⚠️  Error uploading image to WordPress: {e}")
+                # Fallback to base64 embedding
+                img_base64 = base64.b64encode(image_bytes).decode('utf-8')
+                img_tag = f'<img src="data:image/jpeg;base64,{img_base64}" alt="{description}" />'
+                return img_tag, None
+        else:
+            # No WordPress upload - embed as base64
+            img_base64 = base64.b64encode(image_bytes).decode('utf-8')
+            img_tag = f'<img src="data:image/jpeg;base64,{img_base64}" alt="{description}" />'
+            return img_tag, None
+
     def _create_filename_from_description(self, description: str, index: int) -> str:
         """Create a safe filename from image description."""
         # Clean description for filename
         filename = description.lower()
-        filename = re.sub(r'[^a-z0-9\s-]', '', filename)
-        filename = re.sub(r'\s+', '-', filename)
+        filename = _FILENAME_UNSAFE_RE.sub('', filename)
+        filename = _WHITESPACE_RE.sub('-', filename)
         filename = filename[:50]  # Limit length
         filename = filename.strip('-')
         
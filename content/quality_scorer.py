@@ -6,102 +6,30 @@ AI-powered content quality analysis that scores content like Google's algorithms
 Analyzes E-E-A-T signals, comprehensiveness, readability, user value, and technical SEO.
 """
 
-import anthropic
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+import asyncio
+import hashlib
 import json
+import logging
 import re
+import time
 from datetime import datetime
 
+from content_engine.clients import get_anthropic_client, new_async_anthropic_client
 
-class ContentQualityScorer:
-    """
-    Comprehensive content quality analysis using AI to evaluate:
-
-    1. **E-E-A-T Signals** (Experience, Expertise, Authoritativeness, Trust)
-    2. **Comprehensiveness** (topic coverage depth)
-    3. **Readability** (structure, formatting, scannability)
-    4. **User Value** (does it actually help the user?)
-    5. **Technical SEO** (meta tags, schema, images, etc.)
-    6. **Freshness** (up-to-date information)
-    7. **Engagement Potential** (likely to keep users on page)
-
-    Returns actionable improvement recommendations.
-    """
-
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
-        self.client = anthropic.Anthropic(api_key=api_key)
-        self.model = model
-
-    def score_content_quality(
-        self,
-        content: str,
-        meta_title: str = "",
-        meta_description: str = "",
-        target_keywords: List[str] = None,
-        url: str = "",
-        engagement_data: Optional[Dict] = None
-    ) -> Dict:
-        """
-        Comprehensive AI-powered content quality analysis.
-
-        Args:
-            content: The full HTML or plain text content
-            meta_title: SEO title tag
-            meta_description: SEO meta description
-            target_keywords: List of target keywords
-            url: Page URL
-            engagement_data: Optional dict with bounce_rate, avg_time, etc.
-
-        Returns:
-            Dictionary with scores, issues, and recommendations
-        """
-
-        if target_keywords is None:
-            target_keywords = []
-
-        # Calculate basic stats
-        word_count = len(content.split())
-        has_images = '<img' in content or '[image]' in content.lower()
-        has_lists = '<ul>' in content or '<ol>' in content or '<li>' in content
-        has_tables = '<table>' in content
-        has_headings = '<h2>' in content or '<h3>' in content or '##' in content
-
-        # Prepare engagement context
-        engagement_context = ""
-        if engagement_data:
-            engagement_context = f"""
-**ENGAGEMENT METRICS:**
-- Bounce Rate: {engagement_data.get('bounce_rate', 'N/A')}%
-- Avg Time on Page: {engagement_data.get('avg_time', 'N/A')}s
-- Pages per Session: {engagement_data.get('pages_per_session', 'N/A')}
-- Engagement Rate: {engagement_data.get('engagement_rate', 'N/A')}%
-
-**ENGAGEMENT BENCHMARKS:**
-- Good bounce rate: <50%
-- Good time on page: >2 minutes
-- Good engagement rate: >60%
-"""
-
-        # Extract preview
-        content_preview = content[:4000]
+try:
+    # orjson is several times faster than the stdlib for the JSON round-trips
+    import orjson
+except ImportError:
+    orjson = None
 
-        prompt = f"""You are a content quality analyst and SEO expert. Evaluate this content comprehensively.
+logger = logging.getLogger(__name__)
 
-**TARGET KEYWORDS:** {', '.join(target_keywords) if target_keywords else 'None specified'}
-**URL:** {url}
-**META TITLE:** {meta_title or 'Not set'}
-**META DESCRIPTION:** {meta_description or 'Not set'}
-
-**CONTENT PREVIEW:**
-{content_preview}
 
-**BASIC STATS:**
-- Word Count: {word_count}
-- Has Images: {has_images}
-- Has Lists: {has_lists}
-- Has Tables: {has_tables}
-- Has Headings: {has_headings}
-{engagement_context}
+# Static scoring rubric and output schema, sent as the system prompt so the user
+# message carries only per-URL details. Not marked for prompt caching: at roughly
+# 700 tokens it is under the model's 1024-token cache minimum.
+_SCORING_RUBRIC = """You are a content quality analyst and SEO expert. Evaluate the content provided by the user comprehensively.
 
 ---
 
@@ -160,9 +88,9 @@ class ContentQualityScorer:
 
 Return JSON:
 
-{{
+{
   "overall_score": 0.0-10.0,
-  "scores": {{
+  "scores": {
     "eeat": 0.0-10.0,
     "comprehensiveness": 0.0-10.0,
     "readability": 0.0-10.0,
@@ -170,76 +98,478 @@ Return JSON:
     "technical_seo": 0.0-10.0,
     "freshness": 0.0-10.0,
     "engagement_potential": 0.0-10.0
-  }},
+  },
   "strengths": [
-    "What this content does well",
-    "Another strength..."
+    "What this content does well (up to 5)"
   ],
   "critical_issues": [
-    {{
+    {
       "issue": "Specific problem",
       "severity": "high|medium|low",
       "impact": "How this hurts rankings/engagement",
       "fix": "Specific action to fix it"
-    }}
+    }
   ],
   "missing_elements": [
-    "Specific thing to add (e.g., comparison table, FAQ section, etc.)"
+    "Specific thing to add, e.g. comparison table, FAQ section (up to 5)"
   ],
-  "engagement_analysis": {{
-    "likely_bounce_reasons": [
-      "Why users might bounce (if bounce rate is high)"
-    ],
+  "engagement_analysis": {
     "improvement_suggestions": [
-      "Specific ways to improve engagement"
+      "Specific way to improve engagement, addressing likely bounce reasons (up to 3)"
     ]
-  }},
+  },
   "quick_wins": [
-    {{
+    {
       "action": "Quick, high-impact improvement",
       "estimated_time": "5 minutes",
       "impact": "Expected result"
-    }}
+    }
   ],
   "content_grade": "A|B|C|D|F",
   "ranking_potential": "This content could rank in top 10|20|30+ based on quality"
-}}
+}
 
-Be SPECIFIC and ACTIONABLE in your recommendations."""
+List at most 5 critical issues and 5 quick wins.
+Be SPECIFIC and ACTIONABLE in your recommendations. Keep each item to one sentence."""
 
-        try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=6000,
-                messages=[{"role": "user", "content": prompt}],
-                thinking={
-                    "type": "enabled",
-                    "budget_tokens": 3000
-                }
-            )
+# Per-URL user message. Pages with and without engagement metrics each get a
+# fixed template, picked once per call, instead of assembling optional blocks.
+_USER_PROMPT_TEMPLATE = """Evaluate this content comprehensively.
+
+**TARGET KEYWORDS:** {keywords}
+**URL:** {url}
+**META TITLE:** {meta_title}
+**META DESCRIPTION:** {meta_description}
+
+**CONTENT PREVIEW:**
+{content_preview}
+
+**BASIC STATS:**
+- Word Count: {word_count}
+- Has Images: {has_images}
+- Has Lists: {has_lists}
+- Has Tables: {has_tables}
+- Has Headings: {has_headings}
+"""
+
+_ENGAGEMENT_PROMPT_TEMPLATE = _USER_PROMPT_TEMPLATE + """
+**ENGAGEMENT METRICS:**
+- Bounce Rate: {bounce_rate}%
+- Avg Time on Page: {avg_time}s
+- Pages per Session: {pages_per_session}
+- Engagement Rate: {engagement_rate}%
+
+**ENGAGEMENT BENCHMARKS:**
+- Good bounce rate: <50%
+- Good time on page: >2 minutes
+- Good engagement rate: >60%
+"""
+
+# Seconds a streamed response may go without sending data before it is aborted
+STREAM_IDLE_TIMEOUT = 30.0
+
+# Pages below these sizes get a canned score instead of a Claude call
+MIN_LLM_WORD_COUNT = 100
+MIN_UNSTRUCTURED_WORD_COUNT = 300
+
+_WORD_RE = re.compile(r'\S+')
+
+# Markup that signals each structural feature, mapped to its stats flag
+_STRUCTURE_MARKERS = {
+    '<img': 'has_images',
+    '[image]': 'has_images',
+    '<ul>': 'has_lists',
+    '<ol>': 'has_lists',
+    '<li>': 'has_lists',
+    '<table>': 'has_tables',
+    '<h2>': 'has_headings',
+    '<h3>': 'has_headings',
+    '##': 'has_headings'
+}
+_STRUCTURE_MARKER_RE = re.compile(
+    '|'.join(re.escape(marker) for marker in _STRUCTURE_MARKERS), re.IGNORECASE
+)
+
+class ContentQualityScorer:
+    """
+    Comprehensive content quality analysis using AI to evaluate:
+
+    1. **E-E-A-T Signals** (Experience, Expertise, Authoritativeness, Trust)
+    2. **Comprehensiveness** (topic coverage depth)
+    3. **Readability** (structure, formatting, scannability)
+    4. **User Value** (does it actually help the user?)
+    5. **Technical SEO** (meta tags, schema, images, etc.)
+    6. **Freshness** (up-to-date information)
+    7. **Engagement Potential** (likely to keep users on page)
+
+    Returns actionable improvement recommendations.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-20250514",
+        max_output_tokens: int = 2048,
+        enable_thinking: bool = False
+    ):
+        self.api_key = api_key
+        self.client = get_anthropic_client(api_key)
+        # Async client is created on first ascore_content_quality() call; its
+        # HTTP pool belongs to the running event loop
+        self._aclient = None
+        self.model = model
+        # The JSON report is typically 800-1500 tokens; reserving more only
+        # adds latency. Extended thinking is opt-in for the same reason.
+        self.max_output_tokens = max_output_tokens
+        self.enable_thinking = enable_thinking
+        # Exact-match response cache: re-scoring unchanged content is common
+        # (re-analysis runs, retries) and each miss is a full Claude call.
+        self._cache: Dict[str, Dict] = {}
+
+    @staticmethod
+    def _cache_key(
+        content: str,
+        meta_title: str,
+        meta_description: str,
+        target_keywords: List[str],
+        url: str,
+        engagement_data: Optional[Dict]
+    ) -> str:
+        """Hash every input that shapes the prompt into a stable cache key."""
+        fields = [content, meta_title, meta_description, sorted(target_keywords), url, engagement_data]
+        if orjson is not None:
+            payload = orjson.dumps(fields, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            payload = json.dumps(fields, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+
+    def score_content_quality(
+        self,
+        content: str,
+        meta_title: str = "",
+        meta_description: str = "",
+        target_keywords: List[str] = None,
+        url: str = "",
+        engagement_data: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Comprehensive AI-powered content quality analysis.
+
+        Args:
+            content: The full HTML or plain text content
+            meta_title: SEO title tag
+            meta_description: SEO meta description
+            target_keywords: List of target keywords
+            url: Page URL
+            engagement_data: Optional dict with bounce_rate, avg_time, etc.
+
+        Returns:
+            Dictionary with scores, issues, and recommendations
+        """
 
-            response_text = ""
-            for block in message.content:
-                if block.type == "text":
-                    response_text += block.text
+        result, request = self._prepare_request(
+            content, meta_title, meta_description, target_keywords or [], url, engagement_data
+        )
+        if result is not None:
+            return result
+
+        try:
+            # Stream so a stalled connection fails after STREAM_IDLE_TIMEOUT
+            # seconds without data instead of hanging the whole pipeline.
+            chunks = []
+            with self.client.messages.stream(
+                **self._request_params(request[2]), timeout=STREAM_IDLE_TIMEOUT
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+            return self._store_analysis("".join(chunks), request, url)
+        except Exception as e:
+            return self._scoring_error(e, url)
 
-            # Parse JSON
-            response_text = response_text.replace("```json", "").replace("```", "").strip()
-            analysis = json.loads(response_text)
+    async def ascore_content_quality(
+        self,
+        content: str,
+        meta_title: str = "",
+        meta_description: str = "",
+        target_keywords: List[str] = None,
+        url: str = "",
+        engagement_data: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Async twin of score_content_quality() using AsyncAnthropic.
 
-            # Add metadata
-            analysis['analyzed_at'] = datetime.now().isoformat()
-            analysis['word_count'] = word_count
-            analysis['url'] = url
+        Same arguments and return value; lets callers score several pages
+        concurrently (see score_many()).
+        """
 
-            return analysis
+        result, request = self._prepare_request(
+            content, meta_title, meta_description, target_keywords or [], url, engagement_data
+        )
+        if result is not None:
+            return result
 
+        if self._aclient is None:
+            self._aclient = new_async_anthropic_client(self.api_key)
+        try:
+            chunks = []
+            async with self._aclient.messages.stream(
+                **self._request_params(request[2]), timeout=STREAM_IDLE_TIMEOUT
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+            return self._store_analysis("".join(chunks), request, url)
         except Exception as e:
-            print(f"Error scoring content quality: {e}")
-            return {
-                'overall_score': 0.0,
-                'error': str(e)
+            return self._scoring_error(e, url)
+
+    def _prepare_request(
+        self,
+        content: str,
+        meta_title: str,
+        meta_description: str,
+        target_keywords: List[str],
+        url: str,
+        engagement_data: Optional[Dict]
+    ) -> Tuple[Optional[Dict], Optional[Tuple[str, int, str]]]:
+        """
+        Everything before the Claude call, shared by the sync, async and batch paths.
+
+        Returns (result, None) when no call is needed (cache hit or trivial
+        content), otherwise (None, (cache_key, word_count, prompt)).
+        """
+        cache_key = self._cache_key(
+            content, meta_title, meta_description, target_keywords, url, engagement_data
+        )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return {**cached, 'from_cache': True}, None
+
+        stats = self._content_stats(content)
+        trivial = self._score_trivial_content(stats, url)
+        if trivial is not None:
+            return trivial, None
+
+        prompt = self._build_prompt(
+            content, stats, meta_title, meta_description, target_keywords, url, engagement_data
+        )
+        return None, (cache_key, stats['word_count'], prompt)
+
+    def _store_analysis(self, response_text: str, request: Tuple[str, int, str], url: str) -> Dict:
+        """Parse a reply for a _prepare_request() request and cache the analysis."""
+        cache_key, word_count, _prompt = request
+        analysis = self._parse_analysis(response_text, word_count, url)
+        self._cache[cache_key] = analysis
+        return analysis
+
+    @staticmethod
+    def _scoring_error(error: Exception, url: str) -> Dict:
+        logger.error(f"Error scoring content quality for {url or 'content'}: {error}")
+        return {
+            'overall_score': 0.0,
+            'error': str(error)
+        }
+
+    async def score_many(self, items: List[Dict], concurrency: int = 8) -> List[Dict]:
+        """
+        Score many pages concurrently for interactive use.
+
+        Args:
+            items: List of dicts with score_content_quality() keyword arguments
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of analysis dicts in the same order as items
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def score_one(item: Dict) -> Dict:
+            async with semaphore:
+                return await self.ascore_content_quality(**item)
+
+        return await asyncio.gather(*(score_one(item) for item in items))
+
+    def score_content_quality_batch(self, items: List[Dict], poll_interval: float = 30.0) -> List[Dict]:
+        """
+        Score many pages at once through the Anthropic Message Batches API.
+
+        Batches run asynchronously at half the per-token price, which suits
+        site-wide audits. Items that fail inside the batch are retried one at a
+        time through score_content_quality().
+
+        Args:
+            items: List of dicts with score_content_quality() keyword arguments
+                (content, meta_title, meta_description, target_keywords, url,
+                engagement_data)
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            List of analysis dicts in the same order as items
+        """
+        results: List[Optional[Dict]] = [None] * len(items)
+        pending = {}
+        requests = []
+
+        for i, item in enumerate(items):
+            results[i], request = self._prepare_request(
+                item['content'], item.get('meta_title', ""), item.get('meta_description', ""),
+                item.get('target_keywords') or [], item.get('url', ""), item.get('engagement_data')
+            )
+            if request is None:
+                continue
+
+            custom_id = f"item-{i}"
+            pending[custom_id] = (i, request)
+            requests.append({"custom_id": custom_id, "params": self._request_params(request[2])})
+
+        if requests:
+            try:
+                batch = self.client.messages.batches.create(requests=requests)
+                while batch.processing_status != "ended":
+                    time.sleep(poll_interval)
+                    batch = self.client.messages.batches.retrieve(batch.id)
+
+                for entry in self.client.messages.batches.results(batch.id):
+                    if entry.custom_id not in pending or entry.result.type != "succeeded":
+                        continue
+                    i, request = pending.pop(entry.custom_id)
+                    texts = [block.text for block in entry.result.message.content if block.type == "text"]
+                    try:
+                        results[i] = self._store_analysis("".join(texts), request, items[i].get('url', ""))
+                    except ValueError as e:
+                        logger.warning(f"Error parsing batch result for {items[i].get('url', '')}: {e}")
+                        pending[entry.custom_id] = (i, request)
+            except Exception as e:
+                logger.error(f"Error running scoring batch, falling back to per-item scoring: {e}")
+
+        # Anything the batch could not score goes through the single-item path
+        for i, _request in pending.values():
+            results[i] = self.score_content_quality(**items[i])
+
+        return results
+
+    @staticmethod
+    def _content_stats(content: str) -> Dict:
+        """Cheap structural stats that are passed to Claude alongside the content."""
+        stats = {
+            # Count words without materialising a list of every word
+            'word_count': sum(1 for _ in _WORD_RE.finditer(content)),
+            'has_images': False,
+            'has_lists': False,
+            'has_tables': False,
+            'has_headings': False
+        }
+
+        # One sweep over the content instead of a substring scan per marker;
+        # stop as soon as every flag has been seen.
+        remaining = 4
+        for match in _STRUCTURE_MARKER_RE.finditer(content):
+            flag = _STRUCTURE_MARKERS[match.group(0).lower()]
+            if not stats[flag]:
+                stats[flag] = True
+                remaining -= 1
+                if not remaining:
+                    break
+
+        return stats
+
+    @staticmethod
+    def _score_trivial_content(stats: Dict, url: str) -> Optional[Dict]:
+        """
+        Score near-empty pages locally instead of spending a Claude call.
+
+        Returns a canned low-grade analysis for thin content (under
+        MIN_LLM_WORD_COUNT words, or under MIN_UNSTRUCTURED_WORD_COUNT words
+        with no headings or lists), otherwise None.
+        """
+        word_count = stats['word_count']
+        is_structured = stats['has_headings'] or stats['has_lists']
+        if word_count >= MIN_LLM_WORD_COUNT and (is_structured or word_count >= MIN_UNSTRUCTURED_WORD_COUNT):
+            return None
+
+        return {
+            'overall_score': 2.0,
+            'content_grade': 'F',
+            'ranking_potential': 'Unlikely to rank until the content is expanded',
+            'critical_issues': [
+                {
+                    'issue': f"Thin content ({word_count} words)",
+                    'severity': 'high',
+                    'impact': 'Pages this short rarely satisfy search intent or rank',
+                    'fix': 'Expand into a comprehensive article with H2/H3 sections covering the topic'
+                }
+            ],
+            'missing_elements': [] if is_structured else ['Headings and lists to structure the content'],
+            'quick_wins': [],
+            'skipped_llm': True,
+            'analyzed_at': datetime.now().isoformat(),
+            'word_count': word_count,
+            'url': url
+        }
+
+    @staticmethod
+    def _build_prompt(
+        content: str,
+        stats: Dict,
+        meta_title: str,
+        meta_description: str,
+        target_keywords: List[str],
+        url: str,
+        engagement_data: Optional[Dict]
+    ) -> str:
+        """Build the per-URL user message; the rubric lives in the system prompt."""
+        fields = {
+            'keywords': ', '.join(target_keywords) if target_keywords else 'None specified',
+            'url': url,
+            'meta_title': meta_title or 'Not set',
+            'meta_description': meta_description or 'Not set',
+            'content_preview': content[:4000],
+            **stats
+        }
+        if not engagement_data:
+            return _USER_PROMPT_TEMPLATE.format_map(fields)
+
+        return _ENGAGEMENT_PROMPT_TEMPLATE.format_map({
+            **fields,
+            'bounce_rate': engagement_data.get('bounce_rate', 'N/A'),
+            'avg_time': engagement_data.get('avg_time', 'N/A'),
+            'pages_per_session': engagement_data.get('pages_per_session', 'N/A'),
+            'engagement_rate': engagement_data.get('engagement_rate', 'N/A')
+        })
+
+    def _request_params(self, prompt: str) -> Dict:
+        """Messages API parameters shared by the streaming and batch paths."""
+        params = {
+            "model": self.model,
+            "max_tokens": self.max_output_tokens,
+            "system": _SCORING_RUBRIC,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if self.enable_thinking:
+            # Thinking tokens count against max_tokens, so reserve room for both
+            params["max_tokens"] = self.max_output_tokens + 3000
+            params["thinking"] = {
+                "type": "enabled",
+                "budget_tokens": 3000
             }
+        return params
+
+    @staticmethod
+    def _parse_analysis(response_text: str, word_count: int, url: str) -> Dict:
+        """Parse Claude's JSON reply and attach analysis metadata."""
+        # Slice out the outermost object so code fences or trailing prose
+        # around the JSON don't need a failed parse (or a full rescan) first
+        start = response_text.find('{')
+        end = response_text.rfind('}') + 1
+        if start == -1 or end <= start:
+            raise ValueError("No JSON object found in content quality response")
+        candidate = response_text[start:end]
+        analysis = orjson.loads(candidate) if orjson is not None else json.loads(candidate)
+
+        # Add metadata
+        analysis['analyzed_at'] = datetime.now().isoformat()
+        analysis['word_count'] = word_count
+        analysis['url'] = url
+
+        return analysis
 
     def get_improvement_priority_list(self, quality_score: Dict) -> List[Dict]:
         """
@@ -254,49 +584,60 @@ Be SPECIFIC and ACTIONABLE in your recommendations."""
         Returns:
             List of prioritized improvements
         """
+        return list(self.iter_improvements(quality_score))
+
+    def iter_improvements(self, quality_score: Dict) -> Iterator[Dict]:
+        """
+        Lazily yield prioritized improvements, highest priority first.
+
+        Same items and order as get_improvement_priority_list(); callers that
+        only render the top N can stop early with itertools.islice().
+
+        Args:
+            quality_score: Output from score_content_quality()
 
-        improvements = []
+        Yields:
+            Improvement dicts
+        """
 
         # Add quick wins (highest priority)
         for quick_win in quality_score.get('quick_wins', []):
-            improvements.append({
+            yield {
                 'priority': 'immediate',
                 'action': quick_win.get('action'),
                 'estimated_time': quick_win.get('estimated_time', '15 minutes'),
                 'impact': quick_win.get('impact'),
                 'category': 'quick_win'
-            })
+            }
 
         # Add critical issues
         for issue in quality_score.get('critical_issues', []):
             if issue.get('severity') == 'high':
-                improvements.append({
+                yield {
                     'priority': 'high',
                     'action': issue.get('fix'),
                     'issue': issue.get('issue'),
                     'impact': issue.get('impact'),
                     'category': 'critical_fix'
-                })
+                }
 
         # Add missing elements
         for missing in quality_score.get('missing_elements', [])[:5]:
-            improvements.append({
+            yield {
                 'priority': 'medium',
                 'action': f"Add: {missing}",
                 'category': 'missing_element',
                 'impact': 'Improves comprehensiveness and user value'
-            })
+            }
 
         # Add engagement improvements
         for suggestion in quality_score.get('engagement_analysis', {}).get('improvement_suggestions', [])[:3]:
-            improvements.append({
+            yield {
                 'priority': 'medium',
                 'action': suggestion,
                 'category': 'engagement',
                 'impact': 'Reduces bounce rate, increases dwell time'
-            })
-
-        return improvements
+            }
 
     def generate_improvement_checklist(self, quality_score: Dict) -> str:
         """
@@ -309,7 +650,7 @@ Be SPECIFIC and ACTIONABLE in your recommendations."""
             Formatted checklist string
         """
 
-        checklist = f"""# CONTENT IMPROVEMENT CHECKLIST
+        parts = [f"""# CONTENT IMPROVEMENT CHECKLIST
 
 **Overall Score:** {quality_score.get('overall_score', 0):.1f}/10 (Grade: {quality_score.get('content_grade', 'N/A')})
 **Ranking Potential:** {quality_score.get('ranking_potential', 'Unknown')}
@@ -317,34 +658,34 @@ Be SPECIFIC and ACTIONABLE in your recommendations."""
 ---
 
 ## IMMEDIATE ACTIONS (Do First):
-"""
+"""]
 
         for i, qw in enumerate(quality_score.get('quick_wins', [])[:5], 1):
-            checklist += f"\n{i}. [ ] **{qw.get('action')}**\n"
-            checklist += f"   ⏱️ Time: {qw.get('estimated_time', '15 min')}\n"
-            checklist += f"   📈 Impact: {qw.get('impact')}\n"
+            parts.append(f"\n{i}. [ ] **{qw.get('action')}**\n")
+            parts.append(f"   ⏱️ Time: {qw.get('estimated_time', '15 min')}\n")
+            parts.append(f"   📈 Impact: {qw.get('impact')}\n")
 
-        checklist += "\n## CRITICAL FIXES:\n"
+        parts.append("\n## CRITICAL FIXES:\n")
         for i, issue in enumerate(quality_score.get('critical_issues', []), 1):
             if issue.get('severity') == 'high':
-                checklist += f"\n{i}. [ ] **{issue.get('fix')}**\n"
-                checklist += f"   🔴 Issue: {issue.get('issue')}\n"
-                checklist += f"   📉 Impact: {issue.get('impact')}\n"
+                parts.append(f"\n{i}. [ ] **{issue.get('fix')}**\n")
+                parts.append(f"   🔴 Issue: {issue.get('issue')}\n")
+                parts.append(f"   📉 Impact: {issue.get('impact')}\n")
 
-        checklist += "\n## MISSING ELEMENTS TO ADD:\n"
+        parts.append("\n## MISSING ELEMENTS TO ADD:\n")
         for i, missing in enumerate(quality_score.get('missing_elements', []), 1):
-            checklist += f"{i}. [ ] {missing}\n"
+            parts.append(f"{i}. [ ] {missing}\n")
 
         if quality_score.get('engagement_analysis'):
-            checklist += "\n## ENGAGEMENT IMPROVEMENTS:\n"
+            parts.append("\n## ENGAGEMENT IMPROVEMENTS:\n")
             for i, suggestion in enumerate(quality_score.get('engagement_analysis', {}).get('improvement_suggestions', []), 1):
-                checklist += f"{i}. [ ] {suggestion}\n"
+                parts.append(f"{i}. [ ] {suggestion}\n")
 
-        checklist += "\n---\n"
-        checklist += f"\n**Analyzed:** {quality_score.get('analyzed_at', 'N/A')}\n"
-        checklist += f"**Word Count:** {quality_score.get('word_count', 0):,}\n"
+        parts.append("\n---\n")
+        parts.append(f"\n**Analyzed:** {quality_score.get('analyzed_at', 'N/A')}\n")
+        parts.append(f"**Word Count:** {quality_score.get('word_count', 0):,}\n")
 
-        return checklist
+        return "".join(parts)
 
 
 if __name__ == "__main__":
@@ -376,6 +717,9 @@ if __name__ == "__main__":
         }
     )
 
-    print(json.dumps(result, indent=2))
+    if orjson is not None:
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(result, indent=2))
     print("\n" + "="*80)
     print(scorer.generate_improvement_checklist(result))
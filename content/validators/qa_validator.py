@@ -4,10 +4,47 @@ content_qa_validator.py
 Comprehensive QA validation for generated content to ensure quality and completeness.
 """
 
+import functools
 import re
 from typing import Dict, List, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+# Time-of-year phrases checked by _validate_temporal_context
+_KICK_OFF_PHRASES = frozenset({
+    'kick off the year',
+    'kick the year off',
+    'start the year right',
+    'begin the year',
+    'start of the year',
+    'new year resolution'
+})
+_SUMMER_PHRASES = frozenset({'perfect for summer', 'summer grilling', 'hot summer day'})
+_WINTER_PHRASES = frozenset({'cozy winter', 'cold weather', 'winter warming'})
+
+
+def _phrase_matcher(phrases: frozenset) -> Tuple["re.Pattern", Tuple[str, ...]]:
+    """
+    Compile a set of literal phrases into one scan for every position where
+    any of them starts, paired with the phrases in a fixed order.
+    """
+    # Zero-width lookahead so matches can overlap: "perfect for summer grilling"
+    # reports both 'perfect for summer' and 'summer grilling'
+    ordered = tuple(sorted(phrases, key=lambda phrase: (-len(phrase), phrase)))
+    pattern = re.compile('(?=' + '|'.join(re.escape(phrase) for phrase in ordered) + ')')
+    return pattern, ordered
+
+
+_KICK_OFF_MATCHER = _phrase_matcher(_KICK_OFF_PHRASES)
+_SUMMER_MATCHER = _phrase_matcher(_SUMMER_PHRASES)
+_WINTER_MATCHER = _phrase_matcher(_WINTER_PHRASES)
+
+_NUMBERED_HEADING_RE = re.compile(r'^\d+\.')
 
 
 class ContentQAValidator:
@@ -15,10 +52,15 @@ class ContentQAValidator:
     Validates generated content for quality, completeness, and contextual appropriateness.
     """
 
-    def __init__(self):
+    def __init__(self, parse_cache_size: int = 32, use_selectolax: bool = True):
         self.validation_results = []
         self.errors = []
         self.warnings = []
+        # selectolax (C lexbor parser) when installed; BeautifulSoup otherwise
+        self.use_selectolax = use_selectolax and LexborHTMLParser is not None
+        # QA retry loops re-validate the same HTML (e.g. after metadata-only
+        # fixes), so parses are memoized per content string
+        self._parse_cached = functools.lru_cache(maxsize=parse_cache_size)(self._parse_content)
 
     def validate_article(
         self,
@@ -51,16 +93,19 @@ class ContentQAValidator:
         content = article_data.get('content', '')
         title = article_data.get('title', '')
 
+        # Parse the HTML once and share the result with every structural check
+        parsed = self._parse_cached(content)
+
         # 1. Basic content validation
         self._validate_basic_content(content, title)
 
         # 2. Word count validation
         expected_min_words = expected_elements.get('min_word_count', 2000) if expected_elements else 2000
-        self._validate_word_count(content, expected_min_words)
+        self._validate_word_count(parsed, expected_min_words)
 
         # 3. Recipe/list completeness validation
         if expected_elements and expected_elements.get('recipe_count'):
-            self._validate_recipe_completeness(content, expected_elements['recipe_count'], topic_title)
+            self._validate_recipe_completeness(parsed, expected_elements['recipe_count'], topic_title)
 
         # 4. Image placeholder validation
         if expected_elements and expected_elements.get('image_count'):
@@ -75,7 +120,7 @@ class ContentQAValidator:
             self._validate_temporal_context(content, title)
 
         # 7. Structure validation
-        self._validate_structure(content)
+        self._validate_structure(parsed)
 
         # 8. SEO metadata validation
         self._validate_seo_metadata(article_data)
@@ -92,6 +137,87 @@ class ContentQAValidator:
 
         return is_valid, report
 
+    def _parse_content(self, content: str) -> Dict:
+        """
+        Parse article HTML once and collect everything the structural checks need.
+
+        Returns:
+            Dict with the 'word_count', the 'headings' as (tag, text) pairs
+            (h2-h4, in document order), each heading's 'section_text' and
+            the number of lists.
+        """
+        if self.use_selectolax:
+            return self._parse_with_selectolax(content)
+        return self._parse_with_bs4(content)
+
+    def _parse_with_selectolax(self, content: str) -> Dict:
+        tree = LexborHTMLParser(content)
+        heading_nodes = []
+        list_count = 0
+        for node in tree.css('h2, h3, h4, ul, ol'):
+            if node.tag in ('ul', 'ol'):
+                list_count += 1
+            else:
+                heading_nodes.append(node)
+
+        # Text of the p/ul/ol/div siblings between each heading and the next
+        # heading. Each parent's children are walked once for all its headings.
+        sections = {}
+        walked_parents = set()
+        for heading in heading_nodes:
+            parent = heading.parent
+            if parent.mem_id in walked_parents:
+                continue
+            walked_parents.add(parent.mem_id)
+            current = None
+            for child in parent.iter(include_text=False):
+                if child.tag in ('h2', 'h3', 'h4'):
+                    current = sections.setdefault(child.mem_id, [])
+                elif current is not None and child.tag in ('p', 'ul', 'ol', 'div'):
+                    current.append(child.text())
+
+        body = tree.body
+        return {
+            'word_count': len(body.text().split()) if body is not None else 0,
+            'headings': [(h.tag, h.text()) for h in heading_nodes],
+            'section_text': [' '.join(sections.get(h.mem_id, [])).strip() for h in heading_nodes],
+            'list_count': list_count
+        }
+
+    def _parse_with_bs4(self, content: str) -> Dict:
+        # bs4 is only needed when selectolax is unavailable or disabled
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(content, 'html.parser')
+        heading_nodes = []
+        list_count = 0
+        for node in soup.find_all(['h2', 'h3', 'h4', 'ul', 'ol']):
+            if node.name in ('ul', 'ol'):
+                list_count += 1
+            else:
+                heading_nodes.append(node)
+
+        sections = {}
+        walked_parents = set()
+        for heading in heading_nodes:
+            parent = heading.parent
+            if id(parent) in walked_parents:
+                continue
+            walked_parents.add(id(parent))
+            current = None
+            for child in parent.children:
+                if child.name in ('h2', 'h3', 'h4'):
+                    current = sections.setdefault(id(child), [])
+                elif current is not None and child.name in ('p', 'ul', 'ol', 'div'):
+                    current.append(child.get_text())
+
+        return {
+            'word_count': len(soup.get_text().split()),
+            'headings': [(h.name, h.get_text()) for h in heading_nodes],
+            'section_text': [' '.join(sections.get(id(h), [])).strip() for h in heading_nodes],
+            'list_count': list_count
+        }
+
     def _validate_basic_content(self, content: str, title: str):
         """Validate basic content requirements."""
         if not content or len(content.strip()) == 0:
@@ -104,12 +230,9 @@ class ContentQAValidator:
         else:
             self.validation_results.append("✅ Title is present")
 
-    def _validate_word_count(self, content: str, min_word_count: int):
+    def _validate_word_count(self, parsed: Dict, min_word_count: int):
         """Validate minimum word count."""
-        # Strip HTML and count words
-        soup = BeautifulSoup(content, 'html.parser')
-        text = soup.get_text()
-        word_count = len(text.split())
+        word_count = parsed['word_count']
 
         if word_count < min_word_count:
             self.errors.append(
@@ -120,27 +243,28 @@ class ContentQAValidator:
                 f"✅ Word count sufficient: {word_count} words (minimum: {min_word_count})"
             )
 
-    def _validate_recipe_completeness(self, content: str, expected_count: int, topic_title: str):
+    def _validate_recipe_completeness(self, parsed: Dict, expected_count: int, topic_title: str):
         """
         Validate that all promised recipes/items are complete with full content.
 
         This checks for incomplete recipes that are just headers with no actual content.
         """
-        soup = BeautifulSoup(content, 'html.parser')
-
         # Find all recipe sections (typically H3 headers for individual recipes)
-        recipe_headers = soup.find_all(['h3', 'h4'])
+        recipe_headers = [
+            (header, section) for (tag, header), section in zip(parsed['headings'], parsed['section_text'])
+            if tag in ('h3', 'h4')
+        ]
 
         # Filter to likely recipe headers based on numbering or recipe-related keywords
         recipe_keywords = ['recipe', 'dish', 'meal', 'breakfast', 'lunch', 'dinner', 'dessert', 'snack']
         likely_recipes = []
 
-        for header in recipe_headers:
-            header_text = header.get_text().lower()
+        for header, section_text in recipe_headers:
+            header_text = header.lower()
             # Check if it's numbered (1., 2., etc.) or contains recipe keywords
-            if (re.match(r'^\d+\.', header_text.strip()) or
+            if (_NUMBERED_HEADING_RE.match(header_text.strip()) or
                 any(keyword in header_text for keyword in recipe_keywords)):
-                likely_recipes.append(header)
+                likely_recipes.append((header, section_text))
 
         found_count = len(likely_recipes)
 
@@ -155,23 +279,12 @@ class ContentQAValidator:
 
         # Check each recipe for completeness
         incomplete_recipes = []
-        for i, recipe_header in enumerate(likely_recipes[:expected_count], 1):
-            # Get content after this header until the next header
-            recipe_content = []
-            next_element = recipe_header.find_next_sibling()
-
-            while next_element and next_element.name not in ['h2', 'h3', 'h4']:
-                if next_element.name in ['p', 'ul', 'ol', 'div']:
-                    recipe_content.append(next_element.get_text())
-                next_element = next_element.find_next_sibling()
-
+        for i, (recipe_header, content_text) in enumerate(likely_recipes[:expected_count], 1):
             # Check if recipe has substantial content (at least 100 chars of actual recipe content)
-            content_text = ' '.join(recipe_content).strip()
-
             if len(content_text) < 100:
                 incomplete_recipes.append({
                     'number': i,
-                    'header': recipe_header.get_text()[:50],
+                    'header': recipe_header[:50],
                     'content_length': len(content_text)
                 })
 
@@ -188,8 +301,8 @@ class ContentQAValidator:
     def _validate_images(self, content: str, expected_count: int):
         """Validate image presence and handling."""
         # Count both image tags and image placeholders
-        img_tags = len(re.findall(r'<img[^>]+>', content))
-        img_placeholders = len(re.findall(r'\[Image:[^\]]+\]', content))
+        img_tags = content.count('<img')
+        img_placeholders = content.count('[Image:')
 
         total_images = img_tags + img_placeholders
 
@@ -209,8 +322,8 @@ class ContentQAValidator:
 
     def _validate_tables(self, content: str, expected_count: int):
         """Validate table presence."""
-        table_count = len(re.findall(r'<table[^>]*>', content))
-        table_placeholders = len(re.findall(r'\[Table:[^\]]+\]', content))
+        table_count = content.count('<table')
+        table_placeholders = content.count('[Table:')
 
         total_tables = table_count + table_placeholders
 
@@ -245,30 +358,17 @@ class ContentQAValidator:
 
         # "Kick off the year" language is only appropriate in early January
         if not (month == 1 and day <= 15):
-            kick_off_phrases = [
-                'kick off the year',
-                'kick the year off',
-                'start the year right',
-                'begin the year',
-                'start of the year',
-                'new year resolution'
-            ]
-            for phrase in kick_off_phrases:
-                if phrase in content_lower:
-                    temporal_checks.append(f"Inappropriate phrase for {current_date.strftime('%B %d')}: '{phrase}'")
+            for phrase in self._find_phrases(_KICK_OFF_MATCHER, content_lower):
+                temporal_checks.append(f"Inappropriate phrase for {current_date.strftime('%B %d')}: '{phrase}'")
 
         # Check for summer language in winter and vice versa
         if month in [12, 1, 2]:  # Winter
-            summer_phrases = ['perfect for summer', 'summer grilling', 'hot summer day']
-            for phrase in summer_phrases:
-                if phrase in content_lower:
-                    temporal_checks.append(f"Summer reference in winter: '{phrase}'")
+            for phrase in self._find_phrases(_SUMMER_MATCHER, content_lower):
+                temporal_checks.append(f"Summer reference in winter: '{phrase}'")
 
         elif month in [6, 7, 8]:  # Summer
-            winter_phrases = ['cozy winter', 'cold weather', 'winter warming']
-            for phrase in winter_phrases:
-                if phrase in content_lower:
-                    temporal_checks.append(f"Winter reference in summer: '{phrase}'")
+            for phrase in self._find_phrases(_WINTER_MATCHER, content_lower):
+                temporal_checks.append(f"Winter reference in summer: '{phrase}'")
 
         if temporal_checks:
             self.warnings.append(
@@ -279,13 +379,25 @@ class ContentQAValidator:
                 f"✅ Temporal context appropriate for {current_date.strftime('%B %Y')}"
             )
 
-    def _validate_structure(self, content: str):
+    @staticmethod
+    def _find_phrases(matcher: Tuple["re.Pattern", Tuple[str, ...]], text: str) -> List[str]:
+        """
+        Return each distinct phrase found in text, including ones that overlap
+        another match, in order of first occurrence.
+        """
+        pattern, phrases = matcher
+        found = {}
+        for match in pattern.finditer(text):
+            start = match.start()
+            for phrase in phrases:
+                if phrase not in found and text.startswith(phrase, start):
+                    found[phrase] = None
+        return list(found)
+
+    def _validate_structure(self, parsed: Dict):
         """Validate HTML structure and formatting."""
-        soup = BeautifulSoup(content, 'html.parser')
-
         # Check for proper heading hierarchy
-        h2_count = len(soup.find_all('h2'))
-        h3_count = len(soup.find_all('h3'))
+        h2_count = sum(1 for tag, _ in parsed['headings'] if tag == 'h2')
 
         if h2_count < 3:
             self.warnings.append(
@@ -295,7 +407,7 @@ class ContentQAValidator:
             self.validation_results.append(f"✅ Good H2 structure: {h2_count} sections")
 
         # Check for lists
-        list_count = len(soup.find_all(['ul', 'ol']))
+        list_count = parsed['list_count']
         if list_count < 2:
             self.warnings.append("Few lists found - consider adding more bullet points")
         else:
@@ -350,30 +462,27 @@ class ContentQAValidator:
 
     def print_report(self, report: Dict):
         """Pretty print the validation report."""
-        print("\n" + "="*80)
-        print("📋 CONTENT QA VALIDATION REPORT")
-        print("="*80)
-        print(f"\n{report['summary']}\n")
+        # Build the report up front and emit it with a single write
+        rule = "=" * 80
+        lines = ["", rule, "📋 CONTENT QA VALIDATION REPORT", rule, f"\n{report['summary']}\n"]
 
         if report['errors']:
-            print("❌ ERRORS (MUST FIX):")
-            for error in report['errors']:
-                print(f"   - {error}")
-            print()
+            lines.append("❌ ERRORS (MUST FIX):")
+            lines.extend(f"   - {error}" for error in report['errors'])
+            lines.append("")
 
         if report['warnings']:
-            print("⚠️  WARNINGS (SHOULD FIX):")
-            for warning in report['warnings']:
-                print(f"   - {warning}")
-            print()
+            lines.append("⚠️  WARNINGS (SHOULD FIX):")
+            lines.extend(f"   - {warning}" for warning in report['warnings'])
+            lines.append("")
 
         if report['validation_results']:
-            print("✅ PASSED CHECKS:")
-            for result in report['validation_results']:
-                print(f"   {result}")
-            print()
+            lines.append("✅ PASSED CHECKS:")
+            lines.extend(f"   {result}" for result in report['validation_results'])
+            lines.append("")
 
-        print("="*80)
-        print()
+        lines.append(rule)
+        lines.append("")
+        print("\n".join(lines))
 
         return report['is_valid']
@@ -0,0 +1,42 @@
+"""
+Shared API clients for the AI Content Engine.
+
+Each SDK client owns its own HTTP connection pool, so building one per
+component (scorer, optimizer, media, analyzer) repeats the TLS handshake and
+keeps several idle pools open. These helpers hand out one client per key.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+
+# Retries for transient Anthropic API errors (rate limits, overload), sync and async
+ANTHROPIC_MAX_RETRIES = 3
+
+
+@lru_cache(maxsize=4)
+def get_anthropic_client(api_key: str):
+    """Return the shared anthropic.Anthropic client for this API key."""
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key, max_retries=ANTHROPIC_MAX_RETRIES)
+
+
+def new_async_anthropic_client(api_key: str):
+    """
+    Return a new anthropic.AsyncAnthropic client with the same settings as
+    get_anthropic_client().
+
+    Not shared: an async client's connection pool belongs to the event loop
+    it is first used on, so callers create one on first use and keep it.
+    """
+    import anthropic
+    return anthropic.AsyncAnthropic(api_key=api_key, max_retries=ANTHROPIC_MAX_RETRIES)
+
+
+@lru_cache(maxsize=4)
+def get_genai_client(api_key: str, api_version: Optional[str] = None):
+    """Return the shared google.genai Client for this API key and API version."""
+    from google import genai
+    if api_version:
+        return genai.Client(api_key=api_key, http_options={'api_version': api_version})
+    return genai.Client(api_key=api_key)
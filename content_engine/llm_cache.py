@@ -0,0 +1,77 @@
+"""
+Response cache for the AI Content Engine's Claude calls.
+
+Regeneration loops and QA retries often resend an identical prompt; a hit
+skips the API round trip entirely. Entries are matched exactly on a SHA-256
+of the request, kept in an in-memory LRU, and optionally persisted to SQLite
+so they survive restarts.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class LLMCache:
+    """
+    Exact-match LRU cache of LLM responses with optional SQLite persistence.
+    """
+
+    def __init__(self, max_entries: int = 256, db_path: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, hit_count INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the request fields (model, limits, system, prompt) into a cache key."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\x1f')  # field separator so ("ab", "c") != ("a", "bc")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+                if row:
+                    response = row[0]
+                    self._remember(key, response)
+            if response is not None and self._db is not None:
+                self._db.execute("UPDATE responses SET hit_count = hit_count + 1 WHERE key = ?", (key,))
+                self._db.commit()
+        return response
+
+    def set(self, key: str, response: str):
+        """Store a response, evicting the least recently used entry if full."""
+        with self._lock:
+            self._remember(key, response)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, hit_count) VALUES (?, ?, 0)",
+                    (key, response)
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, response: str):
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -1,8 +1,20 @@
 import logging
 import os
-import anthropic
-from google import genai
-from google.genai import types
+import re
+
+from content_engine.clients import get_anthropic_client, get_genai_client
+
+# Seconds a streamed response may go without sending data before it is aborted
+STREAM_IDLE_TIMEOUT = 30.0
+
+# Longest edge (px) of images sent to Gemini Vision for alt text
+ALT_TEXT_MAX_EDGE = 768
+
+# File extension for each supported Imagen output format
+_MIME_EXTENSIONS = {"image/jpeg": "jpg", "image/png": "png"}
+
+# Characters dropped from titles when building image filenames
+_SLUG_STRIP_RE = re.compile(r"[^\w \-]")
 
 class MediaEngine:
     """
@@ -11,13 +23,20 @@ class MediaEngine:
     Uses Google Gemini 3 (Imagen 4) for images and Claude Sonnet 4.5 for prompting.
     """
 
-    def __init__(self, api_key=None, anthropic_key=None):
+    def __init__(self, api_key=None, anthropic_key=None, output_mime_type: str = "image/jpeg"):
         self.logger = logging.getLogger(__name__)
+
+        # JPEG is roughly half the size of PNG for photos and is what the
+        # WordPress uploader declares; use "image/png" only when transparency matters.
+        self.output_mime_type = output_mime_type
         
         # Gemini setup
+        # SDKs are imported only when a key is present; mock mode stays lightweight
         self.api_key = api_key or os.getenv("GOOGLE_GEMINI_API_KEY")
         if self.api_key:
-            self.client = genai.Client(api_key=self.api_key, http_options={'api_version': 'v1alpha'})
+            from google.genai import types
+            self._genai_types = types
+            self.client = get_genai_client(self.api_key, api_version='v1alpha')
         else:
             self.logger.warning("No Google Gemini API Key found. MediaEngine running in MOCK mode.")
             self.client = None
@@ -25,7 +44,7 @@ class MediaEngine:
         # Claude setup for Prompt Engineering
         self.anthropic_key = anthropic_key or os.getenv("ANTHROPIC_API_KEY")
         if self.anthropic_key:
-            self.claude = anthropic.Anthropic(api_key=self.anthropic_key)
+            self.claude = get_anthropic_client(self.anthropic_key)
         else:
             self.claude = None
 
@@ -52,13 +71,14 @@ class MediaEngine:
         )
         
         try:
-            msg = self.claude.messages.create(
+            with self.claude.messages.stream(
                 model="claude-sonnet-4-5-20250929",
                 max_tokens=200,
                 system=system,
-                messages=[{"role": "user", "content": user_prompt}]
-            )
-            return msg.content[0].text
+                messages=[{"role": "user", "content": user_prompt}],
+                timeout=STREAM_IDLE_TIMEOUT
+            ) as stream:
+                return "".join(stream.text_stream)
         except Exception as e:
             self.logger.error(f"Claude Prompt Gen Error: {e}")
             return f"A delicious, cinematic outdoor photo of {title}"
@@ -80,10 +100,10 @@ class MediaEngine:
             response = self.client.models.generate_images(
                 model='models/imagen-4.0-generate-preview-06-06',
                 prompt=creative_prompt,
-                config=types.GenerateImagesConfig(
+                config=self._genai_types.GenerateImagesConfig(
                     number_of_images=1,
                     aspect_ratio="16:9", # Enforce Landscape
-                    output_mime_type="image/png"
+                    output_mime_type=self.output_mime_type
                 )
             )
             
@@ -97,9 +117,10 @@ class MediaEngine:
                 if target_keyword:
                     base_name = target_keyword.replace(" ", "-").lower()
                 else:
-                    base_name = "".join(x for x in title if x.isalnum() or x in " -_").replace(" ", "-").lower()
+                    base_name = _SLUG_STRIP_RE.sub("", title).replace(" ", "-").lower()
                 
-                filename = os.path.join(output_dir, f"{base_name}.png")
+                extension = _MIME_EXTENSIONS.get(self.output_mime_type, "png")
+                filename = os.path.join(output_dir, f"{base_name}.{extension}")
                 
                 with open(filename, "wb") as f:
                     f.write(image_bytes)
@@ -123,9 +144,18 @@ class MediaEngine:
         self.logger.info(f"👁️ Generating Alt-Text via Vision for: {image_path}")
         
         try:
-            # Load the image
+            # Load the image and downscale it: the vision model resizes internally,
+            # so uploading the full-resolution PNG only wastes bandwidth.
+            import io
             import PIL.Image
-            img = PIL.Image.open(image_path)
+            with PIL.Image.open(image_path) as img:
+                img.draft('RGB', (ALT_TEXT_MAX_EDGE, ALT_TEXT_MAX_EDGE))
+                img.thumbnail((ALT_TEXT_MAX_EDGE, ALT_TEXT_MAX_EDGE), PIL.Image.LANCZOS)
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                buffer = io.BytesIO()
+                img.save(buffer, format='JPEG', quality=85, optimize=True)
+            image_part = self._genai_types.Part.from_bytes(data=buffer.getvalue(), mime_type='image/jpeg')
             
             # Call Gemini Vision (using the same client)
             response = self.client.models.generate_content(
@@ -133,7 +163,7 @@ class MediaEngine:
                 contents=[
                     f"Write a concise, SEO-friendly alt-text for this image in the context of: '{context}'. "
                     f"Do not use phrases like 'image of' or 'picture of'. Maximum 125 characters.",
-                    img
+                    image_part
                 ]
             )
             
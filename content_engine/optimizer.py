@@ -1,11 +1,57 @@
+import asyncio
 import logging
 import os
+import re
+import time
 from urllib.parse import urlparse
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-import anthropic
-import markdown
 from analysis.competitive_analyzer import CompetitiveAnalyzer
+from content_engine.clients import get_anthropic_client, new_async_anthropic_client
+from content_engine.llm_cache import LLMCache
+
+# Seconds a streamed response may go without sending data before it is aborted
+STREAM_IDLE_TIMEOUT = 30.0
+
+# Log streaming progress every this many (estimated) output tokens
+PROGRESS_LOG_TOKENS = 1000
+
+# Estimated fusion output (of 8192 max) after which the async path starts
+# generating the truncation-repair conclusion speculatively
+SPECULATIVE_CONCLUSION_TOKENS = 7000
+
+# Returned by every writer when no API key is configured
+MOCK_RESPONSE = "MOCK_RESPONSE: API Key missing."
+
+# Headings/phrases that show a fused article reached its closing section
+_CONCLUSION_MARKER_RE = re.compile(
+    r'final verdict|conclusion|closing thoughts|bottom line|the winner is|my recommendation|in summary',
+    re.IGNORECASE
+)
+
+_CODE_FENCE_RE = re.compile(r'```(?:html)?')
+
+_FUSION_SYSTEM = (
+    "You are a Senior SEO Content Editor. Your job is to 'fuse' a blog post with competitive intelligence. "
+    "You MUST keep the original author's authentic voice and key stories, but improve the structure, "
+    "add missing facts from the brief, and integrate a comparison table naturally. "
+    "Output valid HTML that is compatible with the WordPress Block Editor.\n\n"
+    "Current Date: December 2025. This post MUST be framed as a '2026 Guide'.\n\n"
+    "INSTRUCTIONS:\n"
+    "1. Rewrite the content to be comprehensive but CONCISE. Prioritize signal over noise.\n"
+    "2. Integrate the comparison table where it makes the most sense (not just at the bottom).\n"
+    "3. Use ONLY <h2> and <h3> tags for a better hierarchy. NEVER use <h1> as the theme renders it automatically.\n"
+    "4. NEVER repeat the main post title at the beginning of your response. Start directly with the intro paragraph.\n"
+    "5. Ensure the first paragraph is punchy and includes the target keyword early.\n"
+    "6. All year references MUST be 2026.\n"
+    "7. **CRITICAL**: You MUST finish the article. If you are approaching your output limit, wrap up the current point quickly and provide a proper 'Conclusion' section. NEVER leave a sentence unfinished.\n"
+    "8. Return ONLY raw HTML content. DO NOT use markdown code fences."
+)
 
 class ContentOptimizer:
     """
@@ -14,16 +60,20 @@ class ContentOptimizer:
     Uses Anthropic (Claude 3.5 Sonnet) for high-quality generation.
     """
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache: Optional[LLMCache] = None):
         self.logger = logging.getLogger(__name__)
+        # Opt-in: replies are sampled (temperature 0.7), so a cache replays one
+        # sample for identical requests (regeneration loops, QA retries)
+        self.cache = cache
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if self.api_key:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            self.client = get_anthropic_client(self.api_key)
             self.analyzer = CompetitiveAnalyzer(api_key=self.api_key)
         else:
             self.logger.warning("No Anthropic API Key found. Optimizer running in MOCK mode.")
             self.client = None
             self.analyzer = None
+        self._aclient = None
         
         # Updated to Sonnet 4.5
         self.model = "claude-sonnet-4-5-20250929"
@@ -31,17 +81,103 @@ class ContentOptimizer:
     def _call_claude(self, system: str, user_prompt: str, max_tokens: int = 1024) -> str:
         """Helper to call Claude API."""
         if not self.client:
-            return "MOCK_RESPONSE: API Key missing."
+            return MOCK_RESPONSE
+
+        cache_key = LLMCache.make_key(self.model, str(max_tokens), system, user_prompt)
+        cached = self.cache.get(cache_key) if self.cache is not None else None
+        if cached is not None:
+            self.logger.info("Claude response served from cache.")
+            return cached
         
         try:
-            message = self.client.messages.create(
+            # Stream so long generations report progress and a stalled
+            # connection fails after STREAM_IDLE_TIMEOUT seconds without data
+            # (the SDK's read timeout acts as the dead-man switch).
+            chunks = []
+            received_chars = 0
+            next_progress = PROGRESS_LOG_TOKENS
+            started = time.monotonic()
+            with self.client.messages.stream(
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=0.7,
                 system=system,
-                messages=[{"role": "user", "content": user_prompt}]
-            )
-            return message.content[0].text
+                messages=[{"role": "user", "content": user_prompt}],
+                timeout=STREAM_IDLE_TIMEOUT
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    received_chars += len(text)
+                    # ~4 characters per token is close enough for progress logs
+                    if received_chars // 4 >= next_progress:
+                        self.logger.info(f"Claude streaming... ~{next_progress} tokens")
+                        next_progress += PROGRESS_LOG_TOKENS
+                stop_reason = stream.get_final_message().stop_reason
+
+            if stop_reason == "max_tokens":
+                self.logger.warning(f"Claude response hit max_tokens ({max_tokens}); output is truncated.")
+            self.logger.debug(f"Claude response complete in {time.monotonic() - started:.1f}s")
+            response = "".join(chunks)
+            self._cache_reply(cache_key, response, stop_reason)
+            return response
+        except Exception as e:
+            self.logger.error(f"Anthropic API Error: {e}")
+            return f"ERROR: {e}"
+
+    def _cache_reply(self, cache_key: str, response: str, stop_reason: Optional[str]):
+        """Cache only complete replies; a truncated one would be replayed forever."""
+        if self.cache is not None and stop_reason == "end_turn":
+            self.cache.set(cache_key, response)
+
+    async def _acall_claude(
+        self,
+        system: str,
+        user_prompt: str,
+        max_tokens: int = 1024,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> str:
+        """
+        Async twin of _call_claude() using AsyncAnthropic; shares the response cache (if any).
+
+        on_progress, if given, is called with the estimated number of output
+        tokens received so far after each streamed chunk.
+        """
+        if not self.client:
+            return MOCK_RESPONSE
+
+        cache_key = LLMCache.make_key(self.model, str(max_tokens), system, user_prompt)
+        cached = self.cache.get(cache_key) if self.cache is not None else None
+        if cached is not None:
+            self.logger.info("Claude response served from cache.")
+            return cached
+
+        if self._aclient is None:
+            # Created on first use: async HTTP pools belong to the running event loop
+            self._aclient = new_async_anthropic_client(self.api_key)
+
+        try:
+            chunks = []
+            received_chars = 0
+            async with self._aclient.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                system=system,
+                messages=[{"role": "user", "content": user_prompt}],
+                timeout=STREAM_IDLE_TIMEOUT
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    if on_progress is not None:
+                        received_chars += len(text)
+                        on_progress(received_chars // 4)
+                stop_reason = (await stream.get_final_message()).stop_reason
+
+            if stop_reason == "max_tokens":
+                self.logger.warning(f"Claude response hit max_tokens ({max_tokens}); output is truncated.")
+            response = "".join(chunks)
+            self._cache_reply(cache_key, response, stop_reason)
+            return response
         except Exception as e:
             self.logger.error(f"Anthropic API Error: {e}")
             return f"ERROR: {e}"
@@ -50,6 +186,32 @@ class ContentOptimizer:
         """
         Rewrites a page title to improve CTR and include the target keyword.
         """
+        if not self.client:
+            return MOCK_RESPONSE
+        self.logger.info(f"Optimizing title: {current_title}")
+        return self._call_claude(*self.title_task(current_title, target_keyword, competitive_brief))
+
+    def generate_comparison_table(self, topic: str, products: List[str]) -> str:
+        """
+        Generates a Markdown comparison table for a list of products.
+        """
+        if not self.client:
+            return MOCK_RESPONSE
+        self.logger.info(f"Generating table for: {topic}")
+        return self._call_claude(*self.table_task(topic, products))
+
+    def expand_section(self, heading: str, context_points: List[str]) -> str:
+        """
+        Writes a comprehensive paragraph for a specific heading.
+        """
+        if not self.client:
+            return MOCK_RESPONSE
+        self.logger.info(f"Expanding section: {heading}")
+        return self._call_claude(*self.section_task(heading, context_points))
+
+    @staticmethod
+    def title_task(current_title: str, target_keyword: str, competitive_brief: Optional[str] = None) -> Tuple[str, str]:
+        """(system, prompt) pair for rewrite_title(); also usable with batch_rewrite()."""
         context_str = f"\nCompetitive Analysis Context:\n{competitive_brief}" if competitive_brief else ""
         system = "You are an expert SEO Copywriter. You write catchy, high-CTR titles that are under 60 characters."
         prompt = (
@@ -61,14 +223,11 @@ class ContentOptimizer:
             f"{context_str}\n"
             f"Return ONLY the new title text, no quotes or explanations."
         )
-        
-        self.logger.info(f"Optimizing title: {current_title}")
-        return self._call_claude(system, prompt)
+        return system, prompt
 
-    def generate_comparison_table(self, topic: str, products: List[str]) -> str:
-        """
-        Generates a Markdown comparison table for a list of products.
-        """
+    @staticmethod
+    def table_task(topic: str, products: List[str]) -> Tuple[str, str]:
+        """(system, prompt) pair for generate_comparison_table(); also usable with batch_rewrite()."""
         product_list = ", ".join(products)
         system = "You are a specialized Product Review Editor. You verify specs and create accurate comparison tables."
         prompt = (
@@ -76,14 +235,11 @@ class ContentOptimizer:
             f"Columns: Product Name, Key Feature (2-3 words), Rating (1-5), Price Range ($-$$$$). "
             f"Ensure to mention specific unique features for each. Return ONLY the Markdown table."
         )
-        
-        self.logger.info(f"Generating table for: {topic}")
-        return self._call_claude(system, prompt)
+        return system, prompt
 
-    def expand_section(self, heading: str, context_points: List[str]) -> str:
-        """
-        Writes a comprehensive paragraph for a specific heading.
-        """
+    @staticmethod
+    def section_task(heading: str, context_points: List[str]) -> Tuple[str, str]:
+        """(system, prompt) pair for expand_section(); also usable with batch_rewrite()."""
         context = "\n- ".join(context_points)
         system = "You are an expert Outdoor Cooking Writer. Your tone is helpful, authoritative, and enthusiastic."
         prompt = (
@@ -91,85 +247,283 @@ class ContentOptimizer:
             f"Use these context points:\n- {context}\n"
             f"Write in short, readable paragraphs. Use bolding for key terms. Return ONLY the content."
         )
-        
-        self.logger.info(f"Expanding section: {heading}")
-        return self._call_claude(system, prompt)
+        return system, prompt
+
+    def batch_rewrite(self, tasks: Dict[str, Tuple[str, str]], max_tokens_per_task: int = 1024) -> Dict[str, str]:
+        """
+        Runs several independent writing tasks in a single Claude request.
+
+        Args:
+            tasks: Mapping of task id -> (system, prompt), e.g. from title_task(),
+                table_task() or section_task()
+            max_tokens_per_task: Output budget reserved for each task
+
+        Returns:
+            Mapping of task id -> result text. If the combined reply cannot be
+            parsed, each task is retried with its own call.
+        """
+        if not tasks:
+            return {}
+        if not self.client:
+            return {task_id: MOCK_RESPONSE for task_id in tasks}
+        if len(tasks) == 1:
+            task_id, (system, prompt) = next(iter(tasks.items()))
+            return {task_id: self._call_claude(system, prompt, max_tokens=max_tokens_per_task)}
+
+        task_blocks = "\n\n".join(
+            f"### TASK \"{task_id}\"\nRole: {system}\n{prompt}"
+            for task_id, (system, prompt) in tasks.items()
+        )
+        prompt = (
+            f"Complete each of the following {len(tasks)} independent tasks.\n\n"
+            f"{task_blocks}\n\n"
+            f"Return ONLY a JSON object whose keys are the task ids "
+            f"({', '.join(tasks)}) and whose values are each task's output as a string."
+        )
+
+        self.logger.info(f"Running {len(tasks)} writing tasks in one request: {', '.join(tasks)}")
+        response = self._call_claude(
+            "You are an expert SEO content team. Follow each task's role and instructions exactly.",
+            prompt,
+            max_tokens=min(max_tokens_per_task * len(tasks), 8192)
+        )
+
+        try:
+            start = response.find('{')
+            end = response.rfind('}') + 1
+            results = json_loads(response[start:end]) if start != -1 else {}
+        except ValueError:
+            results = {}
+
+        # Anything missing from the combined reply gets its own call
+        for task_id, (system, prompt) in tasks.items():
+            if not isinstance(results.get(task_id), str):
+                self.logger.warning(f"Batched reply missing task '{task_id}'. Retrying individually...")
+                results[task_id] = self._call_claude(system, prompt, max_tokens=max_tokens_per_task)
+
+        return {task_id: results[task_id] for task_id in tasks}
+
+    def run_batch(
+        self,
+        tasks: Dict[str, Tuple[str, str]],
+        max_tokens: int = 1024,
+        poll_interval: float = 30.0
+    ) -> Dict[str, str]:
+        """
+        Runs many independent (system, prompt) tasks through the Message Batches API.
+
+        Meant for pipelines processing many articles: batches cost half as much
+        per token and are not bound by per-request latency, but can take
+        minutes to complete. Tasks that fail in the batch fall back to
+        _call_claude().
+
+        Args:
+            tasks: Mapping of task id -> (system, prompt)
+            max_tokens: Output budget for each task
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Mapping of task id -> result text
+        """
+        if not tasks:
+            return {}
+        if not self.client:
+            return {task_id: MOCK_RESPONSE for task_id in tasks}
+
+        # Batch custom_ids are restricted to [A-Za-z0-9_-], so map them to our ids
+        id_map = {f"task-{i}": task_id for i, task_id in enumerate(tasks)}
+        results = {}
+        try:
+            batch = self.client.messages.batches.create(requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": max_tokens,
+                        "temperature": 0.7,
+                        "system": tasks[task_id][0],
+                        "messages": [{"role": "user", "content": tasks[task_id][1]}]
+                    }
+                }
+                for custom_id, task_id in id_map.items()
+            ])
+            self.logger.info(f"Submitted Claude batch {batch.id} with {len(tasks)} tasks")
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                task_id = id_map.get(entry.custom_id)
+                if task_id is not None and entry.result.type == "succeeded":
+                    results[task_id] = "".join(
+                        block.text for block in entry.result.message.content if block.type == "text"
+                    )
+                    system, prompt = tasks[task_id]
+                    self._cache_reply(
+                        LLMCache.make_key(self.model, str(max_tokens), system, prompt),
+                        results[task_id],
+                        entry.result.message.stop_reason
+                    )
+        except Exception as e:
+            self.logger.error(f"Claude batch failed, falling back to individual calls: {e}")
+
+        for task_id, (system, prompt) in tasks.items():
+            if task_id not in results:
+                results[task_id] = self._call_claude(system, prompt, max_tokens=max_tokens)
+        return {task_id: results[task_id] for task_id in tasks}
+
+    def batch_rewrite_titles(self, jobs: Dict[str, Dict], **kwargs) -> Dict[str, str]:
+        """run_batch() over rewrite_title() jobs: {job id: rewrite_title kwargs}."""
+        return self.run_batch({job_id: self.title_task(**job) for job_id, job in jobs.items()}, **kwargs)
+
+    def batch_generate_tables(self, jobs: Dict[str, Dict], **kwargs) -> Dict[str, str]:
+        """run_batch() over generate_comparison_table() jobs: {job id: kwargs}."""
+        return self.run_batch({job_id: self.table_task(**job) for job_id, job in jobs.items()}, **kwargs)
+
+    def batch_expand_sections(self, jobs: Dict[str, Dict], **kwargs) -> Dict[str, str]:
+        """run_batch() over expand_section() jobs: {job id: expand_section kwargs}."""
+        return self.run_batch({job_id: self.section_task(**job) for job_id, job in jobs.items()}, **kwargs)
 
     def smart_fusion(self, original_html: str, competitive_brief: str, table_md: str) -> str:
         """
         Performs a semantic fusion of original content with strategic insights.
         Returns a complete, optimized HTML body.
         """
-        system = (
-            "You are a Senior SEO Content Editor. Your job is to 'fuse' a blog post with competitive intelligence. "
-            "You MUST keep the original author's authentic voice and key stories, but improve the structure, "
-            "add missing facts from the brief, and integrate a comparison table naturally. "
-            "Output valid HTML that is compatible with the WordPress Block Editor."
-        )
+        # Skip building the (article-sized) prompt when it would not be sent
+        if not self.client:
+            return MOCK_RESPONSE
+        self.logger.info("🔥 Performing Full-Body Smart Fusion (High-Token Mode)...")
+        raw_output = self._call_claude(*self._fusion_task(original_html, competitive_brief, table_md), max_tokens=8192)
+
+        raw_output, truncated = self._trim_truncated_fusion(raw_output)
+        if truncated:
+            conclusion = self._call_claude(*self._conclusion_task(competitive_brief), max_tokens=800)
+            raw_output = self._append_conclusion(raw_output, conclusion)
+
+        return raw_output
+
+    async def asmart_fusion(self, original_html: str, competitive_brief: str, table_md: str) -> str:
+        """
+        Async twin of smart_fusion(), so a pipeline can fuse several articles
+        concurrently (see asmart_fusion_many()).
+        """
+        if not self.client:
+            return MOCK_RESPONSE
+        self.logger.info("🔥 Performing Full-Body Smart Fusion (High-Token Mode)...")
+
+        # The conclusion prompt depends only on the brief, so once the fusion
+        # nears its output limit (where truncation happens) start writing the
+        # conclusion speculatively, hiding its latency under the stream's tail.
+        conclusion_job = None
+
+        def prefetch_conclusion(tokens: int):
+            nonlocal conclusion_job
+            if conclusion_job is None and tokens >= SPECULATIVE_CONCLUSION_TOKENS:
+                self.logger.info("Fusion nearing its token limit; prefetching conclusion...")
+                conclusion_job = asyncio.create_task(
+                    self._acall_claude(*self._conclusion_task(competitive_brief), max_tokens=800)
+                )
+
+        try:
+            raw_output = await self._acall_claude(
+                *self._fusion_task(original_html, competitive_brief, table_md),
+                max_tokens=8192,
+                on_progress=prefetch_conclusion
+            )
+
+            raw_output, truncated = self._trim_truncated_fusion(raw_output)
+            if truncated:
+                if conclusion_job is not None:
+                    conclusion = await conclusion_job
+                else:
+                    conclusion = await self._acall_claude(*self._conclusion_task(competitive_brief), max_tokens=800)
+                raw_output = self._append_conclusion(raw_output, conclusion)
+        finally:
+            # Article ended cleanly (or we failed): the speculative call is not needed
+            if conclusion_job is not None and not conclusion_job.done():
+                conclusion_job.cancel()
+
+        return raw_output
+
+    async def asmart_fusion_many(self, articles: List[Dict], concurrency: int = 4) -> List[str]:
+        """
+        Fuses several articles concurrently.
+
+        Args:
+            articles: List of dicts with smart_fusion() keyword arguments
+                (original_html, competitive_brief, table_md)
+            concurrency: Maximum number of fusions in flight at once
+
+        Returns:
+            Fused HTML bodies in the same order as articles
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fuse_one(article: Dict) -> str:
+            async with semaphore:
+                return await self.asmart_fusion(**article)
+
+        return await asyncio.gather(*(fuse_one(article) for article in articles))
+
+    @staticmethod
+    def _fusion_task(original_html: str, competitive_brief: str, table_md: str) -> Tuple[str, str]:
+        # Everything static lives in the system prompt; the user turn carries
+        # only the article, brief and table.
         prompt = (
-            f"Current Date: December 2025. This post MUST be framed as a '2026 Guide'.\n\n"
             f"Original Content (HTML):\n{original_html}\n\n"
             f"Competitive Analysis Brief:\n{competitive_brief}\n\n"
             f"Comparison Table (Markdown):\n{table_md}\n\n"
-            "INSTRUCTIONS:\n"
-            "1. Rewrite the content to be comprehensive but CONCISE. Prioritize signal over noise.\n"
-            "2. Integrate the comparison table where it makes the most sense (not just at the bottom).\n"
-            "3. Use ONLY <h2> and <h3> tags for a better hierarchy. NEVER use <h1> as the theme renders it automatically.\n"
-            "4. NEVER repeat the main post title at the beginning of your response. Start directly with the intro paragraph.\n"
-            "5. Ensure the first paragraph is punchy and includes the target keyword early.\n"
-            "6. All year references MUST be 2026.\n"
-            "7. **CRITICAL**: You MUST finish the article. If you are approaching your output limit, wrap up the current point quickly and provide a proper 'Conclusion' section. NEVER leave a sentence unfinished.\n"
-            "8. Return ONLY raw HTML content. DO NOT use markdown code fences."
+            "Fuse this content following your INSTRUCTIONS."
         )
-        
-        self.logger.info("🔥 Performing Full-Body Smart Fusion (High-Token Mode)...")
-        raw_output = self._call_claude(system, prompt, max_tokens=8192)
-        
-        # 🛡️ Truncation Safeguard: Detect incomplete articles and generate a proper conclusion
+        return _FUSION_SYSTEM, prompt
+
+    @staticmethod
+    def _conclusion_task(competitive_brief: str) -> Tuple[str, str]:
+        system = "You are a food blogger wrapping up an article. Be warm, helpful, and concise."
+        prompt = (
+            f"The following article about '{competitive_brief[:100]}...' was cut short. "
+            f"Write ONLY a brief, satisfying conclusion section (2-3 paragraphs max) that:\n"
+            f"1. Starts with an <h2>Final Verdict</h2> or similar\n"
+            f"2. Summarizes the key takeaway (which cut is best for what use case)\n"
+            f"3. Ends with a call-to-action or encouragement to try both\n"
+            f"Return ONLY raw HTML. NO markdown fences."
+        )
+        return system, prompt
+
+    def _trim_truncated_fusion(self, raw_output: str) -> Tuple[str, bool]:
+        """
+        🛡️ Truncation Safeguard: Detect incomplete articles.
+
+        Returns (output, truncated). When truncated, output is trimmed back to
+        its last complete sentence and a conclusion should be appended.
+        """
         stripped = raw_output.rstrip()
         
-        # Check if the article has a proper ending (conclusion section or final verdict)
-        has_conclusion = any(term in stripped.lower() for term in [
-            'final verdict', 'conclusion', 'closing thoughts', 'bottom line', 
-            'the winner is', 'my recommendation', 'in summary'
-        ])
-        
-        # Also check if it ends mid-sentence (no proper punctuation before closing tag)
+        # Check if it ends mid-sentence (no proper punctuation before closing tag),
+        # then whether the article has a proper ending (conclusion section or final verdict).
+        # One case-insensitive scan, no lowercased copy of the article.
         ends_properly = stripped.endswith(('>', '.', '!', '?'))
+        if ends_properly and _CONCLUSION_MARKER_RE.search(stripped):
+            return raw_output, False
+
+        self.logger.warning("⚠️ Article appears truncated. Generating conclusion section...")
         
-        if not has_conclusion or not ends_properly:
-            self.logger.warning("⚠️ Article appears truncated. Generating conclusion section...")
-            
-            # Trim to last complete sentence first
-            import re
-            last_period_tag = stripped.rfind('.</p>')
-            last_period = stripped.rfind('. ')
-            cut_point = max(last_period_tag, last_period)
-            if cut_point > len(stripped) // 2:
-                if last_period_tag > last_period:
-                    raw_output = stripped[:last_period_tag + 5]  # Include </p>
-                else:
-                    raw_output = stripped[:last_period + 1]
-            
-            # Generate a proper conclusion section
-            conclusion_prompt = (
-                f"The following article about '{competitive_brief[:100]}...' was cut short. "
-                f"Write ONLY a brief, satisfying conclusion section (2-3 paragraphs max) that:\n"
-                f"1. Starts with an <h2>Final Verdict</h2> or similar\n"
-                f"2. Summarizes the key takeaway (which cut is best for what use case)\n"
-                f"3. Ends with a call-to-action or encouragement to try both\n"
-                f"Return ONLY raw HTML. NO markdown fences."
-            )
-            conclusion = self._call_claude(
-                "You are a food blogger wrapping up an article. Be warm, helpful, and concise.",
-                conclusion_prompt,
-                max_tokens=800
-            )
-            
-            # Clean the conclusion
-            conclusion = re.sub(r'```(?:html)?', '', conclusion).replace('```', '').strip()
-            
-            raw_output = raw_output + "\n\n" + conclusion
-            self.logger.info("✅ Conclusion section added successfully.")
+        # Trim to last complete sentence first; only cuts in the second half count,
+        # so neither search needs to look further back than that
+        half = len(stripped) // 2
+        last_period_tag = stripped.rfind('.</p>', half)
+        last_period = stripped.rfind('. ', half)
+        cut_point = max(last_period_tag, last_period)
+        if cut_point > half:
+            if last_period_tag > last_period:
+                raw_output = stripped[:last_period_tag + 5]  # Include </p>
+            else:
+                raw_output = stripped[:last_period + 1]
+        return raw_output, True
+
+    def _append_conclusion(self, raw_output: str, conclusion: str) -> str:
+        # Clean the conclusion
+        conclusion = _CODE_FENCE_RE.sub('', conclusion).strip()
         
-        return raw_output
+        self.logger.info("✅ Conclusion section added successfully.")
+        return raw_output + "\n\n" + conclusion
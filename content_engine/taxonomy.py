@@ -1,6 +1,43 @@
 import logging
-import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+def _extract_json_array(text: str) -> Optional[str]:
+    """
+    Returns the first complete top-level JSON array in text, or None.
+
+    Scans once, tracking bracket depth and skipping brackets inside strings.
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '[':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif depth:
+            if ch == '"':
+                in_string = True
+            elif ch == ']':
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+    return None
+
 
 class TaxonomyManager:
     """
@@ -19,22 +56,9 @@ class TaxonomyManager:
         if not self.llm_client:
             return ["Uncategorized"]
 
-        categories_str = ", ".join(existing_categories)
-        system = "You are a WordPress Content Strategist. Select 1 or 2 most relevant categories."
-        prompt = (
-            f"Given this content summary: '{content_summary}'\n"
-            f"And these existing categories: {categories_str}\n"
-            f"Select the 1-2 most relevant categories. Return ONLY a JSON list of category names."
-        )
-
         try:
-            response = self.llm_client._call_claude(system, prompt)
-            # Find JSON in response
-            start = response.find('[')
-            end = response.rfind(']') + 1
-            if start != -1 and end != -1:
-                return json.loads(response[start:end])
-            return [existing_categories[0]] if existing_categories else ["Uncategorized"]
+            response = self.llm_client._call_claude(*self._categories_task(content_summary, existing_categories))
+            return self._parse_categories(response, existing_categories)
         except Exception as e:
             self.logger.error(f"Error suggesting categories: {e}")
             return ["Uncategorized"]
@@ -46,22 +70,79 @@ class TaxonomyManager:
         if not self.llm_client:
             return ["Grilling"]
 
+        try:
+            response = self.llm_client._call_claude(*self._tags_task(content_summary))
+            return self._parse_tags(response)
+        except Exception as e:
+            self.logger.error(f"Error generating tags: {e}")
+            return ["Grilling"]
+
+    def batch_taxonomy(self, content_summaries: List[str], existing_categories: List[str]) -> List[Dict]:
+        """
+        Suggests categories and tags for many posts in one Message Batches run.
+
+        Requires an llm_client with run_batch() (ContentOptimizer).
+
+        Returns:
+            List of {"categories": [...], "tags": [...]} in the same order as content_summaries
+        """
+        if not self.llm_client:
+            return [{"categories": ["Uncategorized"], "tags": ["Grilling"]} for _ in content_summaries]
+
+        tasks = {}
+        for i, summary in enumerate(content_summaries):
+            tasks[f"categories-{i}"] = self._categories_task(summary, existing_categories)
+            tasks[f"tags-{i}"] = self._tags_task(summary)
+        responses = self.llm_client.run_batch(tasks)
+
+        results = []
+        for i in range(len(content_summaries)):
+            try:
+                categories = self._parse_categories(responses[f"categories-{i}"], existing_categories)
+            except Exception as e:
+                self.logger.error(f"Error suggesting categories: {e}")
+                categories = ["Uncategorized"]
+            try:
+                tags = self._parse_tags(responses[f"tags-{i}"])
+            except Exception as e:
+                self.logger.error(f"Error generating tags: {e}")
+                tags = ["Grilling"]
+            results.append({"categories": categories, "tags": tags})
+        return results
+
+    @staticmethod
+    def _categories_task(content_summary: str, existing_categories: List[str]) -> Tuple[str, str]:
+        categories_str = ", ".join(existing_categories)
+        system = "You are a WordPress Content Strategist. Select 1 or 2 most relevant categories."
+        prompt = (
+            f"Given this content summary: '{content_summary}'\n"
+            f"And these existing categories: {categories_str}\n"
+            f"Select the 1-2 most relevant categories. Return ONLY a JSON list of category names."
+        )
+        return system, prompt
+
+    @staticmethod
+    def _tags_task(content_summary: str) -> Tuple[str, str]:
         system = "You are an SEO Expert. Generate relevant WordPress tags (3-5 max)."
         prompt = (
             f"Generate 3-5 high-traffic WordPress tags for this content: '{content_summary}'\n"
             f"Return ONLY a JSON list of strings."
         )
+        return system, prompt
 
-        try:
-            response = self.llm_client._call_claude(system, prompt)
-            start = response.find('[')
-            end = response.rfind(']') + 1
-            if start != -1 and end != -1:
-                return json.loads(response[start:end])
-            return ["Cooking", "Griddle"]
-        except Exception as e:
-            self.logger.error(f"Error generating tags: {e}")
-            return ["Grilling"]
+    @staticmethod
+    def _parse_categories(response: str, existing_categories: List[str]) -> List[str]:
+        array = _extract_json_array(response)
+        if array is not None:
+            return json_loads(array)
+        return [existing_categories[0]] if existing_categories else ["Uncategorized"]
+
+    @staticmethod
+    def _parse_tags(response: str) -> List[str]:
+        array = _extract_json_array(response)
+        if array is not None:
+            return json_loads(array)
+        return ["Cooking", "Griddle"]
 
     def suggest_internal_links(self, content_summary: str, pillar_pages: List[Dict]) -> List[Dict]:
         """
@@ -4,11 +4,16 @@ execution_scheduler.py
 Manages the execution of the action plan with scheduling and rate limiting.
 """
 
+import os
 import time
-from typing import List, Dict
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import csv
+from collections import Counter, deque
 from analysis.planners.rule_planner import ActionItem, ActionType
 from wordpress.publisher import WordPressPublisher, PublishResult
 from content.generators.claude_generator import ClaudeContentGenerator
@@ -21,11 +26,26 @@ class ScheduleConfig:
     posts_per_batch: int = 1
     delay_between_batches: float = 3600.0  # seconds (1 hour default)
     max_api_calls_per_minute: int = 10
+    max_concurrent_actions: int = 4  # actions in flight at once in "all_at_once" mode
+    interleave_action_types: bool = True  # round-robin action types instead of strict plan order
+
+
+logger = logging.getLogger(__name__)
+
+CSV_HEADERS = ['Timestamp', 'Action', 'Status', 'URL', 'Post ID', 'Error']
 
 
 class ExecutionScheduler:
     """Orchestrates the execution of the entire content plan."""
 
+    # Handler method for each action type
+    _DISPATCH = {
+        ActionType.DELETE: '_handle_delete',
+        ActionType.REDIRECT_301: '_handle_redirect',
+        ActionType.UPDATE: '_handle_update',
+        ActionType.CREATE: '_handle_create',
+    }
+
     def __init__(
         self,
         action_plan: List[ActionItem],
@@ -34,8 +54,17 @@ class ExecutionScheduler:
         schedule_config: ScheduleConfig,
         planner=None,
         state_manager=None,
-        affiliate_manager=None
+        affiliate_manager=None,
+        results_csv: Optional[str] = None,
+        results_window: Optional[int] = None
     ):
+        """
+        Args:
+            results_csv: If set, each result is appended to this CSV as soon as
+                its action finishes, so progress survives a crash mid-run
+            results_window: If set, keep only the most recent N results in
+                self.results (use with results_csv for very long plans)
+        """
         self.action_plan = action_plan
         self.wp_publisher = wp_publisher
         self.content_generator = content_generator
@@ -43,63 +72,126 @@ class ExecutionScheduler:
         self.planner = planner
         self.state_manager = state_manager
         self.affiliate_manager = affiliate_manager  # New: affiliate link manager
-        self.results: List[PublishResult] = []
-        self.api_call_count = 0
-        self.api_call_reset_time = time.time() + 60
+        self.results = deque(maxlen=results_window) if results_window else []
+        self.results_csv = results_csv
+        self._csv_file = None
+        self._csv_writer = None
+        # Running totals for get_summary (cover the whole run even with results_window)
+        self._success_count = 0
+        self._failed_count = 0
+        self._by_action_type = Counter()
+        # Per-run lookup caches: posts by URL (dropped once the post is changed)
+        # and internal link suggestions by keyword list
+        self._post_cache: Dict[str, Dict] = {}
+        self._links_cache: Dict[tuple, List[Dict]] = {}
+        # Token bucket for API calls: holds up to max_api_calls_per_minute tokens
+        # and refills continuously, so calls only wait when the bucket is empty
+        self._rate_per_sec = schedule_config.max_api_calls_per_minute / 60.0
+        self._tokens = float(schedule_config.max_api_calls_per_minute)
+        self._last_refill = time.monotonic()
+        # Actions may run on worker threads; the bucket is shared between them
+        self._rate_lock = threading.Lock()
+        # Workers record their own results; serializes results, CSV and state writes
+        self._record_lock = threading.Lock()
+        # Set by interrupt_wait() to end the pause between batches early
+        self._wake_event = threading.Event()
     
     def execute_plan(self, max_actions: int = None) -> List[PublishResult]:
         """Execute the action plan according to schedule configuration."""
         
         actions_to_execute = self.action_plan
+        # Drop actions already completed in an earlier run before doing any work,
+        # so max_actions counts only outstanding actions
+        if self.state_manager:
+            done_ids = self.state_manager.get_completed_ids()
+            if done_ids:
+                actions_to_execute = [
+                    a for a in actions_to_execute
+                    if a.id not in done_ids
+                ]
+                skipped = len(self.action_plan) - len(actions_to_execute)
+                if skipped:
+                    logger.info(f"⏭️  Skipping {skipped} actions already completed")
         if max_actions:
             actions_to_execute = actions_to_execute[:max_actions]
+        if self.config.interleave_action_types:
+            actions_to_execute = self._reorder_for_throughput(actions_to_execute)
         
-        print(f"\n🚀 Starting execution of {len(actions_to_execute)} actions")
-        print(f"Schedule mode: {self.config.mode}")
+        logger.info(f"\n🚀 Starting execution of {len(actions_to_execute)} actions")
+        logger.info(f"Schedule mode: {self.config.mode}")
         
-        if self.config.mode == "all_at_once":
-            print("⚡ All actions will be processed continuously (no batching)\n")
-            return self._execute_all_at_once(actions_to_execute)
-        else:
-            print(f"Posts per batch: {self.config.posts_per_batch}")
-            print(f"Delay between batches: {self.config.delay_between_batches/3600:.1f} hours\n")
-            return self._execute_batched(actions_to_execute)
+        if self.results_csv:
+            self._open_results_csv()
+        try:
+            if self.config.mode == "all_at_once":
+                logger.info("⚡ All actions will be processed continuously (no batching)\n")
+                return self._execute_all_at_once(actions_to_execute)
+            else:
+                logger.info(f"Posts per batch: {self.config.posts_per_batch}")
+                logger.info(f"Delay between batches: {self.config.delay_between_batches/3600:.1f} hours\n")
+                return self._execute_batched(actions_to_execute)
+        finally:
+            self._close_results_csv()
     
+    @staticmethod
+    def _reorder_for_throughput(actions: List[ActionItem]) -> List[ActionItem]:
+        """
+        Round-robin across action types, keeping plan order within each type.
+        
+        CREATE/UPDATE are bound by Claude rate limits and DELETE/REDIRECT only by
+        WordPress, so mixing them keeps both busy instead of stalling on one.
+        """
+        # Types rotate in order of first appearance, so the plan's top action still goes first
+        queues: Dict[ActionType, deque] = {}
+        for action in actions:
+            queues.setdefault(action.action_type, deque()).append(action)
+        
+        reordered = []
+        active = [q for q in queues.values() if q]
+        while active:
+            for queue in active:
+                reordered.append(queue.popleft())
+            active = [q for q in active if q]
+        return reordered
+
     def _execute_all_at_once(self, actions: List[ActionItem]) -> List[PublishResult]:
-        """Execute all actions as fast as rate limits allow."""
-        for i, action in enumerate(actions, 1):
-            print(f"\n{'='*80}")
-            print(f"[{i}/{len(actions)}] Processing: {action.action_type.value.upper()}")
-            print(f"{'='*80}")
+        """Execute all actions as fast as rate limits allow, several at a time."""
+        total = len(actions)
 
+        def run(numbered):
+            i, action = numbered
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"\n{'='*80}")
+            logger.info(f"[{i}/{total}] Processing: {action.action_type.value.upper()} {action.url or action.title or ''}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{'='*80}")
             result = self._execute_action(action)
-            self.results.append(result)
-
-            # Mark as completed in state tracker (use StateManager if available)
-            if result.success:
-                if self.state_manager and hasattr(action, 'id'):
-                    # Use StateManager for persistent tracking
-                    self.state_manager.mark_completed(action.id, result.post_id)
-                elif self.planner:
-                    # Fallback to legacy planner
-                    self.planner.mark_completed(
-                        url=action.url or result.url,
-                        action_type=action.action_type.value,
-                        post_id=result.post_id
-                    )
+            self._record_result(action, result)
 
-            # Detailed status update
+            # Detailed status update, one call per block so worker lines can't split it
+            action_type_value = action.action_type.value
             if result.success:
-                print(f"\n✅ SUCCESS - {action.action_type.value.upper()}")
-                print(f"   URL: {result.url}")
+                lines = [f"\n✅ SUCCESS - {action_type_value.upper()}", f"   URL: {result.url}"]
                 if result.post_id:
-                    print(f"   Post ID: {result.post_id}")
-                if hasattr(action, 'id'):
-                    print(f"   Action ID: {action.id} (marked complete)")
+                    lines.append(f"   Post ID: {result.post_id}")
+                if action.id is not None:
+                    lines.append(f"   Action ID: {action.id} (marked complete)")
             else:
-                print(f"\n❌ FAILED - {action.action_type.value.upper()}")
-                print(f"   URL: {action.url}")
-                print(f"   Error: {result.error}")
+                lines = [
+                    f"\n❌ FAILED - {action_type_value.upper()}",
+                    f"   URL: {action.url}",
+                    f"   Error: {result.error}"
+                ]
+            logger.info("\n".join(lines))
+
+        # Actions spend almost all their time waiting on Claude and WordPress, so
+        # run them on a small pool; _check_rate_limit still caps API calls globally.
+        # Each worker records its own result as soon as the action finishes, so an
+        # interrupted run never loses actions that already published.
+        workers = max(1, min(self.config.max_concurrent_actions, total))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(run, enumerate(actions, 1)):
+                pass
 
         return self.results
     
@@ -113,72 +205,146 @@ class ExecutionScheduler:
             end_idx = min(start_idx + batch_size, len(actions))
             batch = actions[start_idx:end_idx]
             
-            print(f"\n📦 Batch {batch_num + 1}/{total_batches}")
-            
-            for action in batch:
-                result = self._execute_action(action)
-                self.results.append(result)
-
-                # Mark as completed in state tracker (use StateManager if available)
-                if result.success:
-                    if self.state_manager and hasattr(action, 'id'):
-                        # Use StateManager for persistent tracking
-                        self.state_manager.mark_completed(action.id, result.post_id)
-                    elif self.planner:
-                        # Fallback to legacy planner
-                        self.planner.mark_completed(
-                            url=action.url or result.url,
-                            action_type=action.action_type.value,
-                            post_id=result.post_id
-                        )
-
-                status = "✅" if result.success else "❌"
-                print(f"  {status} {action.action_type.value}: {result.url or action.url}")
+            logger.info(f"\n📦 Batch {batch_num + 1}/{total_batches}")
+
+            # Phase 1 does every action's lookups and research, phase 2 its
+            # generation and publishing, so the Claude/WordPress round-trips of
+            # the whole batch overlap instead of running back to back
+            workers = max(1, min(self.config.max_concurrent_actions, len(batch)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                prepared = list(pool.map(self._prepare_action_safe, batch))
+                for _ in pool.map(self._finish_and_record, batch, prepared):
+                    pass
             
             # Wait before next batch (unless it's the last batch)
             if batch_num < total_batches - 1:
                 wait_time = self.config.delay_between_batches
-                print(f"\n⏳ Waiting {wait_time/60:.1f} minutes before next batch...")
-                time.sleep(wait_time)
+                logger.info(f"\n⏳ Waiting {wait_time/60:.1f} minutes before next batch...")
+                if self._wake_event.wait(timeout=wait_time):
+                    logger.info("⏩ Wait interrupted, starting next batch now")
+                self._wake_event.clear()
         
         return self.results
     
+    def _finish_and_record(self, action: ActionItem, prepared) -> PublishResult:
+        result = self._finish_action(action, prepared)
+        self._record_result(action, result)
+        status = "✅" if result.success else "❌"
+        logger.info(f"  {status} {action.action_type.value}: {result.url or action.url}")
+        return result
+
+    def _record_result(self, action: ActionItem, result: PublishResult):
+        """Record a finished action (results, CSV row, completion state); called from worker threads."""
+        with self._record_lock:
+            self._append_result(result)
+
+            # Mark as completed in state tracker (use StateManager if available)
+            if result.success:
+                if self.state_manager and action.id is not None:
+                    # Use StateManager for persistent tracking
+                    self.state_manager.mark_completed(action.id, result.post_id)
+                elif self.planner:
+                    # Fallback to legacy planner
+                    self.planner.mark_completed(
+                        url=action.url or result.url,
+                        action_type=action.action_type.value,
+                        post_id=result.post_id
+                    )
+
+    def _append_result(self, result: PublishResult):
+        self.results.append(result)
+        if result.success:
+            self._success_count += 1
+        else:
+            self._failed_count += 1
+        self._by_action_type[result.action] += 1
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(self._csv_row(result))
+            self._csv_file.flush()
+
+    def _open_results_csv(self):
+        self._csv_file = open(self.results_csv, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(CSV_HEADERS)
+        self._csv_file.flush()
+
+    def _close_results_csv(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+
+    @staticmethod
+    def _csv_row(result: PublishResult) -> List:
+        return [
+            result.timestamp,
+            result.action,
+            'SUCCESS' if result.success else 'FAILED',
+            result.url,
+            result.post_id or '',
+            result.error or ''
+        ]
+
+    def interrupt_wait(self):
+        """Cut short the current (or next) wait between batches; safe to call from any thread."""
+        self._wake_event.set()
+
     def _execute_action(self, action: ActionItem) -> PublishResult:
         """Execute a single action item."""
-        
-        try:
-            if action.action_type == ActionType.DELETE:
-                return self._handle_delete(action)
-            
-            elif action.action_type == ActionType.REDIRECT_301:
-                return self._handle_redirect(action)
-            
-            elif action.action_type == ActionType.UPDATE:
-                return self._handle_update(action)
-            
-            elif action.action_type == ActionType.CREATE:
-                return self._handle_create(action)
-            
-            else:
-                return PublishResult(
-                    success=False,
-                    action="unknown",
-                    url=action.url,
-                    error=f"Unknown action type: {action.action_type}"
-                )
-        
-        except Exception as e:
+        handler_name = self._DISPATCH.get(action.action_type)
+        if handler_name is None:
             return PublishResult(
                 success=False,
-                action=action.action_type.value,
+                action="unknown",
                 url=action.url,
-                error=str(e)
+                error=f"Unknown action type: {action.action_type}"
             )
+        
+        invalid = self._precheck(action)
+        if invalid is not None:
+            return invalid
+        
+        try:
+            return getattr(self, handler_name)(action)
+        except Exception as e:
+            return self._error_result(action, e)
+
+    @staticmethod
+    def _precheck(action: ActionItem) -> Optional[PublishResult]:
+        """
+        Fail actions that can't succeed before they cost a WordPress lookup.
+
+        DELETE/REDIRECT/UPDATE act on an existing URL, and a REDIRECT without a
+        target would otherwise delete the post before the redirect is rejected.
+        """
+        error = None
+        if action.action_type in (ActionType.DELETE, ActionType.REDIRECT_301, ActionType.UPDATE):
+            if not (action.url or '').strip():
+                error = "Action has no URL"
+            elif action.action_type == ActionType.REDIRECT_301 and not (action.redirect_target or '').strip():
+                error = "Target URL is empty"
+        if error is None:
+            return None
+        return PublishResult(
+            success=False,
+            action=action.action_type.value,
+            url=action.url,
+            error=error
+        )
+
+    @staticmethod
+    def _error_result(action: ActionItem, error: Exception) -> PublishResult:
+        return PublishResult(
+            success=False,
+            action=action.action_type.value,
+            url=action.url,
+            error=str(error)
+        )
     
     def _handle_delete(self, action: ActionItem) -> PublishResult:
         """Handle DELETE action."""
         # Find the post by URL
-        post = self.wp_publisher.find_post_by_url(action.url)
+        post = self._find_post(action.url)
         
         if not post:
             return PublishResult(
@@ -189,16 +355,21 @@ class ExecutionScheduler:
             )
         
         # Delete the post
+        self._post_cache.pop(action.url, None)
         return self.wp_publisher.delete_post(post['id'], force=True)
     
     def _handle_redirect(self, action: ActionItem) -> PublishResult:
         """Handle 301 REDIRECT action."""
-        # First delete the old post
-        post = self.wp_publisher.find_post_by_url(action.url)
+        post = self._find_post(action.url)
         if post:
-            self.wp_publisher.delete_post(post['id'], force=True)
+            # Delete the old post and create the redirect together
+            self._post_cache.pop(action.url, None)
+            return self.wp_publisher.delete_and_redirect(
+                post['id'],
+                action.url,
+                action.redirect_target
+            )
         
-        # Then create the redirect
         return self.wp_publisher.create_301_redirect(
             action.url,
             action.redirect_target
@@ -206,130 +377,203 @@ class ExecutionScheduler:
     
     def _handle_update(self, action: ActionItem) -> PublishResult:
         """Handle UPDATE action - refresh existing content."""
+        return self._publish_action(action, self._prepare_action(action))
+    
+    def _handle_create(self, action: ActionItem) -> PublishResult:
+        """Handle CREATE action - write new content."""
+        return self._publish_action(action, self._prepare_action(action))
 
-        # Find the existing post
-        post = self.wp_publisher.find_post_by_url(action.url)
-        if not post:
-            return PublishResult(
-                success=False,
-                action="update",
-                url=action.url,
-                error="Post not found"
+    def _prepare_action_safe(self, action: ActionItem):
+        """
+        Phase 1 for batched execution: run _prepare_action for UPDATE/CREATE.
+
+        Returns the prepared data, a PublishResult if the action already
+        failed, or None for actions that have no separate prepare phase.
+        """
+        if action.action_type not in (ActionType.UPDATE, ActionType.CREATE):
+            return None
+        invalid = self._precheck(action)
+        if invalid is not None:
+            return invalid
+        try:
+            return self._prepare_action(action)
+        except Exception as e:
+            return self._error_result(action, e)
+
+    def _finish_action(self, action: ActionItem, prepared) -> PublishResult:
+        """Phase 2 for batched execution: publish a prepared action, or run it whole."""
+        if prepared is None:
+            return self._execute_action(action)
+        if isinstance(prepared, PublishResult):
+            return prepared
+        try:
+            return self._publish_action(action, prepared)
+        except Exception as e:
+            return self._error_result(action, e)
+
+    def _prepare_action(self, action: ActionItem):
+        """
+        Gather everything an UPDATE/CREATE needs before generation: the existing
+        post (updates only), research, internal links and affiliate links.
+
+        Returns a dict for _publish_action, or a failed PublishResult.
+        """
+        post_id = existing_content = None
+        if action.action_type == ActionType.UPDATE:
+            # Find the existing post
+            post = self._find_post(action.url)
+            if not post:
+                return PublishResult(
+                    success=False,
+                    action="update",
+                    url=action.url,
+                    error="Post not found"
+                )
+
+            topic_title = post['title']['rendered']
+            # Actions run concurrently: log each block in one call and name
+            # the action on every standalone line so output stays attributable
+            logger.info(
+                f"\n📰 UPDATING POST\n"
+                f"   Old Title: {topic_title}\n"
+                f"   URL: {action.url}\n"
+                f"   Post ID: {post['id']}"
             )
 
-        old_title = post['title']['rendered']
-        print(f"\n📰 UPDATING POST")
-        print(f"   Old Title: {old_title}")
-        print(f"   URL: {action.url}")
-        print(f"   Post ID: {post['id']}")
+            # Keep only what generation needs; the full post (and its cache
+            # entry, which the update will make stale) can be freed now
+            post_id = post['id']
+            existing_content = post['content']['rendered']
+            self._post_cache.pop(action.url, None)
+            del post
+
+            logger.info(f"\n📝 Researching: {action.keywords[0] if action.keywords else topic_title} ({action.url})")
+        else:
+            topic_title = action.title
+            logger.info(
+                f"\n📝 CREATING NEW POST\n"
+                f"   Topic: {action.title}\n"
+                f"   Keywords: {', '.join(action.keywords[:5])}"
+            )
 
-        print(f"\n📝 Researching: {action.keywords[0] if action.keywords else old_title}")
+            logger.info(f"\n🔍 Researching topic with Claude: {action.title}")
 
         # Research the topic
         self._check_rate_limit()
         research = self.content_generator.research_topic(
-            old_title,
+            topic_title,
             action.keywords
         )
 
         # Get internal link suggestions
-        internal_links = self.wp_publisher.get_internal_link_suggestions(
-            action.keywords
-        )
-        
-        # Get relevant affiliate links if available
-        affiliate_links = []
-        if self.affiliate_manager:
-            affiliate_links = self.affiliate_manager.search_links(
-                keywords=action.keywords,
-                product_type=None,
-                brand=None
-            )[:5]  # Limit to top 5 most relevant
-            if affiliate_links:
-                print(f"   🔗 Found {len(affiliate_links)} relevant affiliate links")
+        internal_links = self._get_internal_links(action.keywords)
 
-        print(f"✍️  Generating updated content with Claude...")
+        return {
+            'post_id': post_id,
+            'existing_content': existing_content,
+            'topic_title': topic_title,
+            'research': research,
+            'internal_links': internal_links,
+            'affiliate_links': self._get_affiliate_links(action.keywords)
+        }
 
-        # Generate updated content with fresh title, content, and taxonomies
-        self._check_rate_limit()
-        article_data = self.content_generator.generate_article(
-            topic_title=old_title,
-            keywords=action.keywords,
-            research=research,
-            meta_description="",  # Will be generated by Claude
-            existing_content=post['content']['rendered'],
-            internal_links=internal_links,
-            affiliate_links=affiliate_links
-        )
+    def _find_post(self, url: str) -> Optional[Dict]:
+        """find_post_by_url, cached for the run (misses aren't cached)."""
+        post = self._post_cache.get(url)
+        if post is None:
+            post = self.wp_publisher.find_post_by_url(url)
+            if post:
+                self._post_cache[url] = post
+        return post
 
-        new_title = article_data.get('title', old_title)
-        print(f"\n📝 CHANGES:")
-        print(f"   New Title: {new_title}")
-        print(f"   Categories: {', '.join(article_data.get('categories', []))}")
-        print(f"   Tags: {', '.join(article_data.get('tags', []))}")
-        print(f"   Content Length: {len(article_data.get('content', ''))} chars")
-
-        # Update the post with new title, content, meta, and taxonomies
-        return self.wp_publisher.update_post(
-            post_id=post['id'],
-            title=new_title,  # NEW: Update the title
-            content=article_data['content'],
-            meta_title=article_data.get('meta_title'),
-            meta_description=article_data.get('meta_description'),
-            categories=article_data.get('categories'),
-            tags=article_data.get('tags')
-        )
-    
-    def _handle_create(self, action: ActionItem) -> PublishResult:
-        """Handle CREATE action - write new content."""
+    def _get_internal_links(self, keywords: List[str]) -> List[Dict]:
+        """get_internal_link_suggestions, cached for the run by keyword list."""
+        # Keyed on the ordered keywords: suggestions depend on which come first
+        key = tuple(keywords or ())
+        links = self._links_cache.get(key)
+        if links is None:
+            links = self.wp_publisher.get_internal_link_suggestions(keywords)
+            self._links_cache[key] = links
+        return links
 
-        print(f"\n📝 CREATING NEW POST")
-        print(f"   Topic: {action.title}")
-        print(f"   Keywords: {', '.join(action.keywords[:5])}")
+    def _get_affiliate_links(self, keywords: List[str]) -> List[Dict]:
+        """Get relevant affiliate links if available."""
+        if not self.affiliate_manager:
+            return []
+        affiliate_links = self.affiliate_manager.search_links(
+            keywords=keywords,
+            product_type=None,
+            brand=None
+        )[:5]  # Limit to top 5 most relevant
+        if affiliate_links:
+            logger.info(f"   🔗 Found {len(affiliate_links)} relevant affiliate links for {', '.join(keywords[:3])}")
+        return affiliate_links
 
-        print(f"\n🔍 Researching topic with Claude...")
+    def _publish_action(self, action: ActionItem, prepared) -> PublishResult:
+        """Generate the article for a prepared UPDATE/CREATE and publish it."""
+        if isinstance(prepared, PublishResult):
+            return prepared
 
-        # Research the topic
-        self._check_rate_limit()
-        research = self.content_generator.research_topic(
-            action.title,
-            action.keywords
-        )
+        post_id = prepared['post_id']
+        topic_title = prepared['topic_title']
 
-        # Get internal link suggestions
-        internal_links = self.wp_publisher.get_internal_link_suggestions(
-            action.keywords
-        )
-        
-        # Get relevant affiliate links if available
-        affiliate_links = []
-        if self.affiliate_manager:
-            affiliate_links = self.affiliate_manager.search_links(
+        if post_id is not None:
+            logger.info(f"✍️  Generating updated content with Claude: {action.url}")
+
+            # Generate updated content with fresh title, content, and taxonomies
+            self._check_rate_limit()
+            article_data = self.content_generator.generate_article(
+                topic_title=topic_title,
                 keywords=action.keywords,
-                product_type=None,
-                brand=None
-            )[:5]  # Limit to top 5 most relevant
-            if affiliate_links:
-                print(f"   🔗 Found {len(affiliate_links)} relevant affiliate links")
+                research=prepared.pop('research'),
+                meta_description="",  # Will be generated by Claude
+                existing_content=prepared.pop('existing_content'),
+                internal_links=prepared['internal_links'],
+                affiliate_links=prepared['affiliate_links']
+            )
+
+            new_title = article_data.get('title', topic_title)
+            logger.info(
+                f"\n📝 CHANGES:\n"
+                f"   URL: {action.url}\n"
+                f"   New Title: {new_title}\n"
+                f"   Categories: {', '.join(article_data.get('categories', []))}\n"
+                f"   Tags: {', '.join(article_data.get('tags', []))}\n"
+                f"   Content Length: {len(article_data.get('content', ''))} chars"
+            )
+
+            # Update the post with new title, content, meta, and taxonomies
+            return self.wp_publisher.update_post(
+                post_id=post_id,
+                title=new_title,  # NEW: Update the title
+                content=article_data['content'],
+                meta_title=article_data.get('meta_title'),
+                meta_description=article_data.get('meta_description'),
+                categories=article_data.get('categories'),
+                tags=article_data.get('tags')
+            )
 
-        print(f"✍️  Generating new article with Claude...")
+        logger.info(f"✍️  Generating new article with Claude: {topic_title}")
 
         # Generate new content
         self._check_rate_limit()
         article_data = self.content_generator.generate_article(
-            topic_title=action.title,
+            topic_title=topic_title,
             keywords=action.keywords,
-            research=research,
+            research=prepared.pop('research'),
             meta_description="",  # Will be generated by Claude
-            internal_links=internal_links,
-            affiliate_links=affiliate_links
+            internal_links=prepared['internal_links'],
+            affiliate_links=prepared['affiliate_links']
         )
 
-        print(f"\n📝 NEW ARTICLE:")
-        print(f"   Title: {article_data.get('title', 'N/A')}")
-        print(f"   Categories: {', '.join(article_data.get('categories', []))}")
-        print(f"   Tags: {', '.join(article_data.get('tags', []))}")
-        print(f"   Content Length: {len(article_data.get('content', ''))} chars")
+        logger.info(
+            f"\n📝 NEW ARTICLE:\n"
+            f"   Topic: {topic_title}\n"
+            f"   Title: {article_data.get('title', 'N/A')}\n"
+            f"   Categories: {', '.join(article_data.get('categories', []))}\n"
+            f"   Tags: {', '.join(article_data.get('tags', []))}\n"
+            f"   Content Length: {len(article_data.get('content', ''))} chars"
+        )
 
         # Create the post
         return self.wp_publisher.create_post(
@@ -343,72 +587,52 @@ class ExecutionScheduler:
         )
     
     def _check_rate_limit(self):
-        """Check and enforce API rate limits."""
-        current_time = time.time()
-        
-        # Reset counter every minute
-        if current_time >= self.api_call_reset_time:
-            self.api_call_count = 0
-            self.api_call_reset_time = current_time + 60
-        
-        # Check if we've hit the limit
-        if self.api_call_count >= self.config.max_api_calls_per_minute:
-            wait_time = self.api_call_reset_time - current_time
-            if wait_time > 0:
-                print(f"  ⏸️  Rate limit reached, waiting {wait_time:.1f}s...")
+        """Take one API-call token, waiting only if the bucket is empty."""
+        with self._rate_lock:
+            now = time.monotonic()
+            capacity = self.config.max_api_calls_per_minute
+            self._tokens = min(capacity, self._tokens + (now - self._last_refill) * self._rate_per_sec)
+            self._last_refill = now
+
+            if self._tokens < 1:
+                # Waiting while holding the lock queues other callers behind this one
+                wait_time = (1 - self._tokens) / self._rate_per_sec
+                logger.info(f"  ⏸️  Rate limit reached, waiting {wait_time:.1f}s...")
                 time.sleep(wait_time)
-                self.api_call_count = 0
-                self.api_call_reset_time = time.time() + 60
-        
-        self.api_call_count += 1
-        
-        # Small delay between API calls
-        time.sleep(1)
+                # The token that accrued while sleeping is spent on this call
+                self._tokens = 0.0
+                self._last_refill = time.monotonic()
+            else:
+                self._tokens -= 1
     
     def save_results_to_csv(self, output_path: str):
         """Save execution results to a CSV tracking file."""
+        # Already written row by row while the plan ran
+        if self.results_csv and os.path.abspath(output_path) == os.path.abspath(self.results_csv):
+            logger.info(f"\n📊 Results saved to: {output_path}")
+            return
         
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
             # Headers
-            writer.writerow([
-                'Timestamp',
-                'Action',
-                'Status',
-                'URL',
-                'Post ID',
-                'Error'
-            ])
+            writer.writerow(CSV_HEADERS)
             
-            # Data rows
-            for result in self.results:
-                writer.writerow([
-                    result.timestamp,
-                    result.action,
-                    'SUCCESS' if result.success else 'FAILED',
-                    result.url,
-                    result.post_id or '',
-                    result.error or ''
-                ])
+            # Data rows (one writerows call keeps the loop inside the csv module)
+            writer.writerows(map(self._csv_row, self.results))
         
-        print(f"\n📊 Results saved to: {output_path}")
+        logger.info(f"\n📊 Results saved to: {output_path}")
     
     def get_summary(self) -> Dict:
         """Get execution summary statistics."""
-        total = len(self.results)
-        successful = len([r for r in self.results if r.success])
-        failed = len([r for r in self.results if not r.success])
-        
-        actions_count = {}
-        for result in self.results:
-            action = result.action
-            actions_count[action] = actions_count.get(action, 0) + 1
+        successful = self._success_count
+        failed = self._failed_count
+        total = successful + failed
         
         return {
             'total_actions': total,
             'successful': successful,
             'failed': failed,
             'success_rate': f"{(successful/total*100):.1f}%" if total > 0 else "0%",
-            'by_action_type': actions_count
-        }
\ No newline at end of file
+            'by_action_type': dict(self._by_action_type)
+        }
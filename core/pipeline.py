@@ -27,7 +27,7 @@ from wordpress.publisher import WordPressPublisher
 from core.execution_scheduler import ExecutionScheduler, ScheduleConfig
 
 # Phase 1-4: New AI-powered modules
-from config import get_site, list_sites
+from config import get_site, list_sites, load_env
 from core.state_manager import StateManager
 from analysis.niche_analyzer import NicheAnalyzer
 from analysis.planners.ai_planner import AIStrategicPlanner
@@ -100,6 +100,7 @@ class SEOAutomationPipeline:
             self.wp_app_password = wp_app_password
             self.niche = None  # Will skip niche research if not set
         
+        load_env()
         self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
         
         # Initialize state manager
@@ -373,7 +374,7 @@ class SEOAutomationPipeline:
             plan_data = []
             for i, action in enumerate(self.action_plan):
                 # Create unique ID if not already set
-                if not hasattr(action, 'id') or not action.id:
+                if not action.id:
                     action_id = hashlib.md5(
                         f"{action.action_type.value}_{action.url or action.title}_{i}".encode()
                     ).hexdigest()[:12]
@@ -439,7 +440,7 @@ class SEOAutomationPipeline:
         # Show top 5 actions
         print("\n  📋 Top 5 Priority Actions:")
         for i, action in enumerate(self.action_plan[:5], 1):
-            status = "✅" if hasattr(action, 'id') else "📋"
+            status = "✅" if action.id is not None else "📋"
             print(f"    {i}. {status} [{action.action_type.value.upper()}] "
                   f"Priority: {action.priority_score:.1f} - {action.reasoning[:60]}...")
 
@@ -532,7 +533,8 @@ class SEOAutomationPipeline:
             schedule_config,
             planner=self.strategic_planner,
             state_manager=self.state_mgr,
-            affiliate_manager=affiliate_manager
+            affiliate_manager=affiliate_manager,
+            results_csv=output_csv  # written as each action finishes
         )
         
         # Execute!
@@ -605,6 +607,10 @@ class SEOAutomationPipeline:
 def main():
     """CLI entry point."""
     import argparse
+    import logging
+
+    # Execution progress is reported through logging; show it like plain output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     
     parser = argparse.ArgumentParser(
         description="SEO Automation Pipeline - Analyze, plan, and execute content strategy"
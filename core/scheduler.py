@@ -6,52 +6,227 @@ Manages recurring SEO audits and auto-fixes.
 
 import os
 import json
+import logging
+import functools
+import heapq
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
 from core.state_manager import StateManager
 from utils.notifications import SEONotifier
 from seo.technical_auditor import TechnicalSEOAuditor
 from seo.issue_grouper import IssueGrouper
 from seo.issue_fixer import SEOIssueFixer
 
+logger = logging.getLogger(__name__)
+
+# The run log is compacted to its newest RUN_LOG_KEEP entries once it grows past this size
+RUN_LOG_MAX_BYTES = 1_000_000
+RUN_LOG_KEEP = 100
+RUN_LOG_FILE = "automation_runs.jsonl"
+# Run log format before JSONL; read as a fallback and folded into the new log on the first write
+LEGACY_RUN_LOG_FILE = "automation_runs.json"
+
+try:
+    # orjson serializes in C and writes bytes directly
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_line(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj).encode() + b"\n"
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp; next_run strings repeat on every scheduling tick."""
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_http_session() -> requests.Session:
+    """One pooled session for every scheduled run, so repeat hosts reuse keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        # No adapter-level retries: the fixer and publisher already retry with
+        # backoff, and a second layer would multiply attempts (and honor long
+        # Retry-After headers from sites in maintenance mode)
+        max_retries=0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def read_recent_runs(runs_file: Optional[str] = None, limit: int = RUN_LOG_KEEP) -> List[Dict]:
+    """
+    Return the last `limit` automation runs, newest first.
+
+    Reads the JSONL run log (default: automation_runs.jsonl in the working
+    directory). If it doesn't exist yet, falls back to the legacy
+    automation_runs.json list next to it.
+    """
+    runs_file = runs_file or os.path.join(os.getcwd(), RUN_LOG_FILE)
+    if not os.path.exists(runs_file):
+        return _read_legacy_runs(os.path.dirname(runs_file))[:limit]
+    with open(runs_file, 'rb') as f:
+        # Only the tail of the log is kept in memory
+        lines = deque(f, maxlen=limit)
+    runs = []
+    for line in reversed(lines):
+        try:
+            runs.append(_json_loads(line))
+        except ValueError:
+            continue  # Partially written line from an interrupted run
+    return runs
+
+
+def _read_legacy_runs(directory: str) -> List[Dict]:
+    """Runs from the pre-JSONL automation_runs.json (a list, newest first), or []."""
+    legacy_file = os.path.join(directory, LEGACY_RUN_LOG_FILE)
+    if not os.path.exists(legacy_file):
+        return []
+    try:
+        with open(legacy_file, 'rb') as f:
+            runs = _json_loads(f.read())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read legacy run log {legacy_file}: {e}")
+        return []
+    return runs if isinstance(runs, list) else []
+
+
+def _atomic_write_json(path: str, obj):
+    """Write obj to path via a synced temp file, so a crash never leaves a torn file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_json_dumps(obj))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
 class SEOScheduler:
+    # Template for sites without stored settings; never handed out for mutation
+    _DEFAULT_SITE_SETTINGS = {
+        "enabled": False,
+        "auto_fix": False,
+        "frequency": "weekly",  # "daily", "weekly", "monthly"
+        "last_run": None,
+        "next_run": None,
+        "webhook_url": None
+    }
+
+    # Days between runs for each supported frequency
+    _FREQ_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
     def __init__(self, sites_config: Dict):
         self.sites_config = sites_config
-        self.notifier = SEONotifier()
+        self.notifier = SEONotifier(session=_shared_http_session())
         self.settings_file = os.path.join(os.getcwd(), "automation_settings.json")
+        self.runs_file = os.path.join(os.getcwd(), RUN_LOG_FILE)
+        # mtime of the settings file as of our last read/write; a change means another process edited it
+        self._settings_mtime = self._get_settings_mtime()
         self.settings = self._load_settings()
+        # Writes requested inside _batched_writes() are coalesced into one flush
+        self._dirty = False
+        self._flush_pending = 0
+        # Guards self.settings and the run log when sites are processed in parallel
+        self._lock = threading.Lock()
+        # Min-heap of (next_run timestamp, site_name); entries superseded by a
+        # reschedule are skipped when popped
+        self._due_heap = []
+        self._rebuild_schedule()
 
     def _load_settings(self) -> Dict:
         if os.path.exists(self.settings_file):
             try:
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
+                with open(self.settings_file, 'rb') as f:
+                    return _json_loads(f.read())
+            except json.JSONDecodeError as e:  # orjson's decode error subclasses this too
+                # Move the broken file aside so the next save starts clean instead of overwriting it blindly
+                corrupt_path = f"{self.settings_file}.corrupt-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                logger.warning(f"Automation settings are corrupt ({e}); moved to {corrupt_path}")
+                try:
+                    os.replace(self.settings_file, corrupt_path)
+                except OSError:
+                    pass
+            except OSError as e:
+                logger.warning(f"Could not read automation settings: {e}")
         return {}
 
+    def _get_settings_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.settings_file)
+        except OSError:
+            return None
+
+    def _maybe_reload(self):
+        """Re-read settings (and rebuild the schedule) only if the file changed on disk."""
+        mtime = self._get_settings_mtime()
+        # Unflushed local changes win; they will overwrite the file on the next flush anyway
+        if mtime == self._settings_mtime or self._dirty:
+            return
+        self._settings_mtime = mtime
+        self.settings = self._load_settings()
+        self._rebuild_schedule()
+
     def _save_settings(self):
+        """Persist settings now, or at the end of the enclosing _batched_writes() block."""
+        if self._flush_pending:
+            self._dirty = True
+        else:
+            self._save_settings_now()
+
+    def _save_settings_now(self):
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            _atomic_write_json(self.settings_file, self.settings)
+            self._dirty = False
+            self._settings_mtime = self._get_settings_mtime()
         except Exception as e:
             print(f"Error saving automation settings: {e}")
 
+    @contextmanager
+    def _batched_writes(self):
+        """Defer settings writes until the outermost block exits, then flush once."""
+        self._flush_pending += 1
+        try:
+            yield
+        finally:
+            self._flush_pending -= 1
+            if not self._flush_pending and self._dirty:
+                self._save_settings_now()
+
     def get_site_settings(self, site_name: str) -> Dict:
-        """Get automation settings for a specific site."""
-        default = {
-            "enabled": False,
-            "auto_fix": False,
-            "frequency": "weekly",  # "daily", "weekly", "monthly"
-            "last_run": None,
-            "next_run": None,
-            "webhook_url": None
-        }
-        return self.settings.get(site_name, default).copy() if site_name in self.settings else default
+        """Get automation settings for a specific site (shared; do not mutate)."""
+        return self.settings.get(site_name, self._DEFAULT_SITE_SETTINGS)
+
+    def get_site_settings_mutable(self, site_name: str) -> Dict:
+        """Get a private copy of a site's automation settings for modification."""
+        return dict(self.settings.get(site_name, self._DEFAULT_SITE_SETTINGS))
 
     def update_site_settings(self, site_name: str, settings: Dict):
         """Update automation settings for a site."""
-        current = self.get_site_settings(site_name)
+        current = self.get_site_settings_mutable(site_name)
         current.update(settings)
         
         # Calculate next run if enabled and not set
@@ -60,211 +235,254 @@ class SEOScheduler:
             
         self.settings[site_name] = current
         self._save_settings()
+        self._schedule(site_name, current)
+
+    @staticmethod
+    def _due_timestamp(settings: Dict) -> float:
+        """Epoch seconds a site is due at; sites without next_run are due immediately."""
+        next_run_str = settings.get("next_run")
+        return _parse_iso(next_run_str).timestamp() if next_run_str else 0.0
+
+    def _schedule(self, site_name: str, settings: Dict):
+        if settings.get("enabled") and site_name in self.sites_config:
+            heapq.heappush(self._due_heap, (self._due_timestamp(settings), site_name))
+
+    def _rebuild_schedule(self):
+        self._due_heap = [
+            (self._due_timestamp(settings), site_name)
+            for site_name, settings in self.settings.items()
+            if site_name in self.sites_config and settings.get("enabled")
+        ]
+        heapq.heapify(self._due_heap)
 
     def _calculate_next_run(self, frequency: str) -> str:
-        now = datetime.now()
-        if frequency == "daily":
-            next_run = now + timedelta(days=1)
-        elif frequency == "monthly":
-            next_run = now + timedelta(days=30)
-        else: # weekly
-            next_run = now + timedelta(days=7)
-        
+        next_run = datetime.now() + timedelta(days=self._FREQ_DAYS.get(frequency, 7))  # default weekly
         # Set to 3 AM for less traffic interference
         next_run = next_run.replace(hour=3, minute=0, second=0, microsecond=0)
         return next_run.isoformat()
 
     def get_pending_tasks(self) -> List[Dict]:
         """Identify which sites need an audit or fix based on schedule."""
-        now = datetime.now()
+        self._maybe_reload()
+        return self.pop_due()
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Pop every site whose next run is due.
+
+        Popped sites are pushed back when process_automation reschedules them
+        (or re-queued as still due if their run fails).
+        """
+        now_ts = (now or datetime.now()).timestamp()
         pending = []
+        seen = set()
         
-        for site_name, config in self.sites_config.items():
+        while self._due_heap and self._due_heap[0][0] <= now_ts:
+            due_ts, site_name = heapq.heappop(self._due_heap)
             settings = self.get_site_settings(site_name)
-            if not settings["enabled"]:
-                continue
-                
-            next_run_str = settings.get("next_run")
-            if not next_run_str:
-                # If enabled but no next_run, it's pending (likely just enabled)
-                pending.append({
-                    "site_name": site_name,
-                    "type": "audit_and_fix" if settings["auto_fix"] else "audit_only",
-                    "settings": settings,
-                    "config": config
-                })
+            # Skip stale entries left behind by a reschedule or a disable
+            if site_name in seen or not settings["enabled"] or self._due_timestamp(settings) != due_ts:
                 continue
-                
-            next_run = datetime.fromisoformat(next_run_str)
-            if now >= next_run:
-                pending.append({
-                    "site_name": site_name,
-                    "type": "audit_and_fix" if settings["auto_fix"] else "audit_only",
-                    "settings": settings,
-                    "config": config
-                })
+            seen.add(site_name)
+            pending.append(self._make_task(site_name, dict(settings)))
         
         return pending
 
-    def process_automation(self, force_site: Optional[str] = None):
+    def _make_task(self, site_name: str, settings: Dict) -> Dict:
+        return {
+            "site_name": site_name,
+            "type": "audit_and_fix" if settings["auto_fix"] else "audit_only",
+            "settings": settings,
+            "config": self.sites_config[site_name]
+        }
+
+    def process_automation(self, force_site: Optional[str] = None, max_workers: int = 8):
         """Run pending automation tasks across all sites."""
         tasks = []
         if force_site:
             if force_site in self.sites_config:
-                settings = self.get_site_settings(force_site)
-                tasks = [{
-                    "site_name": force_site,
-                    "type": "audit_and_fix" if settings["auto_fix"] else "audit_only",
-                    "settings": settings,
-                    "config": self.sites_config[force_site]
-                }]
+                tasks = [self._make_task(force_site, self.get_site_settings_mutable(force_site))]
         else:
             tasks = self.get_pending_tasks()
 
-        results = []
-        for task in tasks:
-            site_name = task["site_name"]
-            site_url = task["config"].get("url")
-            settings = task["settings"]
-            
-            if not site_url:
-                continue
+        if not tasks:
+            return []
+
+        # Audits, WordPress fixes and webhooks are network-bound, so sites run
+        # on a thread pool; one settings write covers the whole run
+        with self._batched_writes():
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+                results = list(pool.map(self._run_one_task, tasks))
+
+        return [result for result in results if result is not None]
 
-            print(f"🤖 Processing automation for {site_name} ({task['type']})...")
+    def _run_one_task(self, task: Dict) -> Optional[Dict]:
+        """Audit (and optionally fix) one site, notify, and reschedule it."""
+        site_name = task["site_name"]
+        site_url = task["config"].get("url")
+        settings = task["settings"]
+    
+        if not site_url:
+            return None
+
+        print(f"🤖 Processing automation for {site_name} ({task['type']})...")
+    
+        try:
+            # 1. Run Audit
+            # The auditor (and its link graph) is dropped as soon as the audit returns
+            audit_result = TechnicalSEOAuditor(
+                site_url=site_url, session=_shared_http_session()
+            ).audit_site(max_urls=100)
+        
+            # Group issues
+            summary = IssueGrouper.get_summary(audit_result)
+            critical_count = summary.get('critical_count', 0)
+            warning_count = summary.get('warning_count', 0)
+            score = self._score(critical_count, warning_count)
+        
+            fixed_count = 0
+            failures = 0
+        
+            # 2. Run Fixes if enabled
+            if task["type"] == "audit_and_fix":
+                wp_user = task["config"].get("wp_username")
+                wp_pass = task["config"].get("wp_app_password")
             
-            try:
-                # 1. Run Audit
-                auditor = TechnicalSEOAuditor(site_url=site_url)
-                audit_result = auditor.audit_site(max_urls=100)
+                if wp_user and wp_pass:
+                    fixer = SEOIssueFixer(
+                        site_url=site_url,
+                        wp_username=wp_user,
+                        wp_app_password=wp_pass,
+                        session=_shared_http_session()
+                    )
                 
-                # Group issues
-                summary = IssueGrouper.get_summary(audit_result)
-                score = 100 - (summary.get('critical_count', 0) * 5) - (summary.get('warning_count', 0) * 1)
-                score = max(0, min(100, score))
+                    priority_issues = ['h1_presence', 'title_presence', 'meta_description_presence']
+                    fixable, _ = IssueGrouper.get_fixable_vs_manual(audit_result, only=set(priority_issues))
                 
-                fixed_count = 0
-                failures = 0
-                
-                # 2. Run Fixes if enabled
-                if task["type"] == "audit_and_fix":
-                    wp_user = task["config"].get("wp_username")
-                    wp_pass = task["config"].get("wp_app_password")
-                    
-                    if wp_user and wp_pass:
-                        fixer = SEOIssueFixer(
-                            site_url=site_url,
-                            wp_username=wp_user,
-                            wp_app_password=wp_pass
-                        )
-                        
-                        fixable, _ = IssueGrouper.get_fixable_vs_manual(audit_result)
-                        priority_issues = ['h1_presence', 'title_presence', 'meta_description_presence']
-                        
-                        for issue_type in priority_issues:
-                            if issue_type in fixable:
-                                urls = fixable[issue_type][:10] # Batch limit
-                                if urls:
-                                    fix_res = fixer.fix_issue(issue_type, 'onpage', urls)
-                                    fixed_count += fix_res.get('fixed_count', 0)
-                                    failures += fix_res.get('error_count', 0)
-                    else:
-                        print(f"  ⚠️ No WordPress credentials for {site_name}. Skipping fixes.")
-
-                # 3. Send Notification
-                # Set temporary webhook override if provided in settings
-                old_webhook = os.getenv("NOTIFIER_WEBHOOK_URL")
-                if settings.get("webhook_url"):
-                    os.environ["NOTIFIER_WEBHOOK_URL"] = settings["webhook_url"]
-                    self.notifier.webhook_url = settings["webhook_url"]
-
-                # 3. Check for Foundation Failures (High Priority Alerts)
-                foundation_issues = self._get_foundation_failures(audit_result, site_url)
-                if foundation_issues:
-                    self.notifier.send_urgent_alert(site_name, foundation_issues)
-
-                self.notifier.send_audit_summary(
-                    site_name, 
-                    score, 
-                    summary.get('critical_count', 0), 
-                    summary.get('warning_count', 0)
-                )
-                
-                if fixed_count > 0 or failures > 0:
-                    self.notifier.send_fix_summary(site_name, fixed_count, failures)
+                    # Group by URL so each post gets all of its fixes in one update
+                    issues_by_url = {}
+                    for issue_type in priority_issues:
+                        for url in fixable.get(issue_type, [])[:10]: # Batch limit
+                            issues_by_url.setdefault(url, []).append(issue_type)
+                    del fixable
+                    if issues_by_url:
+                        fix_res = fixer.fix_issues_bulk(issues_by_url, 'onpage')
+                        fixed_count += fix_res.get('fixed_count', 0)
+                        failures += fix_res.get('error_count', 0)
+                else:
+                    print(f"  ⚠️ No WordPress credentials for {site_name}. Skipping fixes.")
+
+            # 3. Send Notification (to the site's own webhook when configured)
+            webhook_url = settings.get("webhook_url")
 
-                # Restore original webhook
-                if old_webhook:
-                    os.environ["NOTIFIER_WEBHOOK_URL"] = old_webhook
-                    self.notifier.webhook_url = old_webhook
+            # 3. Check for Foundation Failures (High Priority Alerts)
+            foundation_issues = self._get_foundation_failures(audit_result, site_url)
+            # Last reader of the audit; release it so parallel runs don't each hold a full audit while notifying
+            del audit_result
+            if foundation_issues:
+                self.notifier.send_urgent_alert(site_name, foundation_issues, webhook_url=webhook_url)
+
+            self.notifier.send_audit_summary(
+                site_name, 
+                score, 
+                critical_count, 
+                warning_count,
+                webhook_url=webhook_url
+            )
+        
+            if fixed_count > 0 or failures > 0:
+                self.notifier.send_fix_summary(site_name, fixed_count, failures, webhook_url=webhook_url)
 
-                # 4. Update schedule
-                settings["last_run"] = datetime.now().isoformat()
-                settings["next_run"] = self._calculate_next_run(settings["frequency"])
+            # 4. Update schedule
+            settings["last_run"] = datetime.now().isoformat()
+            settings["next_run"] = self._calculate_next_run(settings["frequency"])
+            with self._lock:
                 self.settings[site_name] = settings
                 self._save_settings()
-                
-                self._log_automation_run(site_name, "success", score=score, fixed=fixed_count)
-                results.append({
-                    "site": site_name,
-                    "status": "success",
-                    "score": score,
-                    "fixed": fixed_count,
-                    "next_run": settings["next_run"]
-                })
-                
-            except Exception as e:
-                print(f"❌ Automation failed for {site_name}: {e}")
-                self._log_automation_run(site_name, "error", error=str(e))
-                results.append({
-                    "site": site_name,
-                    "status": "error",
-                    "error": str(e)
-                })
-            
-        return results
+                self._schedule(site_name, settings)
+        
+            self._log_automation_run(site_name, "success", score=score, fixed=fixed_count)
+            return {
+                "site": site_name,
+                "status": "success",
+                "score": score,
+                "fixed": fixed_count,
+                "next_run": settings["next_run"]
+            }
+        
+        except Exception as e:
+            print(f"❌ Automation failed for {site_name}: {e}")
+            # Leave the site due so the next tick retries it
+            with self._lock:
+                self._schedule(site_name, self.get_site_settings(site_name))
+            self._log_automation_run(site_name, "error", error=str(e))
+            return {
+                "site": site_name,
+                "status": "error",
+                "error": str(e)
+            }
+
+    @staticmethod
+    def _score(critical_count: int, warning_count: int) -> int:
+        """Health score out of 100: -5 per critical issue, -1 per warning."""
+        return max(0, min(100, 100 - critical_count * 5 - warning_count))
 
     def _get_foundation_failures(self, audit_result: Dict, site_url: str) -> List[str]:
         """Detect critical foundation failures like noindex or robots block."""
         failures = []
-        for url_data in audit_result.get("urls", []):
-            # Only check homepage for global foundation issues (usually first URL)
-            if url_data["url"].rstrip("/") == site_url.rstrip("/"):
-                # Check for HTTP errors
-                if url_data.get("status_code", 0) >= 400:
-                    failures.append(f"Homepage returned status {url_data['status_code']}")
-                
-                issues = url_data.get("issues", {})
-                for cat in issues.values():
-                    for issue in cat:
-                        if issue.get("status") == "critical" and issue.get("check_name") in ["noindex", "robots_txt", "ssl_https"]:
-                            # Special priority for noindex/robots
-                            failures.append(f"CRITICAL: {issue['message']}")
-                break
+        # Only check homepage for global foundation issues
+        if "homepage" in audit_result:
+            homepage = audit_result["homepage"]
+        else:
+            # Older audit results don't carry the homepage row; find it (usually first URL)
+            target = site_url.rstrip("/")
+            urls = audit_result.get("urls", [])
+            if urls and urls[0]["url"].rstrip("/") == target:
+                homepage = urls[0]
+            else:
+                homepage = next((u for u in urls if u["url"].rstrip("/") == target), None)
+        if homepage is None:
+            return failures
+
+        # Check for HTTP errors
+        if homepage.get("status_code", 0) >= 400:
+            failures.append(f"Homepage returned status {homepage['status_code']}")
+        
+        issues = homepage.get("issues", {})
+        for cat in issues.values():
+            for issue in cat:
+                if issue.get("status") == "critical" and issue.get("check_name") in ["noindex", "robots_txt", "ssl_https"]:
+                    # Special priority for noindex/robots
+                    failures.append(f"CRITICAL: {issue['message']}")
         return failures
 
     def _log_automation_run(self, site_name: str, status: str, **kwargs):
-        """Log the automation run to automation_runs.json."""
-        log_file = os.path.join(os.getcwd(), "automation_runs.json")
-        runs = []
-        if os.path.exists(log_file):
-            try:
-                with open(log_file, 'r') as f:
-                    runs = json.load(f)
-            except:
-                pass
-        
+        """Append the automation run to automation_runs.jsonl (one JSON object per line)."""
         entry = {
             "timestamp": datetime.now().isoformat(),
             "site": site_name,
             "status": status,
             **kwargs
         }
-        runs.insert(0, entry)
-        runs = runs[:100] # Keep last 100 runs
         
         try:
-            with open(log_file, 'w') as f:
-                json.dump(runs, f, indent=2)
-        except:
-            pass
+            line = _json_line(entry)
+            with self._lock:
+                if not os.path.exists(self.runs_file):
+                    # Carry over history from the old JSON log (stored newest first)
+                    legacy = _read_legacy_runs(os.path.dirname(self.runs_file))[:RUN_LOG_KEEP]
+                    line = b"".join(_json_line(run) for run in reversed(legacy)) + line
+                with open(self.runs_file, 'ab') as f:
+                    f.write(line)
+                # Compact occasionally instead of rewriting the log on every run
+                if os.path.getsize(self.runs_file) > RUN_LOG_MAX_BYTES:
+                    runs = self.get_recent_runs(RUN_LOG_KEEP)
+                    with open(self.runs_file + ".tmp", 'wb') as f:
+                        f.write(b"".join(_json_line(run) for run in reversed(runs)))
+                    os.replace(self.runs_file + ".tmp", self.runs_file)
+        except (OSError, TypeError) as e:  # TypeError: entry wasn't JSON-serializable
+            logger.warning(f"Could not log automation run for {site_name}: {e}")
 
+    def get_recent_runs(self, limit: int = RUN_LOG_KEEP) -> List[Dict]:
+        """Return the last `limit` automation runs, newest first."""
+        return read_recent_runs(self.runs_file, limit)
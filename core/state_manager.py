@@ -12,7 +12,7 @@ import json
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from utils.state_storage import StateStorage
 
 # Configure logger for this module
@@ -147,6 +147,18 @@ class StateManager:
         logger.debug(f"Updated stats: {self.state['stats']}")
         self.save()
     
+    def get_completed_ids(self) -> Set[str]:
+        """
+        Get the IDs of all completed actions.
+        
+        Returns:
+            set: Action IDs with status 'completed' (for O(1) skip checks)
+        """
+        return {
+            a['id'] for a in self.state.get('current_plan', [])
+            if a.get('status') == 'completed' and a.get('id')
+        }
+    
     def get_pending_actions(self, limit: Optional[int] = None):
         """
         Get pending actions sorted by priority.
@@ -148,17 +148,20 @@ def run_optimization(push_live=False):
     # 5. STEP 2: Content Optimization (Claude 4.5 Sonnet)
     print("\n🧠 Optimizing Content based on Competitive Intelligence...")
     
-    # Rewrite Title with Brief context
-    new_title = optimizer.rewrite_title(current_title, TARGET_KEYWORD, competitive_brief=brief)
+    # Rewrite Title with Brief context + Generate Comparison Table (Requested in Brief if
+    # multimedia_needed). Independent tasks, so they share one Claude round trip.
+    print(f"   📊 Rewriting Title & Generating Strategic Comparison Table...")
+    rewrites = optimizer.batch_rewrite({
+        "title": optimizer.title_task(current_title, TARGET_KEYWORD, competitive_brief=brief),
+        "table": optimizer.table_task(
+            "Premium Steak Cuts", 
+            ["Ribeye Steak", "Rib Steak", "Porterhouse", "T-Bone"]
+        )
+    })
+    new_title = rewrites["title"]
+    comparison_table = rewrites["table"]
     print(f"   ✨ Optimized Title: {new_title}")
     
-    # Generate Comparison Table (Requested in Brief if multimedia_needed)
-    print(f"   📊 Generating Strategic Comparison Table...")
-    comparison_table = optimizer.generate_comparison_table(
-        "Premium Steak Cuts", 
-        ["Ribeye Steak", "Rib Steak", "Porterhouse", "T-Bone"]
-    )
-    
     # 6. STEP 3: Media Generation (Imagen 4 with Watermark)
     print("\n🎨 Generating Branded Visual Assets...")
     print(f"   📸 Creating Featured Image with 'Griddle King' Watermark...")
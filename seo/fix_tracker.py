@@ -6,6 +6,7 @@ Tracks which URLs have been fixed for which issues to avoid redundant audits.
 
 import json
 import os
+import threading
 from typing import Dict, List, Set
 from datetime import datetime
 from urllib.parse import urlparse
@@ -26,6 +27,8 @@ class SEOFixTracker:
         self.site_domain = parsed.netloc.replace('www.', '')
         self.state_file = f"{self.site_domain}_seo_fixes.json"
         self.fixes = self._load_fixes()
+        # Fixes may be recorded from several worker threads at once
+        self._lock = threading.Lock()
     
     def _load_fixes(self) -> Dict:
         """Load fix history from file."""
@@ -55,19 +58,20 @@ class SEOFixTracker:
             category: Issue category (e.g., 'onpage')
             success: Whether the fix was successful
         """
-        if url not in self.fixes:
-            self.fixes[url] = {}
-        
-        issue_key = f"{category}.{issue_type}"
-        if issue_key not in self.fixes[url]:
-            self.fixes[url][issue_key] = []
-        
-        self.fixes[url][issue_key].append({
-            "fixed_at": datetime.now().isoformat(),
-            "success": success
-        })
-        
-        self._save_fixes()
+        with self._lock:
+            if url not in self.fixes:
+                self.fixes[url] = {}
+            
+            issue_key = f"{category}.{issue_type}"
+            if issue_key not in self.fixes[url]:
+                self.fixes[url][issue_key] = []
+            
+            self.fixes[url][issue_key].append({
+                "fixed_at": datetime.now().isoformat(),
+                "success": success
+            })
+            
+            self._save_fixes()
     
     def is_fixed(self, url: str, issue_type: str, category: str) -> bool:
         """
@@ -127,17 +131,18 @@ class SEOFixTracker:
             issue_type: Optional - clear only this issue type
             category: Optional - clear only this category
         """
-        if url not in self.fixes:
-            return
-        
-        if issue_type and category:
-            issue_key = f"{category}.{issue_type}"
-            if issue_key in self.fixes[url]:
-                del self.fixes[url][issue_key]
-        else:
-            del self.fixes[url]
-        
-        self._save_fixes()
+        with self._lock:
+            if url not in self.fixes:
+                return
+            
+            if issue_type and category:
+                issue_key = f"{category}.{issue_type}"
+                if issue_key in self.fixes[url]:
+                    del self.fixes[url][issue_key]
+            else:
+                del self.fixes[url]
+            
+            self._save_fixes()
     
     def get_stats(self) -> Dict:
         """Get statistics about fixes."""
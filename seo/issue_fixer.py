@@ -27,6 +27,14 @@ except ImportError:
 class SEOIssueFixer:
     """Fixes SEO issues by updating WordPress content."""
     
+    # Issue types fix_issues_bulk() can merge into a single post update,
+    # mapped to the update_post() field each one sets
+    BULK_FIXABLE_ISSUES = {
+        'h1_presence': 'content',
+        'title_presence': 'meta_title',
+        'meta_description_presence': 'meta_description'
+    }
+    
     def __init__(
         self,
         site_url: str,
@@ -34,9 +42,11 @@ class SEOIssueFixer:
         wp_app_password: str,
         rate_limit_delay: float = 1.0,
         use_ai: bool = True,
-        safe_mode: bool = False
+        safe_mode: bool = False,
+        session: Optional[requests.Session] = None
     ):
         self.site_url = site_url.rstrip("/")
+        self.session = session or requests.Session()
         self.safe_mode = safe_mode
         self.rate_limit_delay = 5.0 if safe_mode else rate_limit_delay
         
@@ -44,7 +54,8 @@ class SEOIssueFixer:
             site_url=site_url,
             username=wp_username,
             application_password=wp_app_password,
-            rate_limit_delay=self.rate_limit_delay
+            rate_limit_delay=self.rate_limit_delay,
+            session=self.session
         )
         self.api_base = f"{self.site_url}/wp-json/wp/v2"
         self.auth = (wp_username, wp_app_password)
@@ -78,7 +89,7 @@ class SEOIssueFixer:
 
         for attempt in range(max_retries):
             try:
-                response = requests.request(method, endpoint, auth=self.auth, **kwargs)
+                response = self.session.request(method, endpoint, auth=self.auth, **kwargs)
                 
                 # Success
                 if response.ok:
@@ -285,6 +296,131 @@ class SEOIssueFixer:
         
         return results
     
+    def fix_issues_bulk(self, issues_by_url: Dict[str, List[str]], category: str = 'onpage') -> Dict:
+        """
+        Fix several issue types per URL with one WordPress update per post.
+        
+        The post is looked up and fetched once, the fixes for every issue type
+        in BULK_FIXABLE_ISSUES are merged into a single update_post() call, and
+        anything else falls back to its individual _fix_<issue_type> handler.
+        
+        Args:
+            issues_by_url: Mapping of URL -> issue types to fix on that URL
+            category: Issue category (e.g., 'onpage')
+            
+        Returns:
+            Dict with fixed_count, not_applicable_count, error_count and the
+            errors list, counted per (URL, issue type) like fix_issue()
+        """
+        results = {
+            "success": True,
+            "fixed_count": 0,
+            "not_applicable_count": 0,
+            "error_count": 0,
+            "errors": []
+        }
+        
+        for url, issue_types in issues_by_url.items():
+            try:
+                post_id, post_type = self._get_post_id_from_url(url)
+                if not post_id:
+                    if self._categorize_missing_post(url) == "unknown":
+                        results["error_count"] += len(issue_types)
+                        results["errors"].append({
+                            "url": url,
+                            "reason": "Could not find this page in WordPress",
+                            "icon": "❓"
+                        })
+                    else:
+                        results["not_applicable_count"] += len(issue_types)
+                    continue
+                
+                pending = []
+                for issue_type in issue_types:
+                    if self.fix_tracker.is_fixed(url, issue_type, category):
+                        results["fixed_count"] += 1  # Count as success for summary
+                    else:
+                        pending.append(issue_type)
+                if not pending:
+                    continue
+                
+                outcomes = {}  # issue_type -> fixed?
+                bulk = [t for t in pending if t in self.BULK_FIXABLE_ISSUES] if post_type in ('post', 'page') else []
+                if bulk:
+                    outcomes.update(self._apply_bulk_fixes(post_id, post_type, url, bulk))
+                
+                for issue_type in pending:
+                    if issue_type in outcomes:
+                        continue
+                    fix_method = getattr(self, f"_fix_{issue_type}", None)
+                    outcomes[issue_type] = bool(fix_method and fix_method(post_id, post_type, url))
+                
+                for issue_type, fixed in outcomes.items():
+                    if fixed:
+                        results["fixed_count"] += 1
+                    else:
+                        results["error_count"] += 1
+                        results["errors"].append({
+                            "url": url,
+                            "reason": f"Fix attempted but failed ({issue_type})",
+                            "icon": "❌"
+                        })
+                    self.fix_tracker.record_fix(url, issue_type, category, success=fixed)
+                
+                time.sleep(self.wp_publisher.rate_limit_delay)
+                
+            except Exception as e:
+                results["error_count"] += len(issue_types)
+                results["errors"].append({
+                    "url": url,
+                    "reason": str(e),
+                    "icon": "💥"
+                })
+        
+        results["success"] = results["error_count"] == 0
+        return results
+    
+    def _apply_bulk_fixes(self, post_id: int, post_type: str, url: str, issue_types: List[str]) -> Dict[str, bool]:
+        """Compute every requested fix from one fetch of the post and save them in one update."""
+        post_data = self._get_post_content(post_id, post_type, backup_before_fix=True, issue_type="+".join(issue_types))
+        if not post_data:
+            return {issue_type: False for issue_type in issue_types}
+        
+        title = post_data.get('title', {}).get('rendered', '')
+        content = post_data.get('content', {}).get('rendered', '')
+        outcomes = {}
+        update = {}
+        
+        if 'h1_presence' in issue_types:
+            content_raw = post_data.get('content', {}).get('raw', '') or content
+            if not title:
+                outcomes['h1_presence'] = False
+            elif BeautifulSoup(content_raw, 'html.parser').find('h1'):
+                outcomes['h1_presence'] = True  # Already has H1
+            else:
+                update['content'] = f'<h1>{title}</h1>\n\n' + content_raw
+        
+        if 'title_presence' in issue_types:
+            if not title:
+                outcomes['title_presence'] = False
+            else:
+                update['meta_title'] = self._generate_meta_title(title, content)
+        
+        if 'meta_description_presence' in issue_types:
+            update['meta_description'] = self._generate_meta_description(title, content)
+        
+        if update:
+            try:
+                success = self.wp_publisher.update_post(post_id=post_id, item_type=post_type, **update).success
+            except Exception as e:
+                print(f"Error applying bulk fixes for {url}: {e}")
+                success = False
+            for issue_type in issue_types:
+                if self.BULK_FIXABLE_ISSUES[issue_type] in update:
+                    outcomes[issue_type] = success
+        
+        return outcomes
+    
     def _categorize_missing_post(self, url: str) -> str:
         """Determine why a URL doesn't have a post ID."""
         url_lower = url.lower()
@@ -471,48 +607,7 @@ class SEOIssueFixer:
             if not title:
                 return False
             
-            # Try AI generation first if available
-            if self.ai_generator:
-                try:
-                    # Extract keywords from title/content
-                    soup = BeautifulSoup(content, 'html.parser')
-                    text_content = soup.get_text()[:500]  # First 500 chars for context
-                    
-                    # Generate SEO-optimized meta title
-                    prompt = f"""Generate an SEO-optimized meta title (50-60 characters) for this WordPress post.
-
-Post Title: {title}
-Content Preview: {text_content}
-
-Requirements:
-- 50-60 characters (optimal for search results)
-- Include main keyword from the title
-- Compelling and click-worthy
-- Different from the post title (optimized for SERP)
-
-Return ONLY the meta title, nothing else."""
-                    
-                    response = self.ai_generator.client.messages.create(
-                        model=self.ai_generator.model,
-                        max_tokens=100,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
-                    
-                    ai_title = response.content[0].text.strip()
-                    # Clean up and validate length
-                    ai_title = ai_title.replace('"', '').replace("'", '').strip()
-                    if 50 <= len(ai_title) <= 60:
-                        meta_title = ai_title
-                    else:
-                        # Fallback to truncation if AI result is wrong length
-                        meta_title = title[:60] if len(title) > 60 else title
-                except Exception as e:
-                    print(f"AI title generation failed, using fallback: {e}")
-                    # Fallback to simple truncation
-                    meta_title = title[:60] if len(title) > 60 else title
-            else:
-                # No AI - use simple truncation
-                meta_title = title[:60] if len(title) > 60 else title
+            meta_title = self._generate_meta_title(title, content)
             
             result = self.wp_publisher.update_post(
                 post_id=post_id,
@@ -535,15 +630,76 @@ Return ONLY the meta title, nothing else."""
             content = post_data.get('content', {}).get('rendered', '')
             title = post_data.get('title', {}).get('rendered', '')
             
-            # Try AI generation first if available
-            if self.ai_generator:
-                try:
-                    # Extract meaningful content
-                    soup = BeautifulSoup(content, 'html.parser')
-                    text_content = soup.get_text().strip()[:1000]  # More context for AI
-                    
-                    # Generate SEO-optimized meta description
-                    prompt = f"""Generate an SEO-optimized meta description (150-155 characters) for this WordPress post.
+            meta_desc = self._generate_meta_description(title, content)
+            
+            result = self.wp_publisher.update_post(
+                post_id=post_id,
+                meta_description=meta_desc,
+                item_type=post_type
+            )
+            return result.success
+            
+        except Exception as e:
+            print(f"Error fixing meta description for {url}: {e}")
+            return False
+    
+    def _generate_meta_title(self, title: str, content: str) -> str:
+        """Meta title for a post: AI-generated when available, else the truncated post title."""
+        # Try AI generation first if available
+        if self.ai_generator:
+            try:
+                # Extract keywords from title/content
+                soup = BeautifulSoup(content, 'html.parser')
+                text_content = soup.get_text()[:500]  # First 500 chars for context
+                
+                # Generate SEO-optimized meta title
+                prompt = f"""Generate an SEO-optimized meta title (50-60 characters) for this WordPress post.
+
+Post Title: {title}
+Content Preview: {text_content}
+
+Requirements:
+- 50-60 characters (optimal for search results)
+- Include main keyword from the title
+- Compelling and click-worthy
+- Different from the post title (optimized for SERP)
+
+Return ONLY the meta title, nothing else."""
+                
+                response = self.ai_generator.client.messages.create(
+                    model=self.ai_generator.model,
+                    max_tokens=100,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                
+                ai_title = response.content[0].text.strip()
+                # Clean up and validate length
+                ai_title = ai_title.replace('"', '').replace("'", '').strip()
+                if 50 <= len(ai_title) <= 60:
+                    meta_title = ai_title
+                else:
+                    # Fallback to truncation if AI result is wrong length
+                    meta_title = title[:60] if len(title) > 60 else title
+            except Exception as e:
+                print(f"AI title generation failed, using fallback: {e}")
+                # Fallback to simple truncation
+                meta_title = title[:60] if len(title) > 60 else title
+        else:
+            # No AI - use simple truncation
+            meta_title = title[:60] if len(title) > 60 else title
+        return meta_title
+
+    def _generate_meta_description(self, title: str, content: str) -> str:
+        """Meta description for a post: AI-generated when available, else extracted from content."""
+        # Try AI generation first if available
+        if self.ai_generator:
+            try:
+                # Extract meaningful content
+                soup = BeautifulSoup(content, 'html.parser')
+                text_content = soup.get_text().strip()[:1000]  # More context for AI
+                
+                # Generate SEO-optimized meta description
+                prompt = f"""Generate an SEO-optimized meta description (150-155 characters) for this WordPress post.
 
 Post Title: {title}
 Content: {text_content}
@@ -556,57 +712,47 @@ Requirements:
 - Ends with a call to action or benefit statement
 
 Return ONLY the meta description, nothing else."""
-                    
-                    response = self.ai_generator.client.messages.create(
-                        model=self.ai_generator.model,
-                        max_tokens=200,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
-                    
-                    ai_desc = response.content[0].text.strip()
-                    # Clean up
-                    ai_desc = ai_desc.replace('"', '').replace("'", '').strip()
-                    
-                    # Validate length
-                    if 120 <= len(ai_desc) <= 160:
-                        meta_desc = ai_desc
-                    else:
-                        # Adjust if slightly off
-                        if len(ai_desc) > 160:
-                            meta_desc = ai_desc[:157] + '...'
-                        else:
-                            # Too short - use fallback
-                            text_preview = soup.get_text().strip()[:160]
-                            meta_desc = text_preview[:157] + '...' if len(text_preview) > 157 else text_preview
-                except Exception as e:
-                    print(f"AI description generation failed, using fallback: {e}")
-                    # Fallback to content extraction
-                    soup = BeautifulSoup(content, 'html.parser')
-                    text_content = soup.get_text().strip()[:160]
-                    if text_content:
-                        meta_desc = text_content[:157] + '...' if len(text_content) > 157 else text_content
+                
+                response = self.ai_generator.client.messages.create(
+                    model=self.ai_generator.model,
+                    max_tokens=200,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                
+                ai_desc = response.content[0].text.strip()
+                # Clean up
+                ai_desc = ai_desc.replace('"', '').replace("'", '').strip()
+                
+                # Validate length
+                if 120 <= len(ai_desc) <= 160:
+                    meta_desc = ai_desc
+                else:
+                    # Adjust if slightly off
+                    if len(ai_desc) > 160:
+                        meta_desc = ai_desc[:157] + '...'
                     else:
-                        meta_desc = f"Learn about {title}"
-            else:
-                # No AI - use content extraction
+                        # Too short - use fallback
+                        text_preview = soup.get_text().strip()[:160]
+                        meta_desc = text_preview[:157] + '...' if len(text_preview) > 157 else text_preview
+            except Exception as e:
+                print(f"AI description generation failed, using fallback: {e}")
+                # Fallback to content extraction
                 soup = BeautifulSoup(content, 'html.parser')
                 text_content = soup.get_text().strip()[:160]
                 if text_content:
                     meta_desc = text_content[:157] + '...' if len(text_content) > 157 else text_content
                 else:
                     meta_desc = f"Learn about {title}"
-            
-            result = self.wp_publisher.update_post(
-                post_id=post_id,
-                meta_description=meta_desc,
-                item_type=post_type
-            )
-            return result.success
-            
-        except Exception as e:
-            print(f"Error fixing meta description for {url}: {e}")
-            return False
-    
+        else:
+            # No AI - use content extraction
+            soup = BeautifulSoup(content, 'html.parser')
+            text_content = soup.get_text().strip()[:160]
+            if text_content:
+                meta_desc = text_content[:157] + '...' if len(text_content) > 157 else text_content
+            else:
+                meta_desc = f"Learn about {title}"
+        return meta_desc
+
     def _fix_title_length(self, post_id: int, post_type: str, url: str) -> bool:
         """Fix title that is too long or too short (target: 50-60 chars)."""
         try:
@@ -970,7 +1116,7 @@ Return ONLY the alt text, nothing else."""
                     try:
                         # Fetch just enough to get headers/metadata if possible, but simplest is full fetch for now
                         headers = {'User-Agent': 'Mozilla/5.0'}
-                        response = requests.get(src, timeout=10, headers=headers)
+                        response = self.session.get(src, timeout=10, headers=headers)
                         if response.ok:
                             img_obj = Image.open(BytesIO(response.content))
                             width, height = img_obj.size
@@ -1401,7 +1547,7 @@ Return exactly 3 suggestions, one per line."""
 
                 # Check if link is broken
                 try:
-                    resp = requests.head(href, timeout=5, allow_redirects=True)
+                    resp = self.session.head(href, timeout=5, allow_redirects=True)
                     is_broken = resp.status_code >= 400
                 except:
                     # Can't reach - might be broken, be conservative
@@ -1450,7 +1596,7 @@ Return exactly 3 suggestions, one per line."""
 
                         # Try to find if it redirects somewhere
                         try:
-                            final_resp = requests.get(href, timeout=10, allow_redirects=True)
+                            final_resp = self.session.get(href, timeout=10, allow_redirects=True)
                             if final_resp.ok and final_resp.url != href:
                                 # It redirected to a working URL
                                 print(f"   ✓ Found redirect: {href} → {final_resp.url}")
@@ -1463,7 +1609,7 @@ Return exactly 3 suggestions, one per line."""
                         # Try archive.org as fallback
                         archive_url = f"https://web.archive.org/web/{href}"
                         try:
-                            archive_resp = requests.head(archive_url, timeout=5)
+                            archive_resp = self.session.head(archive_url, timeout=5)
                             if archive_resp.ok:
                                 print(f"   ✓ Using archive.org version")
                                 link['href'] = archive_url
@@ -1614,7 +1760,7 @@ Return exactly 3 suggestions, one per line."""
 
                 # Check if link is broken
                 try:
-                    resp = requests.head(href, timeout=5, allow_redirects=True)
+                    resp = self.session.head(href, timeout=5, allow_redirects=True)
                     is_broken = resp.status_code >= 400
                 except:
                     # Can't reach - might be broken, be conservative
@@ -1663,7 +1809,7 @@ Return exactly 3 suggestions, one per line."""
 
                         # Try to find if it redirects somewhere
                         try:
-                            final_resp = requests.get(href, timeout=10, allow_redirects=True)
+                            final_resp = self.session.get(href, timeout=10, allow_redirects=True)
                             if final_resp.ok and final_resp.url != href:
                                 # It redirected to a working URL
                                 print(f"   ✓ Found redirect: {href} → {final_resp.url}")
@@ -1676,7 +1822,7 @@ Return exactly 3 suggestions, one per line."""
                         # Try archive.org as fallback
                         archive_url = f"https://web.archive.org/web/{href}"
                         try:
-                            archive_resp = requests.head(archive_url, timeout=5)
+                            archive_resp = self.session.head(archive_url, timeout=5)
                             if archive_resp.ok:
                                 print(f"   ✓ Using archive.org version")
                                 link['href'] = archive_url
@@ -4,7 +4,7 @@ SEO Issue Grouper
 Groups and batches SEO issues from audit results for efficient fixing.
 """
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional, Set
 from collections import defaultdict
 
 
@@ -282,13 +282,18 @@ class IssueGrouper:
         return groups
     
     @staticmethod
-    def get_fixable_vs_manual(audit_json: dict) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    def get_fixable_vs_manual(
+        audit_json: dict,
+        only: Optional[Set[str]] = None
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
         """
         Separate issues into fixable (automated) vs manual.
         Filters out URLs that can't be edited (category pages, archives, etc.)
         
         Args:
             audit_json: Full audit result JSON
+            only: If given, only these check names are collected; every other
+                issue is skipped without being classified
             
         Returns:
             Tuple of (fixable_issues, manual_issues) dicts
@@ -302,18 +307,24 @@ class IssueGrouper:
             url = url_result.get("url", "")
             issues = url_result.get("issues", {})
             
-            # Skip non-editable URLs entirely for fixable issues
-            url_is_editable = is_editable_url(url, site_url)
+            # Skip non-editable URLs entirely for fixable issues. Worked out on
+            # first use, so URLs with nothing in scope never pay for it
+            url_is_editable = None
             
             for category, issue_list in issues.items():
                 for issue in issue_list:
                     check_name = issue.get("check_name", "")
+                    if only is not None and check_name not in only:
+                        continue
+                    
                     status = issue.get("status", "")
                     
                     if status not in ["critical", "warning"]:
                         continue
                     
                     if check_name in FIXABLE_ISSUES:
+                        if url_is_editable is None:
+                            url_is_editable = is_editable_url(url, site_url)
                         # Only add to fixable if URL can actually be edited
                         if url_is_editable:
                             fixable[check_name].append(url)
@@ -58,7 +58,8 @@ class TechnicalSEOAuditor:
         site_url: str,
         rate_limit_delay: float = 2.0,
         timeout: int = 30,
-        max_redirects: int = 5
+        max_redirects: int = 5,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize technical SEO auditor.
@@ -68,11 +69,13 @@ class TechnicalSEOAuditor:
             rate_limit_delay: Seconds to wait between requests
             timeout: Request timeout in seconds
             max_redirects: Maximum redirect hops to follow
+            session: HTTP session to reuse (keep-alive across audits); one is created if omitted
         """
         self.site_url = site_url.rstrip("/")
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
         self.max_redirects = max_redirects
+        self.session = session or requests.Session()
         self.parsed_site_url = urlparse(self.site_url)
         self.site_domain = self.parsed_site_url.netloc
         
@@ -193,13 +196,21 @@ class TechnicalSEOAuditor:
         # Generate summary
         summary = self._generate_summary(url_results)
 
+        serialized_urls = [self._serialize_url_result(r) for r in url_results]
+        # Expose the homepage row directly so site-wide checks don't have to scan "urls"
+        homepage = next(
+            (u for u in serialized_urls if u["url"].rstrip("/") == self.site_url),
+            None
+        )
+
         return {
             "site_url": self.site_url,
             "audit_date": datetime.now().isoformat(),
             "total_urls_checked": len(url_results),
             "summary": summary,
             "robots_txt_blocking": robots_blocking,  # Site-wide robots.txt analysis
-            "urls": [self._serialize_url_result(r) for r in url_results]
+            "homepage": homepage,
+            "urls": serialized_urls
         }
     
     def audit_url(self, url: str) -> URLAuditResult:
@@ -275,7 +286,7 @@ class TechnicalSEOAuditor:
                 "Cache-Control": "no-cache"  # For accurate TTFB measurement
             }
             
-            response = requests.get(
+            response = self.session.get(
                 url,
                 headers=headers,
                 timeout=self.timeout,
@@ -297,7 +308,7 @@ class TechnicalSEOAuditor:
         """Fetch and parse robots.txt."""
         try:
             robots_url = urljoin(self.site_url, "/robots.txt")
-            response = requests.get(robots_url, timeout=10)
+            response = self.session.get(robots_url, timeout=10)
             
             if response.status_code == 200:
                 self._robots_txt = response.text
@@ -526,7 +537,7 @@ class TechnicalSEOAuditor:
         # 5. WWW vs non-WWW (check redirect)
         www_url = url.replace('://', '://www.') if '://www.' not in url else url.replace('://www.', '://')
         try:
-            www_response = requests.head(www_url, timeout=5, allow_redirects=True)
+            www_response = self.session.head(www_url, timeout=5, allow_redirects=True)
             if www_response.url != url and www_response.status_code in [301, 302]:
                 results.append(AuditResult(
                     check_name="www_redirect",
@@ -965,13 +976,13 @@ class TechnicalSEOAuditor:
         # Check for broken links (sample first 10 external links)
         for ext_url, _ in external_links[:10]:
             try:
-                head_response = requests.head(ext_url, timeout=5, allow_redirects=True)
+                head_response = self.session.head(ext_url, timeout=5, allow_redirects=True)
                 if head_response.status_code >= 400:
                     broken_links.append(ext_url)
             except:
                 # Try GET if HEAD fails
                 try:
-                    get_response = requests.get(ext_url, timeout=5, stream=True, allow_redirects=True)
+                    get_response = self.session.get(ext_url, timeout=5, stream=True, allow_redirects=True)
                     if get_response.status_code >= 400:
                         broken_links.append(ext_url)
                     get_response.close()
@@ -1045,7 +1056,7 @@ class TechnicalSEOAuditor:
             img_src = img.get('src', '')
             if img_src.startswith('http'):
                 try:
-                    img_response = requests.head(img_src, timeout=5)
+                    img_response = self.session.head(img_src, timeout=5)
                     content_length = img_response.headers.get('Content-Length')
                     if content_length:
                         size_kb = int(content_length) / 1024
@@ -6,9 +6,20 @@ Command-line interface for technical SEO audits.
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # Saved audits can run to tens of MB; orjson parses the raw bytes at C speed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from seo.technical_auditor import TechnicalSEOAuditor
 from seo.report_generator import SEOReportGenerator
 
+# URLs handed to a single SEOIssueFixer.fix_issue() call
+FIX_CHUNK_SIZE = 20
+
 
 def main():
     """CLI entry point."""
@@ -81,6 +92,15 @@ def main():
         help="WordPress application password for fixing"
     )
 
+    parser.add_argument(
+        "--fix-workers",
+        type=int,
+        default=1,
+        help="URL chunks to fix concurrently against the site (default: 1). Each worker "
+             "paces itself with the fixer's per-URL delay, so N workers send about N times "
+             "the requests per second"
+    )
+
     parser.add_argument(
         "--audit-file",
         help="Load issues from existing audit JSON file instead of re-crawling"
@@ -92,14 +112,13 @@ def main():
     
     # Load or Run audit
     if args.audit_file:
-        import json
         import os
         if not os.path.exists(args.audit_file):
             print(f"❌ Audit file {args.audit_file} not found.")
             return
         print(f"📂 Loading audit from: {args.audit_file}")
-        with open(args.audit_file, 'r') as f:
-            audit_results = json.load(f)
+        with open(args.audit_file, 'rb') as f:
+            audit_results = json_loads(f.read())
     else:
         # Initialize auditor
         auditor = TechnicalSEOAuditor(
@@ -163,7 +182,9 @@ def main():
         print("FIX EXECUTION")
         print("=" * 80)
         
-        fixable, _ = IssueGrouper.get_fixable_vs_manual(audit_results)
+        # With --fix-type only those checks need classifying
+        only = set(args.fix_type) if args.fix_type else None
+        fixable, _ = IssueGrouper.get_fixable_vs_manual(audit_results, only=only)
         
         targets = args.fix_type if args.fix_type else fixable.keys()
         
@@ -183,28 +204,42 @@ def main():
                 
             print(f"🛠️ Fixing '{issue_type}' for {len(urls)} URLs...")
             
-            # Use batch fixing from IssueFixer if available, or loop
-            # Here we loop for better visibility as per batch script
-            import time
-            for url in urls:
-                print(f"  > Fixing: {url}")
+            # fix_issue takes a list of URLs, so hand it chunks and read the
+            # per-URL outcome back from its fixed/skipped/not_applicable/errors
+            # lists. Each chunk sleeps the fixer's rate_limit_delay per URL; with
+            # --fix-workers > 1 chunks run side by side and that pacing is per
+            # worker, not shared, so only raise it for sites that can take the load.
+            chunks = [urls[i:i + FIX_CHUNK_SIZE] for i in range(0, len(urls), FIX_CHUNK_SIZE)]
+
+            def fix_chunk(chunk):
                 try:
-                    result = fixer.fix_issue(
+                    return fixer.fix_issue(
                         issue_type=issue_type,
                         category='onpage', # Default assumption, fixer might handle others
-                        urls=[url]
+                        urls=chunk
                     )
-                    if result.get('fixed_count', 0) > 0:
-                        print(f"    ✅ Fixed!")
-                        total_fixed += 1
-                    else:
-                        error = result.get('error', 'Unknown reason')
-                        print(f"    ⚠️ Not fixed: {error}")
                 except Exception as e:
-                    print(f"    ❌ Error: {e}")
-                
-                # Rate limit safety
-                time.sleep(1.0)
+                    return e
+
+            with ThreadPoolExecutor(max_workers=max(1, args.fix_workers)) as pool:
+                for chunk, result in zip(chunks, pool.map(fix_chunk, chunks)):
+                    if isinstance(result, Exception):
+                        for url in chunk:
+                            print(f"  > Fixing: {url}")
+                            print(f"    ❌ Error: {result}")
+                        continue
+
+                    # Already-fixed URLs count as fixed, same as fix_issue's fixed_count
+                    done = {item['url'] for item in result.get('fixed', []) + result.get('skipped', [])}
+                    reasons = {item['url']: item.get('reason')
+                               for item in result.get('not_applicable', []) + result.get('errors', [])}
+                    for url in chunk:
+                        print(f"  > Fixing: {url}")
+                        if url in done:
+                            print(f"    ✅ Fixed!")
+                            total_fixed += 1
+                        else:
+                            print(f"    ⚠️ Not fixed: {reasons.get(url) or 'Unknown reason'}")
                 
         print(f"\n✅ Fix Execution Complete. Total fixed: {total_fixed}")
 
@@ -10,12 +10,18 @@ import sys
 from collections import defaultdict
 from typing import Dict, List
 
+try:
+    # orjson parses the raw bytes at C speed; its decode error subclasses json's
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 def load_audit(file_path: str = "audit.json") -> Dict:
     """Load audit results from JSON file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return json_loads(f.read())
     except FileNotFoundError:
         print(f"❌ Error: {file_path} not found")
         sys.exit(1)
@@ -16,6 +16,7 @@ PATTERNS = [
     "*_seo_report.txt",
     "*_seo_fixes.json",
     "automation_runs.json",
+    "automation_runs.jsonl",
     "mock_gsc_*.csv",
     "*.xlsx" # GSC exports
 ]
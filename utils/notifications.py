@@ -10,12 +10,15 @@ import os
 from typing import Dict, Optional
 
 class SEONotifier:
-    def __init__(self, webhook_url: Optional[str] = None):
+    def __init__(self, webhook_url: Optional[str] = None, session: Optional[requests.Session] = None):
         self.webhook_url = webhook_url or os.getenv("NOTIFIER_WEBHOOK_URL")
+        self.session = session or requests.Session()
 
-    def send_notification(self, title: str, message: str, color: str = "#667eea"):
-        """Send a formatted notification to the configured webhook."""
-        if not self.webhook_url:
+    def send_notification(self, title: str, message: str, color: str = "#667eea",
+                          webhook_url: Optional[str] = None):
+        """Send a formatted notification to webhook_url, or the configured webhook."""
+        webhook_url = webhook_url or self.webhook_url
+        if not webhook_url:
             print(f"⚠️ No webhook URL configured. Notification suppressed: {title}")
             return False
 
@@ -32,8 +35,8 @@ class SEONotifier:
         }
 
         try:
-            response = requests.post(
-                self.webhook_url,
+            response = self.session.post(
+                webhook_url,
                 data=json.dumps(payload),
                 headers={'Content-Type': 'application/json'},
                 timeout=10
@@ -43,7 +46,8 @@ class SEONotifier:
             print(f"❌ Failed to send notification: {e}")
             return False
 
-    def send_audit_summary(self, site_name: str, score: int, critical: int, warnings: int):
+    def send_audit_summary(self, site_name: str, score: int, critical: int, warnings: int,
+                           webhook_url: Optional[str] = None):
         """Specifically formatted notification for audit completion."""
         emoji = "🟢" if score > 80 else "🟡" if score > 50 else "🔴"
         title = f"{emoji} SEO Audit Complete: {site_name}"
@@ -54,9 +58,10 @@ class SEONotifier:
             f"View Details: {os.getenv('APP_URL', 'http://localhost:5001')}"
         )
         color = "#4caf50" if score > 80 else "#ff9800" if score > 50 else "#f44336"
-        return self.send_notification(title, message, color)
+        return self.send_notification(title, message, color, webhook_url=webhook_url)
 
-    def send_fix_summary(self, site_name: str, total_fixed: int, failures: int = 0):
+    def send_fix_summary(self, site_name: str, total_fixed: int, failures: int = 0,
+                         webhook_url: Optional[str] = None):
         """Specifically formatted notification for fix execution."""
         title = f"🔧 SEO Fixes Applied: {site_name}"
         message = (
@@ -64,9 +69,10 @@ class SEONotifier:
             f"❌ Failures: {failures}\n"
             f"The site should be healthier now!"
         )
-        return self.send_notification(title, message, "#667eea" if failures == 0 else "#ff9800")
+        return self.send_notification(title, message, "#667eea" if failures == 0 else "#ff9800",
+                                      webhook_url=webhook_url)
 
-    def send_urgent_alert(self, site_name: str, issues: list):
+    def send_urgent_alert(self, site_name: str, issues: list, webhook_url: Optional[str] = None):
         """High-priority alert for critical foundation failures."""
         title = f"🚨 URGENT: SEO Foundation Failure - {site_name}"
         issues_text = "\n".join([f"• {issue}" for issue in issues])
@@ -76,4 +82,4 @@ class SEONotifier:
             f"{issues_text}\n"
             f"Please check your site settings immediately."
         )
-        return self.send_notification(title, message, "#d32f2f")
+        return self.send_notification(title, message, "#d32f2f", webhook_url=webhook_url)
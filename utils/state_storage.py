@@ -11,6 +11,23 @@ from utils.error_handler import AppError, ErrorCategory
 
 logger = logging.getLogger(__name__)
 
+try:
+    # State is rewritten after every completed action; orjson encodes it in C straight to bytes
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_state(state: Dict) -> bytes:
+    if orjson is not None:
+        # Non-str keys are stringified, as json.dumps would
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(state, indent=2).encode()
+
+
+def _loads_state(data) -> Dict:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 class StateStorage:
     """Simplified state storage - single source of truth."""
@@ -82,8 +99,8 @@ class StateStorage:
             return self._create_empty_state(site_name)
         
         try:
-            with open(state_file, 'r') as f:
-                state = json.load(f)
+            with open(state_file, 'rb') as f:
+                state = _loads_state(f.read())
             logger.info(f"Loaded state from file for {site_name}")
             return state
         except (json.JSONDecodeError, IOError) as e:
@@ -102,8 +119,9 @@ class StateStorage:
         os.makedirs(os.path.dirname(state_file), exist_ok=True)
         
         try:
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            payload = _dumps_state(state)
+            with open(state_file, 'wb') as f:
+                f.write(payload)
             logger.info(f"Saved state to file for {site_name}")
         except IOError as e:
             raise AppError(
@@ -137,7 +155,7 @@ class StateStorage:
                 
                 if file_key in gist_data.get('files', {}):
                     state_content = gist_data['files'][file_key]['content']
-                    state = json.loads(state_content)
+                    state = _loads_state(state_content)
                     logger.info(f"Loaded state from Gist for {site_name}")
                     return state
             
@@ -167,7 +185,7 @@ class StateStorage:
         
         files = {
             f"{site_name}_state.json": {
-                "content": json.dumps(state, indent=2)
+                "content": _dumps_state(state).decode()
             }
         }
         
@@ -5,6 +5,8 @@ Enhanced WordPress publisher with full taxonomy support.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 from typing import Dict, List, Optional
 from dataclasses import dataclass
@@ -12,6 +14,30 @@ from datetime import datetime, timedelta
 import json
 
 
+def _pooled_session() -> requests.Session:
+    """Keep-alive session sized for a few concurrent actions against one WordPress host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # Connection-level retries only (e.g. a pooled keep-alive socket the server
+        # closed); HTTP error statuses are left to _make_request_with_retry and
+        # callers, which need the actual response rather than a RetryError
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=0,
+            status=0,
+            backoff_factor=0.3,
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 @dataclass
 class PublishResult:
     """Result of a publishing operation."""
@@ -35,12 +61,21 @@ class WordPressPublisher:
         site_url: str, 
         username: str, 
         application_password: str,
-        rate_limit_delay: float = 2.0
+        rate_limit_delay: float = 2.0,
+        session: Optional[requests.Session] = None
     ):
         self.site_url = site_url.rstrip("/")
         self.auth = (username, application_password)
+        # Reused for every REST call so requests share keep-alive connections.
+        # A caller-supplied session may serve other sites, so only ours carries our auth
+        if session is None:
+            session = _pooled_session()
+            session.auth = self.auth
+        self.session = session
         self.rate_limit_delay = rate_limit_delay
         self.api_base = f"{self.site_url}/wp-json/wp/v2"
+        # Whether /wp-json/batch/v1 accepted our requests; None until first tried
+        self._batch_supported: Optional[bool] = None
     
     def _rate_limit(self):
         """Enforce rate limiting between API calls."""
@@ -50,7 +85,7 @@ class WordPressPublisher:
         """Make HTTP request with retry logic for transient errors."""
         for attempt in range(max_retries):
             try:
-                response = requests.request(method, url, **kwargs)
+                response = self.session.request(method, url, **kwargs)
                 response.raise_for_status()
 
                 # Try to parse JSON - don't retry JSON errors as they're not transient
@@ -75,7 +110,7 @@ class WordPressPublisher:
         """Get category ID by name, creating it if it doesn't exist."""
         try:
             # Try to find existing category
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/categories",
                 auth=self.auth,
                 params={'search': category_name},
@@ -90,7 +125,7 @@ class WordPressPublisher:
                     return cat['id']
             
             # If not found, try to create it
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_base}/categories",
                 auth=self.auth,
                 json={'name': category_name},
@@ -120,7 +155,7 @@ class WordPressPublisher:
         """Get tag ID by name, creating it if it doesn't exist."""
         try:
             # Try to find existing tag
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/tags",
                 auth=self.auth,
                 params={'search': tag_name},
@@ -135,7 +170,7 @@ class WordPressPublisher:
                     return tag['id']
             
             # If not found, try to create it
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_base}/tags",
                 auth=self.auth,
                 json={'name': tag_name},
@@ -172,7 +207,7 @@ class WordPressPublisher:
             Dict with post data
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/posts/{post_id}",
                 auth=self.auth,
                 timeout=30
@@ -190,7 +225,7 @@ class WordPressPublisher:
         
         while True:
             try:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.api_base}/posts",
                     auth=self.auth,
                     params={'per_page': per_page, 'page': page},
@@ -218,7 +253,7 @@ class WordPressPublisher:
         slug = url.rstrip('/').split('/')[-1]
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/posts",
                 auth=self.auth,
                 params={'slug': slug},
@@ -241,7 +276,7 @@ class WordPressPublisher:
         slug = url.rstrip('/').split('/')[-1]
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/pages",
                 auth=self.auth,
                 params={'slug': slug},
@@ -265,7 +300,7 @@ class WordPressPublisher:
         
         # Try posts first (include all statuses to find scheduled/draft posts)
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/posts",
                 auth=self.auth,
                 params={'slug': slug, 'status': 'any'},
@@ -284,7 +319,7 @@ class WordPressPublisher:
         
         # Try pages
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/pages",
                 auth=self.auth,
                 params={'slug': slug},
@@ -484,7 +519,7 @@ class WordPressPublisher:
         """Delete a post (force=True permanently deletes, force=False moves to trash)."""
         
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f"{self.api_base}/posts/{post_id}",
                 auth=self.auth,
                 params={'force': force},
@@ -588,7 +623,7 @@ class WordPressPublisher:
             if alt_text:
                 data['alt_text'] = alt_text
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_base}/media",
                 auth=self.auth,
                 files=files,
@@ -614,7 +649,7 @@ class WordPressPublisher:
                     if description:
                         update_data['description'] = description
                     
-                    update_response = requests.post(
+                    update_response = self.session.post(
                         f"{self.api_base}/media/{media_id}",
                         auth=self.auth,
                         json=update_data,
@@ -800,78 +835,24 @@ class WordPressPublisher:
         """Create a 301 redirect (requires Redirection plugin)."""
         
         try:
-            from urllib.parse import urlparse
-            
-            # Validate target URL exists and is not empty
-            if not target_url or target_url.strip() == '':
-                return PublishResult(
-                    success=False,
-                    action="redirect",
-                    url=source_url,
-                    error="Target URL is empty"
-                )
-            
-            # Normalize URLs: ensure they have proper format
-            # If target_url doesn't start with http, it might be relative - make it absolute
-            if not target_url.startswith('http'):
-                # It's a relative path, prepend site URL
-                target_url = f"{self.site_url.rstrip('/')}/{target_url.lstrip('/')}"
-            
-            # Extract paths from URLs more robustly
-            # Parse URLs to extract paths
-            source_parsed = urlparse(source_url)
-            target_parsed = urlparse(target_url)
-            
-            # Get paths - ensure they start with /
-            source_path = source_parsed.path
-            if not source_path.startswith('/'):
-                source_path = '/' + source_path
-            
-            target_path = target_parsed.path
-            if not target_path.startswith('/'):
-                target_path = '/' + target_path
-            
-            # Normalize paths (remove trailing slashes except root)
-            source_path = source_path.rstrip('/') or '/'
-            target_path = target_path.rstrip('/') or '/'
-            
-            # Validate target path is not empty or root (unless that's intentional)
-            if not target_path or target_path == '/':
-                return PublishResult(
-                    success=False,
-                    action="redirect",
-                    url=source_url,
-                    error=f"Invalid target URL: {target_url} (extracted path is empty or root)"
-                )
-            
-            print(f"Creating redirect: {source_path} -> {target_path}")
-            print(f"  Source URL: {source_url}")
-            print(f"  Target URL: {target_url}")
-            
-            # Optional: Verify target page exists (warn but don't fail)
-            try:
-                # Try to find the target page/post to warn if it doesn't exist
-                # This uses the target_path, so we need to extract the slug
-                target_slug = target_path.strip('/').split('/')[-1]
-                if target_slug:
-                    target_post = self.find_post_by_url(target_url)
-                    if not target_post:
-                        print(f"  ⚠️  WARNING: Target URL '{target_url}' does not appear to exist on the site!")
-                        print(f"     The redirect will still be created, but users will be redirected to a 404 page.")
-            except Exception as e:
-                # Don't fail on verification - just log it
-                print(f"  ⚠️  Could not verify target URL exists: {e}")
-            
-            redirect_data = {
-                "url": source_path,
-                "match_type": "url",
-                "action_type": "url",
-                "action_data": {"url": target_path},
-                "action_code": 301,
-                "group_id": 1  # Default group
-            }
-            
-            response = requests.post(
+            prepared = self._prepare_redirect(source_url, target_url)
+        except Exception as e:
+            return PublishResult(
+                success=False,
+                action="redirect",
+                url=source_url,
+                error=f"Error creating redirect: {str(e)}"
+            )
+        return self._post_redirect(source_url, prepared)
+    
+    def _post_redirect(self, source_url: str, prepared) -> PublishResult:
+        """Send a _prepare_redirect() result to the Redirection plugin."""
+        if isinstance(prepared, PublishResult):
+            return prepared
+        redirect_data, source_path, target_path = prepared
+        
+        try:
+            response = self.session.post(
                 f"{self.site_url}/wp-json/redirection/v1/redirect",
                 auth=self.auth,
                 json=redirect_data,
@@ -919,6 +900,156 @@ class WordPressPublisher:
                 error=f"Error creating redirect: {str(e)}"
             )
     
+    def _prepare_redirect(self, source_url: str, target_url: str):
+        """
+        Validate and normalize a redirect for the Redirection plugin.
+        
+        Returns (redirect_data, source_path, target_path), or a failed
+        PublishResult if the target is unusable.
+        """
+        from urllib.parse import urlparse
+        
+        # Validate target URL exists and is not empty
+        if not target_url or target_url.strip() == '':
+            return PublishResult(
+                success=False,
+                action="redirect",
+                url=source_url,
+                error="Target URL is empty"
+            )
+        
+        # Normalize URLs: ensure they have proper format
+        # If target_url doesn't start with http, it might be relative - make it absolute
+        if not target_url.startswith('http'):
+            # It's a relative path, prepend site URL
+            target_url = f"{self.site_url.rstrip('/')}/{target_url.lstrip('/')}"
+        
+        # Extract paths from URLs more robustly
+        # Parse URLs to extract paths
+        source_parsed = urlparse(source_url)
+        target_parsed = urlparse(target_url)
+        
+        # Get paths - ensure they start with /
+        source_path = source_parsed.path
+        if not source_path.startswith('/'):
+            source_path = '/' + source_path
+        
+        target_path = target_parsed.path
+        if not target_path.startswith('/'):
+            target_path = '/' + target_path
+        
+        # Normalize paths (remove trailing slashes except root)
+        source_path = source_path.rstrip('/') or '/'
+        target_path = target_path.rstrip('/') or '/'
+        
+        # Validate target path is not empty or root (unless that's intentional)
+        if not target_path or target_path == '/':
+            return PublishResult(
+                success=False,
+                action="redirect",
+                url=source_url,
+                error=f"Invalid target URL: {target_url} (extracted path is empty or root)"
+            )
+        
+        print(f"Creating redirect: {source_path} -> {target_path}")
+        print(f"  Source URL: {source_url}")
+        print(f"  Target URL: {target_url}")
+        
+        # Optional: Verify target page exists (warn but don't fail)
+        try:
+            # Try to find the target page/post to warn if it doesn't exist
+            # This uses the target_path, so we need to extract the slug
+            target_slug = target_path.strip('/').split('/')[-1]
+            if target_slug:
+                target_post = self.find_post_by_url(target_url)
+                if not target_post:
+                    print(f"  ⚠️  WARNING: Target URL '{target_url}' does not appear to exist on the site!")
+                    print(f"     The redirect will still be created, but users will be redirected to a 404 page.")
+        except Exception as e:
+            # Don't fail on verification - just log it
+            print(f"  ⚠️  Could not verify target URL exists: {e}")
+        
+        redirect_data = {
+            "url": source_path,
+            "match_type": "url",
+            "action_type": "url",
+            "action_data": {"url": target_path},
+            "action_code": 301,
+            "group_id": 1  # Default group
+        }
+        return redirect_data, source_path, target_path
+    
+    def delete_and_redirect(
+        self,
+        post_id: int,
+        source_url: str,
+        target_url: str
+    ) -> PublishResult:
+        """
+        Delete a post and 301-redirect its URL in one round-trip where possible.
+        
+        Both writes go through the REST batch endpoint (WordPress 5.6+) with
+        "require-all-validate", so nothing is applied unless both routes accept
+        batching. Otherwise falls back to delete_post + create_301_redirect.
+        Returns the redirect's result, like calling the two in sequence.
+        """
+        prepared = None
+        if self._batch_supported is not False:
+            try:
+                prepared = self._prepare_redirect(source_url, target_url)
+                if isinstance(prepared, PublishResult):
+                    # Same as the sequential path: the post is deleted even if the redirect is invalid
+                    self.delete_post(post_id, force=True)
+                    return prepared
+                redirect_data, source_path, target_path = prepared
+                
+                response = self.session.post(
+                    f"{self.site_url}/wp-json/batch/v1",
+                    auth=self.auth,
+                    json={
+                        "validation": "require-all-validate",
+                        "requests": [
+                            {"method": "DELETE", "path": f"/wp/v2/posts/{post_id}?force=true"},
+                            {"method": "POST", "path": "/redirection/v1/redirect", "body": redirect_data}
+                        ]
+                    },
+                    timeout=30
+                )
+                batch = response.json() if response.status_code in (200, 207) else {}
+                responses = batch.get("responses", [])
+                
+                if batch.get("failed") != "validation" and len(responses) == 2:
+                    self._batch_supported = True
+                    self._rate_limit()
+                    redirect_response = responses[1]
+                    status = redirect_response.get("status", 0)
+                    if status in (200, 201):
+                        return PublishResult(
+                            success=True,
+                            action="redirect",
+                            url=f"{source_path} -> {target_path}"
+                        )
+                    body = redirect_response.get("body") or {}
+                    error_text = body.get("message", str(body)) if isinstance(body, dict) else str(body)
+                    return PublishResult(
+                        success=False,
+                        action="redirect",
+                        url=source_url,
+                        error=f"WordPress API error ({status}): {error_text}"
+                    )
+                
+                # Batch endpoint missing, or a route refused batching: nothing was applied
+                self._batch_supported = False
+            except Exception as e:
+                print(f"  ⚠️  Batch request failed, falling back to separate calls: {e}")
+                self._batch_supported = False
+        
+        self.delete_post(post_id, force=True)
+        if prepared is None:
+            return self.create_301_redirect(source_url, target_url)
+        # Reuse the validated payload instead of repeating the target lookup
+        return self._post_redirect(source_url, prepared)
+    
     def get_internal_link_suggestions(
         self, 
         keywords: List[str], 